@@ -0,0 +1,51 @@
+"""
+Compare validation of action parameters using the interpreted jsonschema validator against the compiled validator.
+
+Usage: python benchmarks/bench_compiled_schema.py
+"""
+import timeit
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from servey.action.util import get_schema_for_params
+from servey.validation.compiled_schema import compile_schema
+
+
+@dataclass
+class Node:
+    name: str
+    created_at: datetime
+    children: Optional[List["Node"]] = None
+
+
+def create_node(node: Node, limit: int = 10, tags: Optional[List[str]] = None) -> Node:
+    """Dummy function for generating a parameter schema"""
+
+
+def main(number: int = 5000):
+    schema = get_schema_for_params(create_node, set())
+    compiled = compile_schema(schema)
+    params = dict(
+        node=dict(
+            name="root",
+            created_at="2023-01-01T00:00:00+00:00",
+            children=[
+                dict(name=f"child_{i}", created_at="2023-01-02T00:00:00+00:00")
+                for i in range(5)
+            ],
+        ),
+        limit=20,
+        tags=["a", "b", "c"],
+    )
+    interpreted = timeit.timeit(lambda: list(schema.iter_errors(params)), number=number)
+    precompiled = timeit.timeit(
+        lambda: list(compiled.iter_errors(params)), number=number
+    )
+    print(f"interpreted: {interpreted / number * 1_000_000:.1f}us per call")
+    print(f"compiled:    {precompiled / number * 1_000_000:.1f}us per call")
+    print(f"speedup:     {interpreted / precompiled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
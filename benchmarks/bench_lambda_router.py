@@ -0,0 +1,72 @@
+"""
+Compare routing a lambda event to an action when event handlers are created for each event (As they were previously)
+against the shared per action handler table.
+
+Usage: python benchmarks/bench_lambda_router.py
+"""
+import timeit
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+from unittest.mock import patch
+
+from injecty import get_impls
+
+from servey.action.action import action
+from servey.finder.action_finder_abc import (
+    ActionFinderABC,
+    ActionRegistry,
+    get_action_by_name,
+)
+from servey.servey_aws.event_handler.event_handler_abc import create_event_handlers
+from servey.servey_aws.router.router_abc import find_routers
+from servey.trigger.web_trigger import WEB_GET
+
+
+@dataclass
+class Node:
+    name: str
+    created_at: datetime
+    children: Optional[List["Node"]] = None
+
+
+@action(triggers=(WEB_GET,))
+def get_node(name: str, limit: int = 10, tags: Optional[List[str]] = None) -> Node:
+    """Dummy action for routing"""
+    return Node(name=name, created_at=datetime(2023, 1, 1))
+
+
+def invoke_uncached(event):
+    # Equivalent to the previous behaviour, where injecty implementations were resolved and all event handlers were
+    # created for each event
+    get_impls(ActionFinderABC)
+    action_ = get_action_by_name(event["action_name"])
+    for handler in create_event_handlers(action_):
+        if handler.is_usable(event, None):
+            return handler.handle(event, None)
+
+
+def invoke(routers, event):
+    for router in routers:
+        handler = router.create_handler(event, None)
+        if handler:
+            return handler.handle(event, None)
+
+
+def main(number: int = 2000):
+    registry = ActionRegistry((get_node.__servey_action__,))
+    with patch(
+        "servey.finder.action_finder_abc.get_action_registry", return_value=registry
+    ):
+        routers = find_routers()
+        event = dict(action_name="get_node", params=dict(name="foo", tags=["a"]))
+        assert invoke_uncached(event) == invoke(routers, event)
+        uncached = timeit.timeit(lambda: invoke_uncached(event), number=number)
+        cached = timeit.timeit(lambda: invoke(routers, event), number=number)
+    print(f"uncached: {uncached / number * 1_000_000:.1f}us per event")
+    print(f"cached:   {cached / number * 1_000_000:.1f}us per event")
+    print(f"speedup:  {uncached / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import logging
+import os
 
 from injecty import InjectyContext
 from marshy.marshaller.marshaller_abc import MarshallerABC
@@ -19,6 +20,9 @@ def configure(context: InjectyContext):
 
     context.register_impl(MarshallerABC, ToSecondDatetimeMarshaller)
     configure_finders(context)
+    configure_executor(context)
+    configure_rate_limit(context)
+    configure_json_codec(context)
     configure_asyncio_invoker(context)
     configure_auth(context)
     configure_starlette(context)
@@ -40,6 +44,36 @@ def configure_finders(context: InjectyContext):
     context.register_impl(EventChannelFinderABC, ModuleEventChannelFinder)
 
 
+def configure_executor(context: InjectyContext):
+    from servey.executor.executor_abc import ExecutorABC
+    from servey.executor.thread_pool_executor import BoundedThreadPoolExecutor
+
+    context.register_impl(ExecutorABC, BoundedThreadPoolExecutor)
+
+
+def configure_rate_limit(context: InjectyContext):
+    from servey.rate_limit.rate_limit_store_abc import RateLimitStoreABC
+    from servey.rate_limit.memory_rate_limit_store import MemoryRateLimitStore
+    from servey.rate_limit.sqlite_rate_limit_store import SqliteRateLimitStore
+
+    context.register_impl(RateLimitStoreABC, MemoryRateLimitStore)
+    if os.environ.get("SERVEY_RATE_LIMIT_DB"):
+        context.register_impl(RateLimitStoreABC, SqliteRateLimitStore)
+
+
+def configure_json_codec(context: InjectyContext):
+    from servey.json_codec.json_codec_abc import JsonCodecABC
+    from servey.json_codec.stdlib_json_codec import StdlibJsonCodec
+
+    context.register_impl(JsonCodecABC, StdlibJsonCodec)
+    try:
+        from servey.json_codec.orjson_codec import OrjsonCodec
+
+        context.register_impl(JsonCodecABC, OrjsonCodec)
+    except ModuleNotFoundError as e:
+        raise_non_ignored(e)
+
+
 def configure_asyncio_invoker(context: InjectyContext):
     from servey.servey_thread.asyncio_background_invoker import (
         AsyncioBackgroundInvokerFactory,
@@ -84,6 +118,15 @@ def configure_starlette_action_endpoint_factory(context: InjectyContext):
     from servey.servey_starlette.action_endpoint.factory.caching_action_endpoint_factory import (
         CachingActionEndpointFactory,
     )
+    from servey.servey_starlette.action_endpoint.factory.coalescing_action_endpoint_factory import (
+        CoalescingActionEndpointFactory,
+    )
+    from servey.servey_starlette.action_endpoint.factory.concurrency_limiting_action_endpoint_factory import (
+        ConcurrencyLimitingActionEndpointFactory,
+    )
+    from servey.servey_starlette.action_endpoint.factory.rate_limiting_action_endpoint_factory import (
+        RateLimitingActionEndpointFactory,
+    )
     from servey.servey_starlette.action_endpoint.factory.self_action_endpoint_factory import (
         SelfActionEndpointFactory,
     )
@@ -94,6 +137,9 @@ def configure_starlette_action_endpoint_factory(context: InjectyContext):
             ActionEndpointFactory,
             AuthorizingActionEndpointFactory,
             CachingActionEndpointFactory,
+            CoalescingActionEndpointFactory,
+            ConcurrencyLimitingActionEndpointFactory,
+            RateLimitingActionEndpointFactory,
             SelfActionEndpointFactory,
         ],
     )
@@ -107,6 +153,9 @@ def configure_starlette_route_factory(context: InjectyContext):
     from servey.servey_starlette.route_factory.authenticator_route_factory import (
         AuthenticatorRouteFactory,
     )
+    from servey.servey_starlette.route_factory.batch_route_factory import (
+        BatchRouteFactory,
+    )
     from servey.servey_starlette.route_factory.openapi_route_factory import (
         OpenapiRouteFactory,
     )
@@ -129,6 +178,7 @@ def configure_starlette_route_factory(context: InjectyContext):
         [
             ActionRouteFactory,
             AuthenticatorRouteFactory,
+            BatchRouteFactory,
             OpenapiRouteFactory,
             EventChannelRouteFactory,
             AsyncapiRouteFactory,
@@ -146,59 +196,98 @@ def configure_starlette_middleware_factory(context: InjectyContext):
     from servey.servey_starlette.middleware.cors_middleware_factory import (
         CORSMiddlewareFactory,
     )
+    from servey.servey_starlette.middleware.compression_middleware_factory import (
+        CompressionMiddlewareFactory,
+    )
 
-    context.register_impl(MiddlewareFactoryABC, CORSMiddlewareFactory)
+    context.register_impls(
+        MiddlewareFactoryABC, [CORSMiddlewareFactory, CompressionMiddlewareFactory]
+    )
 
 
-# noinspection DuplicatedCode
 def configure_strawberry(context: InjectyContext):
     try:
-        from servey.servey_strawberry.handler_filter.handler_filter_abc import (
-            HandlerFilterABC,
-        )
-        from servey.servey_strawberry.handler_filter.authorization_handler_filter import (
+        configure_strawberry_handler_filters(context)
+        configure_strawberry_entity_factories(context)
+    except ModuleNotFoundError as e:
+        raise_non_ignored(e)
+
+
+# noinspection DuplicatedCode
+def configure_strawberry_handler_filters(context: InjectyContext):
+    from servey.servey_strawberry.handler_filter.handler_filter_abc import (
+        HandlerFilterABC,
+    )
+    from servey.servey_strawberry.handler_filter.authorization_handler_filter import (
+        AuthorizationHandlerFilter,
+    )
+    from servey.servey_strawberry.handler_filter.cache_control_handler_filter import (
+        CacheControlHandlerFilter,
+    )
+    from servey.servey_strawberry.handler_filter.coalescing_handler_filter import (
+        CoalescingHandlerFilter,
+    )
+    from servey.servey_strawberry.handler_filter.concurrency_limiting_handler_filter import (
+        ConcurrencyLimitingHandlerFilter,
+    )
+    from servey.servey_strawberry.handler_filter.executor_handler_filter import (
+        ExecutorHandlerFilter,
+    )
+    from servey.servey_strawberry.handler_filter.rate_limiting_handler_filter import (
+        RateLimitingHandlerFilter,
+    )
+    from servey.servey_strawberry.handler_filter.strawberry_type_handler_filter import (
+        StrawberryTypeHandlerFilter,
+    )
+    from servey.servey_strawberry.handler_filter.timeout_handler_filter import (
+        TimeoutHandlerFilter,
+    )
+
+    context.register_impls(
+        HandlerFilterABC,
+        [
             AuthorizationHandlerFilter,
-        )
-        from servey.servey_strawberry.handler_filter.strawberry_type_handler_filter import (
+            CacheControlHandlerFilter,
+            CoalescingHandlerFilter,
+            ConcurrencyLimitingHandlerFilter,
+            ExecutorHandlerFilter,
+            RateLimitingHandlerFilter,
             StrawberryTypeHandlerFilter,
-        )
+            TimeoutHandlerFilter,
+        ],
+    )
 
-        from servey.servey_strawberry.entity_factory.entity_factory_abc import (
-            EntityFactoryABC,
-        )
-        from servey.servey_strawberry.entity_factory.dataclass_factory import (
+
+def configure_strawberry_entity_factories(context: InjectyContext):
+    from servey.servey_strawberry.entity_factory.entity_factory_abc import (
+        EntityFactoryABC,
+    )
+    from servey.servey_strawberry.entity_factory.dataclass_factory import (
+        DataclassFactory,
+    )
+    from servey.servey_strawberry.entity_factory.enum_factory import (
+        EnumFactory,
+    )
+    from servey.servey_strawberry.entity_factory.forward_ref_factory import (
+        ForwardRefFactory,
+    )
+    from servey.servey_strawberry.entity_factory.generic_factory import (
+        GenericFactory,
+    )
+    from servey.servey_strawberry.entity_factory.no_op_factory import (
+        NoOpFactory,
+    )
+
+    context.register_impls(
+        EntityFactoryABC,
+        [
             DataclassFactory,
-        )
-        from servey.servey_strawberry.entity_factory.enum_factory import (
             EnumFactory,
-        )
-        from servey.servey_strawberry.entity_factory.forward_ref_factory import (
             ForwardRefFactory,
-        )
-        from servey.servey_strawberry.entity_factory.generic_factory import (
             GenericFactory,
-        )
-        from servey.servey_strawberry.entity_factory.no_op_factory import (
             NoOpFactory,
-        )
-
-        context.register_impls(
-            HandlerFilterABC, [AuthorizationHandlerFilter, StrawberryTypeHandlerFilter]
-        )
-
-        context.register_impls(
-            EntityFactoryABC,
-            [
-                DataclassFactory,
-                EnumFactory,
-                ForwardRefFactory,
-                GenericFactory,
-                NoOpFactory,
-            ],
-        )
-
-    except ModuleNotFoundError as e:
-        raise_non_ignored(e)
+        ],
+    )
 
 
 def configure_strawberry_starlette(context: InjectyContext):
@@ -415,6 +504,7 @@ _IGNORABLE_MISSING_MODULE_NAMES = {
     "celery",
     "requests",
     "jinja2",
+    "orjson",
     "ruamel",
     "ruamel.yaml",
     "boto3",
@@ -4,7 +4,6 @@ local_schedule_mount for actions.
 """
 
 import argparse
-import json
 import logging
 import os
 
@@ -52,9 +51,40 @@ def generate_openapi_schema():
     )
 
     factory = OpenapiRouteFactory()
-    schema = factory.openapi_schema()
     output_file = os.environ.get("OUTPUT_FILE", "openapi.json")
-    json.dump(schema, output_file)
+    # The same bytes served by the openapi endpoint
+    with open(output_file, "wb") as writer:
+        writer.write(factory.get_document().content)
+
+
+def generate_asyncapi_schema():
+    from servey.servey_starlette.route_factory.asyncapi_route_factory import (
+        AsyncapiRouteFactory,
+    )
+
+    factory = AsyncapiRouteFactory()
+    output_file = os.environ.get("OUTPUT_FILE", "asyncapi.json")
+    with open(output_file, "wb") as writer:
+        writer.write(factory.get_document().content)
+
+
+def generate_manifest():
+    from servey.finder.manifest import build_manifest, write_manifest
+
+    output_file = os.environ.get("OUTPUT_FILE", "servey_manifest.json")
+    write_manifest(build_manifest(), output_file)
+
+
+def generate_startup_profile():
+    from servey.json_codec.json_codec_abc import get_default_json_codec
+    from servey.util.startup_profiler import StartupProfiler
+
+    profiler = StartupProfiler()
+    profiler.profile()
+    print(profiler.to_table())
+    output_file = os.environ.get("OUTPUT_FILE", "startup_profile.json")
+    with open(output_file, "wb") as writer:
+        writer.write(get_default_json_codec().dumps(profiler.to_json()))
 
 
 def generate_graphql_schema():
@@ -75,6 +105,12 @@ def main():
         sls_main()
     elif args.run == "openapi":
         generate_openapi_schema()
+    elif args.run == "asyncapi":
+        generate_asyncapi_schema()
+    elif args.run == "manifest":
+        generate_manifest()
+    elif args.run == "startup-profile":
+        generate_startup_profile()
     elif args.run == "graphql-schema":
         generate_graphql_schema()
     elif args.run == "action":
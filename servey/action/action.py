@@ -2,8 +2,11 @@ from dataclasses import dataclass
 from typing import Optional, Callable, Tuple, Union
 
 from servey.action.batch_invoker import BatchInvoker
+from servey.action.concurrency_limit import ConcurrencyLimit
 from servey.action.example import Example
 from servey.cache_control.cache_control_abc import CacheControlABC
+from servey.rate_limit.rate_limit import RateLimit
+from servey.executor.executor_abc import ExecutorABC
 from servey.security.access_control.access_control_abc import (
     AccessControlABC,
 )
@@ -29,6 +32,12 @@ class Action:
     examples: Optional[Tuple[Example, ...]] = None
     cache_control: Optional[CacheControlABC] = None
     batch_invoker: Optional[BatchInvoker] = None
+    # Executor for the action - None implies the default executor for the environment
+    executor: Optional[ExecutorABC] = None
+    # Whether identical concurrent invocations may share a single execution (Only appropriate for reads)
+    coalesce: bool = False
+    concurrency_limit: Optional[ConcurrencyLimit] = None
+    rate_limit: Optional[RateLimit] = None
 
 
 # pylint: disable=R0913
@@ -42,6 +51,10 @@ def action(
     batch_invoker: Optional[BatchInvoker] = None,
     name: Optional[str] = None,
     description: Optional[str] = None,
+    executor: Optional[ExecutorABC] = None,
+    coalesce: bool = Action.coalesce,
+    concurrency_limit: Optional[ConcurrencyLimit] = None,
+    rate_limit: Optional[RateLimit] = None,
 ):
     """
     Decorator for actions, which may be a function or a class with a designated method_name
@@ -70,6 +83,10 @@ def action(
             examples=examples,
             cache_control=cache_control,
             batch_invoker=batch_invoker,
+            executor=executor,
+            coalesce=coalesce,
+            concurrency_limit=concurrency_limit,
+            rate_limit=rate_limit,
         )
 
     return wrapper_ if fn is None else wrapper_(fn)
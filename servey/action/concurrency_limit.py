@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ConcurrencyLimit:
+    """
+    Bounds the number of concurrent executions of an action. Once max_in_flight executions are running, up to
+    max_queued further invocations wait (For at most queue_timeout seconds) for a slot. Anything beyond that is
+    rejected immediately with the status code given, and a Retry-After header.
+    """
+
+    max_in_flight: int
+    max_queued: int = 0
+    queue_timeout: float = 1
+    status_code: int = 503
+    retry_after: int = 1
@@ -1,6 +1,8 @@
+import collections.abc
 import inspect
 import os
-from typing import Callable, Optional, Set
+import typing
+from typing import Callable, Optional, Set, Type
 
 from marshy import get_default_marshy_context, MarshyContext
 from marshy.marshaller.marshaller_abc import MarshallerABC
@@ -59,6 +61,26 @@ def get_marshaller_for_params(
     return marshaller
 
 
+_STREAM_ORIGINS = (
+    collections.abc.Iterator,
+    collections.abc.Generator,
+    collections.abc.AsyncIterator,
+    collections.abc.AsyncGenerator,
+)
+
+
+def get_stream_item_type(result_type: Type) -> Optional[Type]:
+    """
+    Get the item type if the result type given is an iterator / generator (sync or async) which should be
+    streamed rather than materialized in full, or None otherwise.
+    """
+    if typing.get_origin(result_type) in _STREAM_ORIGINS:
+        args = typing.get_args(result_type)
+        if args:
+            return args[0]
+    return None
+
+
 def _remap_references(to_path: str, schema: ExternalType) -> ExternalType:
     if isinstance(schema, dict):
         ref = schema.get("$ref")
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional
 
 from marshy.types import ExternalItemType
 
@@ -13,3 +14,18 @@ class CacheControlABC(ABC):
     @abstractmethod
     def get_cache_header_from_content(self, content: bytes) -> CacheHeader:
         """Get the cache header for the content given"""
+
+    def supports_cache_header_for_params(self) -> bool:
+        """Determine whether get_cache_header_for_params may return a cache header"""
+        return False
+
+    # pylint: disable=W0613
+    def get_cache_header_for_params(
+        self, kwargs: Dict[str, Any]
+    ) -> Optional[CacheHeader]:
+        """
+        Get a cache header containing an etag / updated_at for the parameters to an action without actually
+        invoking it, if this can be done cheaply. This allows responding to conditional requests without
+        building the full result. The default implementation returns None.
+        """
+        return None
@@ -1,6 +1,7 @@
+import dataclasses
 from dataclasses import dataclass
 from datetime import datetime
-from email.utils import formatdate
+from email.utils import formatdate, parsedate_to_datetime
 from typing import Optional, Iterator
 
 from schemey.util import filter_none
@@ -34,6 +35,40 @@ class CacheHeader:
             }
         )
 
+    def get_validator_http_headers(self):
+        """Get only the headers a client uses to validate its copy of a resource"""
+        return filter_none(
+            {
+                "ETag": self.etag,
+                "Last-Modified": (
+                    None
+                    if self.updated_at is None
+                    else formatdate(self.updated_at.timestamp(), usegmt=True)
+                ),
+            }
+        )
+
+    def is_not_modified(
+        self, if_none_match: Optional[str], if_modified_since: Optional[str]
+    ) -> bool:
+        """Determine whether a client sending the conditional headers given has a current copy"""
+        if if_none_match and self.etag:
+            return self.etag == if_none_match
+        if if_modified_since and self.updated_at:
+            if_modified_since_date = parsedate_to_datetime(if_modified_since)
+            return if_modified_since_date.timestamp() >= self.updated_at.timestamp()
+        return False
+
+    def with_validators(self, validators: Optional["CacheHeader"]) -> "CacheHeader":
+        """Get a copy of this header using the etag / updated_at from the validators given, if any"""
+        if not validators:
+            return self
+        return dataclasses.replace(
+            self,
+            etag=validators.etag or self.etag,
+            updated_at=validators.updated_at or self.updated_at,
+        )
+
     def get_cache_control_str(self):
         directives = ["private" if self.private else "public"]
         if self.expire_at is not None:
@@ -50,8 +85,8 @@ class CacheHeader:
         keys = [self.etag]
         updated_at = self.updated_at
         expire_at = self.expire_at
-        private = True
-        must_revalidate = False
+        private = self.private
+        must_revalidate = self.must_revalidate
         for sub_header in cache_headers:
             keys.append(sub_header.etag)
             if updated_at is not None:
@@ -60,7 +95,7 @@ class CacheHeader:
             if expire_at is not None:
                 if sub_header.expire_at is None or sub_header.expire_at < expire_at:
                     expire_at = sub_header.expire_at
-            private &= sub_header.private
+            private |= sub_header.private
             must_revalidate |= sub_header.must_revalidate
         cache_key = secure_hash(keys)
         return CacheHeader(cache_key, updated_at, expire_at, private, must_revalidate)
@@ -1,6 +1,6 @@
-import json
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Dict, Any, Optional
 
 from marshy import get_default_marshy_context
 from marshy.marshaller.marshaller_abc import MarshallerABC
@@ -9,6 +9,7 @@ from marshy.types import ExternalItemType
 from servey.cache_control.cache_control_abc import CacheControlABC
 from servey.cache_control.cache_header import CacheHeader
 from servey.cache_control.secure_hash_cache_control import SecureHashCacheControl
+from servey.json_codec.json_codec_abc import get_default_json_codec
 
 
 @dataclass(frozen=True)
@@ -31,5 +32,13 @@ class TimestampCacheControl(CacheControlABC):
         )
 
     def get_cache_header_from_content(self, content: bytes) -> CacheHeader:
-        content_json = json.loads(content)
+        content_json = get_default_json_codec().loads(content)
         return self.get_cache_header(content_json)
+
+    def supports_cache_header_for_params(self) -> bool:
+        return self.cache_control.supports_cache_header_for_params()
+
+    def get_cache_header_for_params(
+        self, kwargs: Dict[str, Any]
+    ) -> Optional[CacheHeader]:
+        return self.cache_control.get_cache_header_for_params(kwargs)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from time import time
+from typing import Dict, Any, Optional
 
 from marshy.types import ExternalItemType
 
@@ -23,6 +24,14 @@ class TtlCacheControl(CacheControlABC):
         cache_header = self.cache_control.get_cache_header_from_content(content)
         return self._wrap_cache_header(cache_header)
 
+    def supports_cache_header_for_params(self) -> bool:
+        return self.cache_control.supports_cache_header_for_params()
+
+    def get_cache_header_for_params(
+        self, kwargs: Dict[str, Any]
+    ) -> Optional[CacheHeader]:
+        return self.cache_control.get_cache_header_for_params(kwargs)
+
     def _wrap_cache_header(self, cache_header: CacheHeader):
         expire_at = datetime.fromtimestamp(int(time()) + self.ttl)
         return CacheHeader(
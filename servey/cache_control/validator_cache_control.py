@@ -0,0 +1,58 @@
+import inspect
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Union, Optional, Dict, Any, FrozenSet
+
+from marshy.types import ExternalItemType
+
+from servey.cache_control.cache_control_abc import CacheControlABC
+from servey.cache_control.cache_header import CacheHeader
+from servey.cache_control.secure_hash_cache_control import SecureHashCacheControl
+
+Validator = Callable[..., Union[str, datetime, CacheHeader, None]]
+
+
+@dataclass(frozen=True)
+class ValidatorCacheControl(CacheControlABC):
+    """
+    Cache control with a cheap validator function, which is given the same parameters as the action and returns
+    a version string (Used as the etag), an updated_at datetime, or None if unknown. This allows conditional
+    requests to be answered with a 304 without invoking the action itself. Versions only need to be unique for
+    a single set of parameters (e.g.: a row version for the id in the params).
+    """
+
+    validator: Validator
+    cache_control: CacheControlABC = SecureHashCacheControl()
+    # Names of parameters accepted by the validator - None implies all
+    validator_param_names: Optional[FrozenSet[str]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        params = inspect.signature(self.validator).parameters.values()
+        names = None
+        if not any(p.kind == inspect.Parameter.VAR_KEYWORD for p in params):
+            names = frozenset(p.name for p in params)
+        object.__setattr__(self, "validator_param_names", names)
+
+    def get_cache_header(self, item: ExternalItemType) -> CacheHeader:
+        return self.cache_control.get_cache_header(item)
+
+    def get_cache_header_from_content(self, content: bytes) -> CacheHeader:
+        return self.cache_control.get_cache_header_from_content(content)
+
+    def supports_cache_header_for_params(self) -> bool:
+        return True
+
+    def get_cache_header_for_params(
+        self, kwargs: Dict[str, Any]
+    ) -> Optional[CacheHeader]:
+        names = self.validator_param_names
+        if names is not None:
+            kwargs = {k: v for k, v in kwargs.items() if k in names}
+        validation = self.validator(**kwargs)
+        if validation is None or isinstance(validation, CacheHeader):
+            return validation
+        if isinstance(validation, datetime):
+            return CacheHeader(updated_at=validation)
+        return CacheHeader(etag=str(validation))
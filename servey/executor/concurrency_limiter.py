@@ -0,0 +1,106 @@
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Deque, Dict, Optional
+
+from servey.action.action import Action
+from servey.action.concurrency_limit import ConcurrencyLimit
+from servey.errors import ServeyError
+
+
+class ConcurrencyLimitError(ServeyError):
+    def __init__(self, action_name: str, limit: ConcurrencyLimit):
+        super().__init__(f"overloaded:{action_name}")
+        self.action_name = action_name
+        self.limit = limit
+
+
+@dataclass
+class ConcurrencyLimiter:
+    """
+    Enforces a concurrency limit for an action on the event loop. Slots are handed directly to the longest waiting
+    invocation when released, so queued invocations are served in order.
+    """
+
+    action_name: str
+    limit: ConcurrencyLimit
+    in_flight: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    _waiters: Deque[asyncio.Future] = field(
+        default_factory=deque, init=False, repr=False, compare=False
+    )
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self):
+        if self.in_flight < self.limit.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            return
+        if len(self._waiters) >= self.limit.max_queued:
+            self.rejected += 1
+            raise ConcurrencyLimitError(self.action_name, self.limit)
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            # On success, the slot was transferred from the releasing invocation, so in_flight is unchanged
+            await asyncio.wait_for(future, self.limit.queue_timeout)
+        except asyncio.TimeoutError as e:
+            self._remove_waiter(future)
+            self.timed_out += 1
+            self.rejected += 1
+            raise ConcurrencyLimitError(self.action_name, self.limit) from e
+        except BaseException:
+            self._remove_waiter(future)
+            if future.done() and not future.cancelled():
+                self.release()  # Cancelled after being handed a slot
+            raise
+
+    def release(self):
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+    @asynccontextmanager
+    async def limit_concurrency(self):
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _remove_waiter(self, future: asyncio.Future):
+        try:
+            self._waiters.remove(future)
+        except ValueError:
+            pass
+
+
+_limiters: Dict[str, ConcurrencyLimiter] = {}
+_lock = Lock()
+
+
+def get_concurrency_limiter(action: Action) -> Optional[ConcurrencyLimiter]:
+    """Get the limiter for the action given, shared between all transports, or None if it is not limited"""
+    if not action.concurrency_limit:
+        return None
+    limiter = _limiters.get(action.name)
+    if limiter is None or limiter.limit != action.concurrency_limit:
+        with _lock:
+            limiter = _limiters.get(action.name)
+            if limiter is None or limiter.limit != action.concurrency_limit:
+                limiter = ConcurrencyLimiter(action.name, action.concurrency_limit)
+                _limiters[action.name] = limiter
+    return limiter
+
+
+def get_concurrency_limiters() -> Dict[str, ConcurrencyLimiter]:
+    """Get all limiters by action name, for monitoring queue depth and rejections"""
+    return dict(_limiters)
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Any
+
+from injecty import get_new_default_instance
+
+
+class ExecutorABC(ABC):
+    """
+    An executor determines where the function for an action is actually run - inline on the event loop, or
+    offloaded to a thread so that slow synchronous functions do not block other requests.
+    """
+
+    priority: int = 100
+
+    @abstractmethod
+    async def execute(self, fn: Callable, kwargs: Dict[str, Any]) -> Any:
+        """Execute the function given with the kwargs given, awaiting the result if required"""
+
+
+_default_executor = None
+
+
+# pylint: disable=W0603
+def get_default_executor() -> ExecutorABC:
+    global _default_executor
+    if not _default_executor:
+        _default_executor = get_new_default_instance(ExecutorABC)
+    return _default_executor
@@ -0,0 +1,20 @@
+from typing import Callable, Dict, Any, Awaitable
+
+from servey.executor.executor_abc import ExecutorABC
+from servey.util.singleton_abc import SingletonABC
+
+
+class InlineExecutor(SingletonABC, ExecutorABC):
+    """
+    Executor which runs functions directly on the event loop. Suitable for async functions and for sync
+    functions which are so cheap that handing them off to a thread would cost more than running them.
+    """
+
+    async def execute(self, fn: Callable, kwargs: Dict[str, Any]) -> Any:
+        result = fn(**kwargs)
+        if isinstance(result, Awaitable):
+            result = await result
+        return result
+
+
+INLINE = InlineExecutor()
@@ -0,0 +1,90 @@
+import asyncio
+import contextvars
+import inspect
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from threading import Lock
+from typing import Callable, Dict, Any, Awaitable, Optional
+
+from servey.executor.executor_abc import ExecutorABC
+
+
+def _default_max_workers() -> int:
+    return int(os.environ.get("SERVEY_EXECUTOR_MAX_WORKERS") or "32")
+
+
+@dataclass
+class BoundedThreadPoolExecutor(ExecutorABC):
+    """
+    Executor which runs synchronous functions on a bounded pool of threads, so that they do not block the event
+    loop. Coroutine functions are still awaited directly on the event loop. The number of threads may be specified
+    using the SERVEY_EXECUTOR_MAX_WORKERS environment variable.
+    """
+
+    max_workers: int = field(default_factory=_default_max_workers)
+    thread_name_prefix: str = "servey"
+    active_count: int = field(default=0, init=False)
+    queue_depth: int = field(default=0, init=False)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+    _pool: Optional[ThreadPoolExecutor] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        pool = self._pool
+        if pool is None:
+            with self._lock:
+                pool = self._pool
+                if pool is None:
+                    pool = self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=self.thread_name_prefix,
+                    )
+        return pool
+
+    async def execute(self, fn: Callable, kwargs: Dict[str, Any]) -> Any:
+        if inspect.iscoroutinefunction(fn):
+            return await fn(**kwargs)
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        state = {}
+        with self._lock:
+            self.queue_depth += 1
+        try:
+            result = await loop.run_in_executor(
+                self.pool, partial(context.run, self._run, fn, kwargs, state)
+            )
+        except asyncio.CancelledError:
+            # (e.g.: Due to a timeout) If not yet started, the call is dropped so the slot goes to other work
+            with self._lock:
+                if not state.get("started"):
+                    state["cancelled"] = True
+                    self.queue_depth -= 1
+            raise
+        if isinstance(result, Awaitable):
+            # Sync wrappers around coroutine functions return an awaitable which must be run on the loop
+            result = await result
+        return result
+
+    def _run(self, fn: Callable, kwargs: Dict[str, Any], state: Dict[str, bool]) -> Any:
+        with self._lock:
+            if state.get("cancelled"):
+                return None
+            state["started"] = True
+            self.queue_depth -= 1
+            self.active_count += 1
+        try:
+            return fn(**kwargs)
+        finally:
+            with self._lock:
+                self.active_count -= 1
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            pool = self._pool
+            self._pool = None
+        if pool:
+            pool.shutdown(wait=wait)
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from threading import Lock, Thread
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from servey.errors import ServeyError
+
+LOGGER = logging.getLogger(__name__)
+T = TypeVar("T")
+
+
+class ActionTimeoutError(ServeyError):
+    def __init__(self, action_name: str, timeout: float):
+        super().__init__(f"timeout:{action_name}:{timeout}")
+        self.action_name = action_name
+        self.timeout = timeout
+
+
+@dataclass
+class TimeoutStats:
+    """Counts of timed out invocations by action name"""
+
+    timeouts: Dict[str, int] = field(default_factory=dict)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+
+    def increment(self, action_name: str):
+        with self._lock:
+            self.timeouts[action_name] = self.timeouts.get(action_name, 0) + 1
+
+
+_timeout_stats = TimeoutStats()
+
+
+def get_timeout_stats() -> TimeoutStats:
+    return _timeout_stats
+
+
+def _timed_out(action_name: str, timeout: float) -> ActionTimeoutError:
+    LOGGER.warning("action_timeout:%s:%s", action_name, timeout)
+    _timeout_stats.increment(action_name)
+    return ActionTimeoutError(action_name, timeout)
+
+
+async def run_with_timeout(
+    awaitable: Awaitable[T], timeout: Optional[float], action_name: str
+) -> T:
+    """
+    Await the awaitable given, raising an ActionTimeoutError if it does not complete within the timeout. Coroutines
+    are cancelled at the deadline. Functions already running in a thread pool cannot be interrupted, so they are
+    abandoned - the result is discarded when they finish.
+    """
+    if not timeout:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError as e:
+        raise _timed_out(action_name, timeout) from e
+
+
+def call_with_timeout(
+    fn: Callable[[], T], timeout: Optional[float], action_name: str
+) -> T:
+    """
+    Call the function given from synchronous code, raising an ActionTimeoutError if it does not complete within the
+    timeout. The function is run in a daemon thread, which is abandoned at the deadline.
+    """
+    if not timeout:
+        return fn()
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = fn()
+        except BaseException as e:  # pylint: disable=W0718
+            outcome["error"] = e
+
+    thread = Thread(target=target, name=f"servey-{action_name}", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise _timed_out(action_name, timeout)
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
@@ -1,9 +1,13 @@
+import os
 from abc import abstractmethod, ABC
-from typing import Iterator, Type, Tuple, TypeVar
-
-from injecty import get_impls
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Iterator, Type, Tuple, TypeVar, Dict, Optional, Hashable
 
 from servey.action.action import Action
+from servey.finder.manifest import get_manifest, load_action
+from servey.util import get_servey_main
+from servey.util.cached_impls import get_cached_impls
 
 T = TypeVar("T")
 
@@ -16,17 +20,101 @@ class ActionFinderABC(ABC):
         """Find all available actions"""
 
 
+@dataclass
+class ActionRegistry:
+    """
+    Index of the actions available, by name, module and trigger type. Finding actions involves walking and importing
+    modules, so this is built once per process and shared.
+    """
+
+    actions: Tuple[Action, ...]
+    key: Optional[Hashable] = None
+    by_name: Dict[str, Action] = field(init=False)
+    by_module: Dict[str, Tuple[Action, ...]] = field(init=False)
+    _by_trigger_type: Dict[Type, Tuple[Tuple[Action, object], ...]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        by_name = {}
+        by_module = {}
+        for action in self.actions:
+            # Where names clash, the first action found takes precedence
+            by_name.setdefault(action.name, action)
+            module = getattr(action.fn, "__module__", None)
+            by_module[module] = by_module.get(module, ()) + (action,)
+        self.by_name = by_name
+        self.by_module = by_module
+
+    def get_actions_with_trigger_type(
+        self, trigger_type: Type[T]
+    ) -> Tuple[Tuple[Action, T], ...]:
+        result = self._by_trigger_type.get(trigger_type)
+        if result is None:
+            result = tuple(
+                (action, trigger)
+                for action in self.actions
+                for trigger in action.triggers
+                if isinstance(trigger, trigger_type)
+            )
+            self._by_trigger_type[trigger_type] = result
+        return result
+
+
+_action_registry: Optional[ActionRegistry] = None
+_action_registry_lock = Lock()
+
+
+def _get_action_registry_key() -> Hashable:
+    # The default finder searches the main module (Or the manifest), so the registry is stale if either changes
+    return (
+        get_servey_main(),
+        os.environ.get("SERVEY_MANIFEST"),
+        get_cached_impls(ActionFinderABC),
+    )
+
+
+# pylint: disable=W0603
+def get_action_registry() -> ActionRegistry:
+    """Get the registry of available actions, building it on first use"""
+    global _action_registry
+    key = _get_action_registry_key()
+    registry = _action_registry
+    if registry is None or registry.key != key:
+        with _action_registry_lock:
+            registry = _action_registry
+            if registry is None or registry.key != key:
+                actions = []
+                for action_finder in key[-1]:
+                    actions.extend(action_finder().find_actions())
+                registry = _action_registry = ActionRegistry(tuple(actions), key)
+    return registry
+
+
+# pylint: disable=W0603
+def invalidate_action_registry():
+    """Discard the registry so that actions are found again on next use (e.g.: After modules are reloaded)"""
+    global _action_registry
+    with _action_registry_lock:
+        _action_registry = None
+
+
 def find_actions() -> Iterator[Action]:
-    action_finders = get_impls(ActionFinderABC)
-    for action_finder in action_finders:
-        finder = action_finder()
-        yield from finder.find_actions()
+    yield from get_action_registry().actions
 
 
 def find_actions_with_trigger_type(
     trigger_type: Type[T],
 ) -> Iterator[Tuple[Action, T]]:
-    for action in find_actions():
-        for trigger in action.triggers:
-            if isinstance(trigger, trigger_type):
-                yield action, trigger
+    yield from get_action_registry().get_actions_with_trigger_type(trigger_type)
+
+
+def get_action_by_name(name: str) -> Optional[Action]:
+    registry = _action_registry
+    if registry is None or registry.key != _get_action_registry_key():
+        manifest = get_manifest()
+        if manifest:
+            # Import only the module defining the action rather than building the full registry
+            manifest_action = manifest.get_action_by_name(name)
+            return load_action(manifest_action) if manifest_action else None
+    return get_action_registry().by_name.get(name)
@@ -1,9 +1,12 @@
+import os
 from abc import abstractmethod, ABC
-from typing import Iterator, TypeVar, Type
-
-from injecty import get_impls
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Iterator, TypeVar, Type, Tuple, Dict, Optional, Hashable
 
 from servey.event_channel.event_channel_abc import EventChannelABC
+from servey.util import get_servey_main
+from servey.util.cached_impls import get_cached_impls
 
 T = TypeVar("T")
 
@@ -16,14 +19,82 @@ class EventChannelFinderABC(ABC):
         """Find all available channels"""
 
 
+@dataclass
+class EventChannelRegistry:
+    """Index of the event channels available, by name and type. Built once per process and shared."""
+
+    channels: Tuple[EventChannelABC, ...]
+    key: Optional[Hashable] = None
+    by_name: Dict[str, EventChannelABC] = field(init=False)
+    _by_type: Dict[Type, Tuple[EventChannelABC, ...]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        by_name = {}
+        for channel in self.channels:
+            # Where names clash, the first channel found takes precedence
+            by_name.setdefault(channel.name, channel)
+        self.by_name = by_name
+
+    def get_channels_by_type(self, channel_type: Type[T]) -> Tuple[T, ...]:
+        result = self._by_type.get(channel_type)
+        if result is None:
+            result = tuple(c for c in self.channels if isinstance(c, channel_type))
+            self._by_type[channel_type] = result
+        return result
+
+    def get_channel_by_name(
+        self, name: str, channel_type: Type[T] = EventChannelABC
+    ) -> Optional[T]:
+        channel = self.by_name.get(name)
+        if isinstance(channel, channel_type):
+            return channel
+
+
+_event_channel_registry: Optional[EventChannelRegistry] = None
+_event_channel_registry_lock = Lock()
+
+
+def _get_event_channel_registry_key() -> Hashable:
+    # The default finder searches the main module (Or the manifest), so the registry is stale if either changes
+    return (
+        get_servey_main(),
+        os.environ.get("SERVEY_MANIFEST"),
+        get_cached_impls(EventChannelFinderABC),
+    )
+
+
+# pylint: disable=W0603
+def get_event_channel_registry() -> EventChannelRegistry:
+    """Get the registry of available event channels, building it on first use"""
+    global _event_channel_registry
+    key = _get_event_channel_registry_key()
+    registry = _event_channel_registry
+    if registry is None or registry.key != key:
+        with _event_channel_registry_lock:
+            registry = _event_channel_registry
+            if registry is None or registry.key != key:
+                channels = []
+                for channel_finder in key[-1]:
+                    channels.extend(channel_finder().find_event_channels())
+                registry = _event_channel_registry = EventChannelRegistry(
+                    tuple(channels), key
+                )
+    return registry
+
+
+# pylint: disable=W0603
+def invalidate_event_channel_registry():
+    """Discard the registry so that channels are found again on next use"""
+    global _event_channel_registry
+    with _event_channel_registry_lock:
+        _event_channel_registry = None
+
+
 def find_event_channels() -> Iterator[EventChannelABC]:
-    channel_finders = get_impls(EventChannelFinderABC)
-    for channel_finder in channel_finders:
-        finder = channel_finder()
-        yield from finder.find_event_channels()
+    yield from get_event_channel_registry().channels
 
 
 def find_event_channels_by_type(channel_type: Type[T]) -> Iterator[T]:
-    for channel in find_event_channels():
-        if isinstance(channel, channel_type):
-            yield channel
+    yield from get_event_channel_registry().get_channels_by_type(channel_type)
@@ -0,0 +1,251 @@
+"""
+Static manifest of the actions and event channels in a project, built by parsing source files rather than importing
+them. Given a manifest, finders import only the modules which define actions / channels, and a single action may be
+loaded by name without importing anything else. Actions and channels must be defined (Rather than just imported) within
+the actions / event_channels packages to be included.
+"""
+
+import ast
+import importlib
+import importlib.util
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple, Optional, Iterator, Dict, Union
+
+from marshy import get_default_marshy_context
+
+from servey.action.action import Action, get_action
+from servey.event_channel.event_channel_abc import EventChannelABC
+from servey.json_codec.json_codec_abc import get_default_json_codec
+from servey.util import get_servey_main
+
+
+@dataclass(frozen=True)
+class ManifestAction:
+    name: str
+    module: str
+    qualname: str
+    # Source of the trigger expressions, for information only
+    triggers: Tuple[str, ...] = tuple()
+
+
+@dataclass(frozen=True)
+class ManifestEventChannel:
+    # Channel names are only known if given as a literal
+    name: Optional[str]
+    module: str
+    qualname: str
+
+
+@dataclass(frozen=True)
+class Manifest:
+    action_root_module: str
+    event_channel_root_module: str
+    actions: Tuple[ManifestAction, ...] = tuple()
+    event_channels: Tuple[ManifestEventChannel, ...] = tuple()
+
+    def get_action_by_name(self, name: str) -> Optional[ManifestAction]:
+        return _index_actions_by_name(self.actions).get(name)
+
+
+@lru_cache(maxsize=16)
+def _index_actions_by_name(
+    actions: Tuple[ManifestAction, ...]
+) -> Dict[str, ManifestAction]:
+    result = {}
+    for action in actions:
+        result.setdefault(action.name, action)
+    return result
+
+
+def build_manifest(
+    action_root_module: Optional[str] = None,
+    event_channel_root_module: Optional[str] = None,
+) -> Manifest:
+    """Build a manifest by parsing the source of the actions and event_channels packages"""
+    servey_main = get_servey_main()
+    action_root_module = action_root_module or f"{servey_main}.actions"
+    event_channel_root_module = (
+        event_channel_root_module or f"{servey_main}.event_channels"
+    )
+    actions = []
+    for module_name, tree in _parse_modules(action_root_module):
+        actions.extend(_find_actions_in_tree(module_name, tree))
+    event_channels = []
+    for module_name, tree in _parse_modules(event_channel_root_module):
+        event_channels.extend(_find_event_channels_in_tree(module_name, tree))
+    return Manifest(
+        action_root_module=action_root_module,
+        event_channel_root_module=event_channel_root_module,
+        actions=tuple(actions),
+        event_channels=tuple(event_channels),
+    )
+
+
+def write_manifest(manifest: Manifest, path: str):
+    content = get_default_marshy_context().dump(manifest)
+    with open(path, "wb") as writer:
+        writer.write(get_default_json_codec().dumps(content))
+
+
+def read_manifest(path: str) -> Manifest:
+    with open(path, "rb") as reader:
+        content = get_default_json_codec().loads(reader.read())
+    return get_default_marshy_context().load(Manifest, content)
+
+
+_manifest: Optional[Tuple[str, Manifest]] = None
+
+
+# pylint: disable=W0603
+def get_manifest() -> Optional[Manifest]:
+    """Get the manifest from the path in the SERVEY_MANIFEST environment variable, if set"""
+    global _manifest
+    path = os.environ.get("SERVEY_MANIFEST")
+    if not path:
+        return None
+    manifest = _manifest
+    if manifest is None or manifest[0] != path:
+        manifest = _manifest = (path, read_manifest(path))
+    return manifest[1]
+
+
+def load_action(manifest_action: ManifestAction) -> Action:
+    action = get_action(_load_attr(manifest_action.module, manifest_action.qualname))
+    if action is None:
+        raise ValueError(f"not_an_action:{manifest_action}")
+    return action
+
+
+def load_event_channel(manifest_event_channel: ManifestEventChannel) -> EventChannelABC:
+    return _load_attr(manifest_event_channel.module, manifest_event_channel.qualname)
+
+
+def _load_attr(module_name: str, qualname: str):
+    # Modules are cached by the import system, so this is cheap after the first call
+    value = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        value = getattr(value, attr)
+    return value
+
+
+def _parse_modules(root_module_name: str) -> Iterator[Tuple[str, ast.Module]]:
+    try:
+        # Only parent packages are imported to find the spec - the module itself is not
+        spec = importlib.util.find_spec(root_module_name)
+    except ModuleNotFoundError:
+        spec = None
+    if spec is None or not spec.origin:
+        return
+    if not spec.submodule_search_locations:
+        yield root_module_name, _parse_file(spec.origin)
+        return
+    for location in spec.submodule_search_locations:
+        root = Path(location)
+        for path in sorted(root.rglob("*.py")):
+            relative = path.relative_to(root).with_suffix("")
+            parts = [p for p in relative.parts if p != "__init__"]
+            if not all(p.isidentifier() for p in parts):
+                continue
+            yield ".".join((root_module_name, *parts)), _parse_file(str(path))
+
+
+def _parse_file(path: str) -> ast.Module:
+    with open(path, "rb") as reader:
+        return ast.parse(reader.read(), path)
+
+
+def _get_callable_name(node: ast.AST) -> Optional[str]:
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _get_keyword(call: ast.AST, name: str) -> Optional[ast.expr]:
+    if isinstance(call, ast.Call):
+        for keyword in call.keywords:
+            if keyword.arg == name:
+                return keyword.value
+    return None
+
+
+def _get_str(node: Optional[ast.expr]) -> Optional[str]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def _get_triggers(call: ast.AST) -> Tuple[str, ...]:
+    triggers = _get_keyword(call, "triggers")
+    if triggers is None:
+        return tuple()
+    if isinstance(triggers, (ast.Tuple, ast.List)):
+        return tuple(ast.unparse(e) for e in triggers.elts)
+    return (ast.unparse(triggers),)
+
+
+def _is_dataclass(node: ast.ClassDef) -> bool:
+    return any(_get_callable_name(d) == "dataclass" for d in node.decorator_list)
+
+
+def _find_actions_in_tree(
+    module_name: str, tree: ast.Module
+) -> Iterator[ManifestAction]:
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            yield from _find_decorated_action(module_name, node, node.name)
+        elif isinstance(node, ast.ClassDef) and _is_dataclass(node):
+            for child in node.body:
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    qualname = f"{node.name}.{child.name}"
+                    yield from _find_decorated_action(module_name, child, qualname)
+        elif (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and _get_callable_name(node.value) == "action"
+            and node.value.args
+        ):
+            # e.g.: my_action = action(my_fn, triggers=...)
+            fn = node.value.args[0]
+            name = _get_str(_get_keyword(node.value, "name")) or _get_callable_name(fn)
+            if name:
+                yield ManifestAction(
+                    name, module_name, node.targets[0].id, _get_triggers(node.value)
+                )
+
+
+def _find_decorated_action(
+    module_name: str,
+    node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+    qualname: str,
+) -> Iterator[ManifestAction]:
+    for decorator in node.decorator_list:
+        if _get_callable_name(decorator) == "action":
+            name = _get_str(_get_keyword(decorator, "name")) or node.name
+            yield ManifestAction(name, module_name, qualname, _get_triggers(decorator))
+            return
+
+
+def _find_event_channels_in_tree(
+    module_name: str, tree: ast.Module
+) -> Iterator[ManifestEventChannel]:
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and isinstance(node.value, ast.Call)
+            and (_get_callable_name(node.value) or "").lower().endswith("channel")
+        ):
+            call = node.value
+            name = _get_str(_get_keyword(call, "name"))
+            if name is None and call.args:
+                name = _get_str(call.args[0])
+            yield ManifestEventChannel(name, module_name, node.targets[0].id)
@@ -6,6 +6,7 @@ from typing import Iterator
 
 from servey.action.action import Action, get_action
 from servey.finder.action_finder_abc import ActionFinderABC
+from servey.finder.manifest import get_manifest, load_action
 from servey.util import get_servey_main
 
 LOGGER = logging.getLogger(__name__)
@@ -22,6 +23,12 @@ class ModuleActionFinder(ActionFinderABC):
     )
 
     def find_actions(self) -> Iterator[Action]:
+        manifest = get_manifest()
+        if manifest and manifest.action_root_module == self.root_module_name:
+            # Only modules defining actions are imported, and packages are not walked
+            for manifest_action in manifest.actions:
+                yield load_action(manifest_action)
+            return
         try:
             module = importlib.import_module(self.root_module_name)
             # noinspection PyTypeChecker
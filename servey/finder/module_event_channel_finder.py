@@ -6,6 +6,7 @@ from typing import Iterator
 
 from servey.event_channel.event_channel_abc import EventChannelABC
 from servey.finder.event_channel_finder_abc import EventChannelFinderABC
+from servey.finder.manifest import get_manifest, load_event_channel
 from servey.util import get_servey_main
 
 LOGGER = logging.getLogger(__name__)
@@ -22,6 +23,11 @@ class ModuleEventChannelFinder(EventChannelFinderABC):
     )
 
     def find_event_channels(self) -> Iterator[EventChannelABC]:
+        manifest = get_manifest()
+        if manifest and manifest.event_channel_root_module == self.root_module_name:
+            for manifest_event_channel in manifest.event_channels:
+                yield load_event_channel(manifest_event_channel)
+            return
         try:
             module = importlib.import_module(self.root_module_name)
             # noinspection PyTypeChecker
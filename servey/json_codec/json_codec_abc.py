@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Union
+
+from injecty import get_new_default_instance
+from marshy.types import ExternalType
+
+
+class JsonCodecABC(ABC):
+    """
+    Codec used to encode / decode json for all transports. Encoding produces bytes directly, so that the same
+    buffer may be used for both the body of a response and computing its cache headers.
+    """
+
+    priority: int = 100
+
+    @abstractmethod
+    def dumps(self, obj: ExternalType) -> bytes:
+        """Encode the object given as compact utf-8 json"""
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> ExternalType:
+        """Decode the json given"""
+
+
+_default_json_codec = None
+
+
+# pylint: disable=W0603
+def get_default_json_codec() -> JsonCodecABC:
+    global _default_json_codec
+    if not _default_json_codec:
+        _default_json_codec = get_new_default_instance(JsonCodecABC)
+    return _default_json_codec
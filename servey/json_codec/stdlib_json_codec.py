@@ -0,0 +1,21 @@
+import json
+from typing import Union
+
+from marshy.types import ExternalType
+
+from servey.json_codec.json_codec_abc import JsonCodecABC
+from servey.util.singleton_abc import SingletonABC
+
+
+class StdlibJsonCodec(SingletonABC, JsonCodecABC):
+    """
+    Codec using the json module from the standard library. Output matches that of the starlette JSONResponse
+    """
+
+    def dumps(self, obj: ExternalType) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> ExternalType:
+        return json.loads(data)
@@ -0,0 +1,26 @@
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Tuple
+
+from servey.rate_limit.rate_limit import TokenBucket
+from servey.rate_limit.rate_limit_store_abc import RateLimitStoreABC, take_token
+from servey.util.lru_cache import LruCache
+
+
+@dataclass
+class MemoryRateLimitStore(RateLimitStoreABC):
+    """
+    Store holding bucket state in memory, bounded to the most recently used keys. (Evicting a bucket is equivalent
+    to it being full, so the bound should comfortably exceed the number of concurrently active subjects)
+    """
+
+    buckets: LruCache[Tuple[float, float]] = field(
+        default_factory=lambda: LruCache(max_size=100000)
+    )
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+
+    def acquire(self, key: str, bucket: TokenBucket, now: float) -> float:
+        with self._lock:
+            state, retry_after = take_token(self.buckets.get(key, now), bucket, now)
+            self.buckets.put(key, state)
+        return retry_after
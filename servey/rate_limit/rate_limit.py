@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from servey.security.authorization import Authorization
+
+
+@dataclass(frozen=True)
+class TokenBucket:
+    """Tokens are added at the rate given (Per second), up to the capacity, which is the maximum burst size"""
+
+    rate: float
+    capacity: float
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Rate limit policy for an action. Each authorization subject has its own bucket - subjects with one of the scopes
+    in scope_buckets use the bucket for the first matching scope instead. Anonymous invocations share a single bucket.
+    """
+
+    subject_bucket: TokenBucket
+    # Bucket shared by all anonymous invocations - the subject bucket is used if this is not defined
+    anonymous_bucket: Optional[TokenBucket] = None
+    scope_buckets: Tuple[Tuple[str, TokenBucket], ...] = tuple()
+    status_code: int = 429
+
+    def get_bucket(
+        self, authorization: Optional[Authorization]
+    ) -> Tuple[str, TokenBucket]:
+        """Get the key and bucket for invocations with the authorization given"""
+        if authorization is None:
+            return "anonymous", self.anonymous_bucket or self.subject_bucket
+        key = f"subject:{authorization.subject_id}"
+        for scope, bucket in self.scope_buckets:
+            if scope in authorization.scopes:
+                return key, bucket
+        return key, self.subject_bucket
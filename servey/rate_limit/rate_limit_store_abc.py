@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+from injecty import get_new_default_instance
+
+from servey.rate_limit.rate_limit import TokenBucket
+
+
+class RateLimitStoreABC(ABC):
+    """
+    Store for the state of token buckets. The in memory store only limits invocations within a single process, so a
+    shared store is required for limits to hold across worker processes.
+    """
+
+    priority: int = 100
+
+    @abstractmethod
+    def acquire(self, key: str, bucket: TokenBucket, now: float) -> float:
+        """
+        Attempt to take a token from the bucket with the key given. Return 0 if successful, or the number of seconds
+        until a token will be available otherwise.
+        """
+
+    async def acquire_async(self, key: str, bucket: TokenBucket, now: float) -> float:
+        """
+        Version of acquire for use on the event loop. Stores which may block (e.g.: Waiting on a lock held by another
+        process) should override this to run acquire elsewhere. The default implementation calls acquire directly.
+        """
+        return self.acquire(key, bucket, now)
+
+
+def take_token(
+    state: Optional[Tuple[float, float]], bucket: TokenBucket, now: float
+) -> Tuple[Tuple[float, float], float]:
+    """
+    Given the current (tokens, updated_at) state for a bucket (Or None if new), get the new state and the number of
+    seconds to wait before retrying. (0 if a token was taken)
+    """
+    if state is None:
+        tokens = bucket.capacity
+    else:
+        tokens, updated_at = state
+        # Clocks may differ slightly between processes sharing a store, so time never runs backwards
+        elapsed = max(0.0, now - updated_at)
+        tokens = min(bucket.capacity, tokens + elapsed * bucket.rate)
+    if tokens >= 1:
+        return (tokens - 1, now), 0
+    return (tokens, now), (1 - tokens) / bucket.rate
+
+
+_default_rate_limit_store = None
+
+
+# pylint: disable=W0603
+def get_default_rate_limit_store() -> RateLimitStoreABC:
+    """
+    Get the default store. If the SERVEY_RATE_LIMIT_DB environment variable is set, this is a sqlite database shared
+    by all processes on the host. Otherwise state is held in memory.
+    """
+    global _default_rate_limit_store
+    if not _default_rate_limit_store:
+        _default_rate_limit_store = get_new_default_instance(RateLimitStoreABC)
+    return _default_rate_limit_store
@@ -0,0 +1,64 @@
+import math
+from time import time
+from typing import Optional, Tuple
+
+from servey.action.action import Action
+from servey.errors import ServeyError
+from servey.rate_limit.rate_limit import RateLimit, TokenBucket
+from servey.rate_limit.rate_limit_store_abc import (
+    RateLimitStoreABC,
+    get_default_rate_limit_store,
+)
+from servey.security.authorization import Authorization
+
+
+class RateLimitError(ServeyError):
+    def __init__(self, action_name: str, status_code: int, retry_after: int):
+        super().__init__(f"rate_limited:{action_name}")
+        self.action_name = action_name
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def check_rate_limit(
+    action: Action,
+    authorization: Optional[Authorization],
+    store: Optional[RateLimitStoreABC] = None,
+):
+    """Take a token for an invocation of the action given, raising a RateLimitError if none are available"""
+    rate_limit = action.rate_limit
+    if not rate_limit:
+        return
+    key, bucket = _get_key_and_bucket(action, rate_limit, authorization)
+    store = store or get_default_rate_limit_store()
+    retry_after = store.acquire(key, bucket, time())
+    _raise_if_limited(action, rate_limit, retry_after)
+
+
+async def check_rate_limit_async(
+    action: Action,
+    authorization: Optional[Authorization],
+    store: Optional[RateLimitStoreABC] = None,
+):
+    """Version of check_rate_limit for use on the event loop, which does not block while waiting for the store"""
+    rate_limit = action.rate_limit
+    if not rate_limit:
+        return
+    key, bucket = _get_key_and_bucket(action, rate_limit, authorization)
+    store = store or get_default_rate_limit_store()
+    retry_after = await store.acquire_async(key, bucket, time())
+    _raise_if_limited(action, rate_limit, retry_after)
+
+
+def _get_key_and_bucket(
+    action: Action, rate_limit: RateLimit, authorization: Optional[Authorization]
+) -> Tuple[str, TokenBucket]:
+    key, bucket = rate_limit.get_bucket(authorization)
+    return f"{action.name}:{key}", bucket
+
+
+def _raise_if_limited(action: Action, rate_limit: RateLimit, retry_after: float):
+    if retry_after:
+        raise RateLimitError(
+            action.name, rate_limit.status_code, max(1, math.ceil(retry_after))
+        )
@@ -0,0 +1,88 @@
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import Optional
+
+from servey.executor.executor_abc import ExecutorABC, get_default_executor
+from servey.rate_limit.rate_limit import TokenBucket
+from servey.rate_limit.rate_limit_store_abc import RateLimitStoreABC, take_token
+
+
+@dataclass
+class SqliteRateLimitStore(RateLimitStoreABC):
+    """
+    Store holding bucket state in a sqlite database, so that limits are shared between all worker processes on a
+    host. Each acquisition is a single short write transaction, which may wait on a lock held by another process,
+    so acquisitions from the event loop are run using the executor. Used by default when the SERVEY_RATE_LIMIT_DB
+    environment variable is set. A missing row is equivalent to a full bucket, so rows for buckets which have fully
+    refilled are deleted at most once every prune_interval seconds.
+    """
+
+    priority = 110  # Not a field, so the path remains the first argument
+    path: str = field(default_factory=lambda: os.environ["SERVEY_RATE_LIMIT_DB"])
+    timeout: float = 5
+    executor: ExecutorABC = field(default_factory=get_default_executor)
+    prune_interval: float = 60
+    _pruned_at: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _local: threading.local = field(
+        default_factory=threading.local, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        with closing(self._connect()) as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS servey_rate_limit (key TEXT PRIMARY KEY, "
+                "tokens REAL NOT NULL, updated_at REAL NOT NULL, full_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS servey_rate_limit_full_at "
+                "ON servey_rate_limit (full_at)"
+            )
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode, so that transactions are managed explicitly
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+
+    async def acquire_async(self, key: str, bucket: TokenBucket, now: float) -> float:
+        return await self.executor.execute(
+            self.acquire, {"key": key, "bucket": bucket, "now": now}
+        )
+
+    def acquire(self, key: str, bucket: TokenBucket, now: float) -> float:
+        connection = self.connection
+        # Immediate, so that concurrent processes can't read the same state before either writes
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT tokens, updated_at FROM servey_rate_limit WHERE key = ?",
+                (key,),
+            ).fetchone()
+            state, retry_after = take_token(row, bucket, now)
+            tokens, updated_at = state
+            full_at = updated_at + (bucket.capacity - tokens) / bucket.rate
+            connection.execute(
+                "INSERT OR REPLACE INTO servey_rate_limit (key, tokens, updated_at, full_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, tokens, updated_at, full_at),
+            )
+            if self._pruned_at is None or now - self._pruned_at >= self.prune_interval:
+                self._pruned_at = now
+                connection.execute(
+                    "DELETE FROM servey_rate_limit WHERE full_at <= ?", (now,)
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return retry_after
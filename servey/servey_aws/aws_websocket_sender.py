@@ -1,4 +1,3 @@
-import json
 import os
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict
@@ -15,6 +14,7 @@ from servey.event_channel.websocket.websocket_sender import (
     T,
     WebsocketSenderFactoryABC,
 )
+from servey.json_codec.json_codec_abc import get_default_json_codec
 from servey.security.access_control.access_control_abc import AccessControlABC
 from servey.security.access_control.allow_all import ALLOW_ALL
 from servey.security.authorization import Authorization
@@ -51,6 +51,8 @@ class AWSWebsocketSender(WebsocketSenderABC[T]):
             "IndexName": "gsi__subscription_name__connection_id",
             "KeyConditionExpression": Key("subscription_name").eq(channel_name),
         }
+        # Encode once for all connections
+        data = get_default_json_codec().dumps(self.event_marshaller.dump(event))
         while True:
             response = self.connection_table.query(**kwargs)
             items = response.get("Items") or []
@@ -64,7 +66,6 @@ class AWSWebsocketSender(WebsocketSenderABC[T]):
                         )
                     if not self.event_filter.should_publish(event, user_authorization):
                         continue
-                data = json.dumps(self.event_marshaller.dump(event)).encode("utf-8")
                 api.post_to_connection(Data=data, ConnectionId=item["connection_id"])
             kwargs["ExclusiveStartKey"] = response.get("LastEvaluatedKey")
             if not kwargs["ExclusiveStartKey"]:
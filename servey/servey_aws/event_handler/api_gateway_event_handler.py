@@ -1,8 +1,6 @@
 import asyncio
 import inspect
-import json
 from dataclasses import field, dataclass
-from email.utils import parsedate_to_datetime
 from typing import Optional, Awaitable
 
 from marshy import ExternalType, get_default_marshy_context, MarshyContext
@@ -12,6 +10,9 @@ from schemey import get_default_schema_context, SchemaContext
 
 from servey.action.action import Action
 from servey.action.util import get_marshaller_for_params, get_schema_for_params
+from servey.cache_control.cache_header import CacheHeader
+from servey.json_codec.json_codec_abc import get_default_json_codec
+from servey.rate_limit.rate_limiter import RateLimitError, check_rate_limit
 from servey.security.access_control.allow_all import ALLOW_ALL
 from servey.security.authorization import AuthorizationError, Authorization
 from servey.security.authorizer.authorizer_abc import AuthorizerABC
@@ -24,6 +25,8 @@ from servey.servey_aws.event_handler.event_handler_abc import (
     EventHandlerABC,
     EventHandlerFactoryABC,
 )
+from servey.validation.compiled_schema import compile_schema
+from servey.validation.output_validation_policy_abc import OutputValidationPolicyABC
 
 
 class ApiGatewayEventHandler(EventHandler):
@@ -32,7 +35,8 @@ class ApiGatewayEventHandler(EventHandler):
 
     def parse_kwargs(self, event: ExternalItemType) -> ExternalType:
         if event.get("httpMethod") in ("POST", "PATCH", "PUT"):
-            params = json.loads(event.get("body") or "{}")
+            body = event.get("body")
+            params = get_default_json_codec().loads(body) if body else {}
         else:
             params = event.get("queryStringParameters") or {}
             # We use the marshaller to do conversions, because queryStringParams are all strings
@@ -44,8 +48,13 @@ class ApiGatewayEventHandler(EventHandler):
         if self.param_schema:
             self.param_schema.validate(params)
         kwargs = self.param_marshaller.load(params)
-        if self.auth_kwarg_name or self.action.access_control != ALLOW_ALL:
+        if (
+            self.auth_kwarg_name
+            or self.action.access_control != ALLOW_ALL
+            or self.action.rate_limit
+        ):
             authorization = self.get_authorization(event)
+            check_rate_limit(self.action, authorization)
             if not self.action.access_control.is_executable(authorization):
                 raise AuthorizationError("unauthorized")
             if self.auth_kwarg_name:
@@ -61,41 +70,69 @@ class ApiGatewayEventHandler(EventHandler):
         return self.authorizer.authorize(token)
 
     def handle(self, event: ExternalItemType, context) -> ExternalItemType:
-        kwargs = self.parse_kwargs(event)
+        try:
+            kwargs = self.parse_kwargs(event)
+        except RateLimitError as e:
+            return {
+                "statusCode": e.status_code,
+                "headers": {
+                    "Content-Type": "application/json",
+                    "Retry-After": str(e.retry_after),
+                },
+                "body": '{"error":"rate_limited"}',
+            }
+        validators = self.get_validators(kwargs)
+        if validators and self.is_not_modified(event, validators):
+            return {
+                "statusCode": 304,
+                "headers": validators.get_validator_http_headers(),
+                "body": "",
+            }
         result = self.action.fn(**kwargs)
         if isinstance(result, Awaitable):
             loop = asyncio.get_event_loop()
             result = loop.run_until_complete(result)
-        dumped = self.result_marshaller.dump(result)
+        content = get_default_json_codec().dumps(self.render_result(result))
         response = {
             "statusCode": 200,
             "headers": {"Content-Type": "application/json"},
-            "body": json.dumps(dumped),
+            "body": content.decode("utf-8"),
         }
-        self.apply_caching(event, response)
+        self.apply_caching(event, response, content, validators)
         return response
 
-    def apply_caching(self, event: ExternalItemType, response: ExternalItemType):
+    def get_validators(self, kwargs: ExternalItemType) -> Optional[CacheHeader]:
+        """Get an etag / updated_at for the kwargs given without invoking the action, if supported"""
+        cache_control = self.action.cache_control
+        if not cache_control or not cache_control.supports_cache_header_for_params():
+            return None
+        return cache_control.get_cache_header_for_params(kwargs)
+
+    @staticmethod
+    def is_not_modified(event: ExternalItemType, cache_header: CacheHeader) -> bool:
+        headers = event.get("headers") or {}
+        return cache_header.is_not_modified(
+            headers.get("If-None-Match"), headers.get("If-Modified-Since")
+        )
+
+    def apply_caching(
+        self,
+        event: ExternalItemType,
+        response: ExternalItemType,
+        content: Optional[bytes] = None,
+        validators: Optional[CacheHeader] = None,
+    ):
         if self.action.cache_control:
-            headers = event.get("headers") or {}
-            if_none_match = headers.get("If-None-Match")
-            if_modified_since = headers.get("If-Modified-Since")
+            if content is None:
+                content = response["body"].encode("UTF-8")
             cache_header = self.action.cache_control.get_cache_header_from_content(
-                response["body"].encode("UTF-8")
+                content
             )
+            cache_header = cache_header.with_validators(validators)
             response["headers"].update(cache_header.get_http_headers())
-            if if_none_match and cache_header.etag:
-                if cache_header.etag == if_none_match:
-                    response["statusCode"] = 304
-                    response["body"] = ""
-            elif if_modified_since and cache_header.updated_at:
-                if_modified_since_date = parsedate_to_datetime(if_modified_since)
-                if (
-                    if_modified_since_date.timestamp()
-                    >= cache_header.updated_at.timestamp()
-                ):
-                    response["statusCode"] = 304
-                    response["body"] = ""
+            if self.is_not_modified(event, cache_header):
+                response["statusCode"] = 304
+                response["body"] = ""
 
 
 @dataclass
@@ -107,13 +144,16 @@ class ApiGatewayEventHandlerFactory(EventHandlerFactoryABC):
     auth_kwarg_name: Optional[str] = None
     authorizer: Optional[AuthorizerABC] = None
     validate_output: bool = True
+    output_validation_policy: Optional[OutputValidationPolicyABC] = None
     priority: int = 100
 
     def create(self, action: Action) -> EventHandlerABC:
         fn, auth_kwarg_name = separate_auth_kwarg(action.fn)
         param_marshaller = get_marshaller_for_params(fn, set(), self.marshaller_context)
         result_marshaller = None
-        param_schema = get_schema_for_params(fn, set(), self.schema_context)
+        param_schema = compile_schema(
+            get_schema_for_params(fn, set(), self.schema_context)
+        )
         result_schema = None
         sig = inspect.signature(fn)
         if sig.return_annotation != inspect.Signature.empty:
@@ -121,12 +161,16 @@ class ApiGatewayEventHandlerFactory(EventHandlerFactoryABC):
                 sig.return_annotation
             )
             if self.validate_output:
-                result_schema = self.schema_context.schema_from_type(
-                    resolve_forward_refs(sig.return_annotation)
+                result_schema = compile_schema(
+                    self.schema_context.schema_from_type(
+                        resolve_forward_refs(sig.return_annotation)
+                    )
                 )
         authorizer = (
             get_default_authorizer()
-            if auth_kwarg_name or action.access_control != ALLOW_ALL
+            if auth_kwarg_name
+            or action.access_control != ALLOW_ALL
+            or action.rate_limit
             else None
         )
         return ApiGatewayEventHandler(
@@ -138,4 +182,5 @@ class ApiGatewayEventHandlerFactory(EventHandlerFactoryABC):
             auth_kwarg_name=auth_kwarg_name,
             authorizer=authorizer,
             priority=self.priority,
+            output_validation_policy=self.output_validation_policy,
         )
@@ -3,6 +3,7 @@ from typing import Type, Any, List
 
 from marshy.types import ExternalItemType, ExternalType
 
+from servey.rate_limit.rate_limiter import check_rate_limit
 from servey.security.access_control.allow_all import ALLOW_ALL
 from servey.security.authorization import AuthorizationError
 from servey.servey_aws.event_handler.event_handler import (
@@ -28,7 +29,11 @@ class AppsyncEventHandler(EventHandler):
         if self.param_schema:
             self.param_schema.validate(arguments)
         kwargs = self.param_marshaller.load(arguments)
-        if self.auth_kwarg_name or self.action.access_control != ALLOW_ALL:
+        if (
+            self.auth_kwarg_name
+            or self.action.access_control != ALLOW_ALL
+            or self.action.rate_limit
+        ):
             # noinspection PyTypeChecker
             headers: ExternalItemType = (event.get("request") or {}).get(
                 "headers"
@@ -39,6 +44,7 @@ class AppsyncEventHandler(EventHandler):
                 if auth_header.lower().startswith("bearer "):
                     auth_header = auth_header[7:]
                 authorization = self.authorizer.authorize(auth_header)
+            check_rate_limit(self.action, authorization)
             if not self.action.access_control.is_executable(authorization):
                 raise AuthorizationError("unauthorized")
             if self.auth_kwarg_name:
@@ -11,6 +11,7 @@ from schemey import get_default_schema_context, SchemaContext, Schema
 
 from servey.action.action import Action
 from servey.action.util import get_marshaller_for_params, get_schema_for_params
+from servey.rate_limit.rate_limiter import check_rate_limit
 from servey.security.access_control.allow_all import ALLOW_ALL
 from servey.security.authorization import (
     Authorization,
@@ -23,6 +24,11 @@ from servey.servey_aws.event_handler.event_handler_abc import (
     EventHandlerABC,
     EventHandlerFactoryABC,
 )
+from servey.validation.compiled_schema import compile_schema
+from servey.validation.output_validation_policy_abc import OutputValidationPolicyABC
+from servey.validation.output_validation_policy_factory import (
+    get_default_output_validation_policy,
+)
 
 
 # pylint: disable=R0902
@@ -37,6 +43,11 @@ class EventHandler(EventHandlerABC):
     auth_marshaller: Optional[MarshallerABC[Authorization]] = None
     authorizer: Optional[AuthorizerABC] = None
     priority: int = 50
+    output_validation_policy: Optional[OutputValidationPolicyABC] = None
+
+    def __post_init__(self):
+        if not self.output_validation_policy:
+            self.output_validation_policy = get_default_output_validation_policy()
 
     def is_usable(self, event: ExternalType, context) -> bool:
         if isinstance(event, list):
@@ -78,13 +89,18 @@ class EventHandler(EventHandlerABC):
         if self.param_schema:
             self.param_schema.validate(params)
         kwargs = self.param_marshaller.load(params)
-        if self.action.access_control != ALLOW_ALL or self.auth_kwarg_name:
+        if (
+            self.action.access_control != ALLOW_ALL
+            or self.auth_kwarg_name
+            or self.action.rate_limit
+        ):
             auth_kwarg_value = event.get("authorization")
             authorization = None
             if isinstance(auth_kwarg_value, str):
                 authorization = self.authorizer.authorize(auth_kwarg_value)
             elif isinstance(auth_kwarg_value, dict):
                 authorization = self.auth_marshaller.load(auth_kwarg_value)
+            check_rate_limit(self.action, authorization)
             if not self.action.access_control.is_executable(authorization):
                 raise AuthorizationError("unauthorized")
             if self.auth_kwarg_name:
@@ -94,8 +110,11 @@ class EventHandler(EventHandlerABC):
     def render_result(self, result: Any) -> ExternalType:
         if self.result_marshaller:
             result = self.result_marshaller.dump(result)
-        if self.result_schema:
-            self.result_schema.validate(result)
+        error = self.output_validation_policy.check(
+            self.action.name, self.result_schema, result
+        )
+        if error:
+            raise error
         return result
 
 
@@ -106,6 +125,7 @@ class EventHandlerFactory(EventHandlerFactoryABC):
     )
     schema_context: SchemaContext = field(default_factory=get_default_schema_context)
     validate_output: bool = True
+    output_validation_policy: Optional[OutputValidationPolicyABC] = None
     allow_unsigned_auth: bool = True
     priority: int = 50
     event_handler_type: Type[EventHandlerABC] = EventHandler
@@ -114,12 +134,14 @@ class EventHandlerFactory(EventHandlerFactoryABC):
         fn, auth_kwarg_name = separate_auth_kwarg(action.fn)
         authorizer = None
         auth_marshaller = None
-        if auth_kwarg_name or action.access_control != ALLOW_ALL:
+        if auth_kwarg_name or action.access_control != ALLOW_ALL or action.rate_limit:
             authorizer = get_default_authorizer()
             if self.allow_unsigned_auth:
                 auth_marshaller = self.marshaller_context.get_marshaller(Authorization)
         param_marshaller = get_marshaller_for_params(fn, set(), self.marshaller_context)
-        param_schema = get_schema_for_params(fn, set(), self.schema_context)
+        param_schema = compile_schema(
+            get_schema_for_params(fn, set(), self.schema_context)
+        )
         sig = inspect.signature(fn)
         result_marshaller = None
         result_schema = None
@@ -128,8 +150,10 @@ class EventHandlerFactory(EventHandlerFactoryABC):
                 sig.return_annotation
             )
             if self.validate_output:
-                result_schema = self.schema_context.schema_from_type(
-                    resolve_forward_refs(sig.return_annotation)
+                result_schema = compile_schema(
+                    self.schema_context.schema_from_type(
+                        resolve_forward_refs(sig.return_annotation)
+                    )
                 )
         return self.event_handler_type(
             action=action,
@@ -141,6 +165,7 @@ class EventHandlerFactory(EventHandlerFactoryABC):
             auth_marshaller=auth_marshaller,
             authorizer=authorizer,
             priority=self.priority,
+            output_validation_policy=self.output_validation_policy,
         )
 
 
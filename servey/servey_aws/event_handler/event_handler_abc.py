@@ -1,10 +1,10 @@
 from abc import abstractmethod, ABC
-from typing import List, Optional
+from typing import List, Optional, Dict, Tuple
 
-from injecty import get_impls
 from marshy.types import ExternalType
 
 from servey.action.action import Action
+from servey.util.cached_impls import get_cached_impls
 
 
 class EventHandlerABC(ABC):
@@ -25,10 +25,28 @@ class EventHandlerFactoryABC(ABC):
         """Create a handler for the action given"""
 
 
-def get_event_handlers(action: Action) -> List[EventHandlerABC]:
+def create_event_handlers(action: Action) -> List[EventHandlerABC]:
+    """Create new handlers for the action given, highest priority first"""
     handlers = [
-        factory().create(action) for factory in get_impls(EventHandlerFactoryABC)
+        factory().create(action) for factory in get_cached_impls(EventHandlerFactoryABC)
     ]
     handlers = [h for h in handlers if h]
     handlers.sort(key=lambda h: h.priority, reverse=True)
     return handlers
+
+
+# Handlers are costly to create (Marshallers and schemas are built for each), so they are created once per action and
+# shared. Entries are keyed by name, and only reused for the identical action (Actions may be redefined, e.g.: on reload)
+_event_handlers: Dict[str, Tuple[Action, List[EventHandlerABC]]] = {}
+
+
+def get_event_handlers(action: Action) -> List[EventHandlerABC]:
+    entry = _event_handlers.get(action.name)
+    if entry is None or entry[0] is not action:
+        entry = _event_handlers[action.name] = (action, create_event_handlers(action))
+    return entry[1]
+
+
+def invalidate_event_handlers():
+    """Discard all cached handlers, so they are created again on next use"""
+    _event_handlers.clear()
@@ -1,5 +1,4 @@
 import inspect
-import json
 from dataclasses import field, dataclass
 from typing import Optional
 
@@ -9,10 +8,12 @@ from marshy.types import ExternalItemType
 from schemey import get_default_schema_context, SchemaContext, Schema
 
 from servey.action.action import Action
+from servey.json_codec.json_codec_abc import get_default_json_codec
 from servey.servey_aws.event_handler.event_handler_abc import (
     EventHandlerABC,
     EventHandlerFactoryABC,
 )
+from servey.validation.compiled_schema import compile_schema
 
 
 @dataclass
@@ -28,7 +29,8 @@ class SqsEventHandler(EventHandlerABC):
 
     def handle(self, event: ExternalItemType, context) -> ExternalType:
         # noinspection PyTypeChecker
-        records = [json.loads(r["body"]) for r in event["Records"]]
+        loads = get_default_json_codec().loads
+        records = [loads(r["body"]) for r in event["Records"]]
         if self.event_schema:
             for r in records:
                 self.event_schema.validate(r)
@@ -56,7 +58,7 @@ class SqsEventHandlerFactory(EventHandlerFactoryABC):
         if len(params) != 1:
             return  # Sqs requires a single event_channel
         event_type = params[0].annotation
-        event_schema = self.schema_context.schema_from_type(event_type)
+        event_schema = compile_schema(self.schema_context.schema_from_type(event_type))
         event_marshaller = self.marshaller_context.get_marshaller(event_type)
         result_marshaller = None
         if sig.return_annotation != inspect.Signature.empty:
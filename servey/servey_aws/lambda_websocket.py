@@ -10,7 +10,8 @@ from marshy import get_default_marshy_context
 from marshy.types import ExternalItemType, ExternalType
 
 from servey.event_channel.websocket.websocket_event_channel import WebsocketEventChannel
-from servey.finder.event_channel_finder_abc import find_event_channels_by_type
+from servey.finder.event_channel_finder_abc import get_event_channel_registry
+from servey.json_codec.json_codec_abc import get_default_json_codec
 from servey.security.authorization import Authorization
 from servey.security.authorizer.authorizer_factory_abc import get_default_authorizer
 
@@ -18,7 +19,7 @@ _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(logging.INFO)
 logging.basicConfig(level=logging.INFO)
 _DYNAMODB_TABLE = boto3.resource("dynamodb").Table(os.environ["CONNECTION_TABLE_NAME"])
-_CHANNELS = list(find_event_channels_by_type(WebsocketEventChannel))
+_CHANNELS = get_event_channel_registry()
 _AUTH_MARSHALLER = get_default_marshy_context().get_marshaller(Optional[Authorization])
 _AUTHORIZER = get_default_authorizer()
 
@@ -44,11 +45,13 @@ def lambda_handler(event: ExternalItemType, context) -> ExternalType:
         status_code = 200
     else:
         try:
-            body = json.loads(event["body"])
+            body = get_default_json_codec().loads(event["body"])
             type_ = body["type"]
             channel_name = body["payload"]
             # Ensure channel exists
-            channel = next(c for c in _CHANNELS if c.name == channel_name)
+            channel = _CHANNELS.get_channel_by_name(channel_name, WebsocketEventChannel)
+            if channel is None:
+                raise ValueError(f"no_such_channel:{channel_name}")
             if type_ == "Subscribe":
                 subscribe(connection_id, channel.name, endpoint_url)
                 status_code = 200
@@ -1,4 +1,5 @@
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Optional, Dict
 
 from marshy.types import ExternalItemType
 
@@ -11,8 +12,12 @@ from servey.servey_aws.event_handler.event_handler_abc import (
 from servey.servey_aws.router.router_abc import RouterABC
 
 
+@dataclass
 class APIGatewayRouter(RouterABC):
     priority: int = 120
+    _actions_by_path: Optional[Dict[str, Action]] = field(
+        default=None, init=False, repr=False
+    )
 
     def create_handler(
         self, event: ExternalItemType, context
@@ -31,7 +36,13 @@ class APIGatewayRouter(RouterABC):
                 return handler
 
     def find_action_for_path(self, path: str) -> Optional[Action]:
-        for action, trigger in self.web_trigger_actions:
-            action_path = trigger.path or f"/actions/{action.name.replace('_', '-')}"
-            if action_path == path:
-                return action
+        actions_by_path = self._actions_by_path
+        if actions_by_path is None:
+            actions_by_path = {}
+            for action, trigger in self.web_trigger_actions:
+                action_path = (
+                    trigger.path or f"/actions/{action.name.replace('_', '-')}"
+                )
+                actions_by_path.setdefault(action_path, action)
+            self._actions_by_path = actions_by_path
+        return actions_by_path.get(path)
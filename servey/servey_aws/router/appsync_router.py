@@ -1,6 +1,7 @@
 import dataclasses
 import inspect
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Tuple
 
 from marshy.factory.optional_marshaller_factory import get_optional_type
 from marshy.types import ExternalType
@@ -15,8 +16,16 @@ from servey.servey_aws.router.router_abc import RouterABC
 from servey.util import to_snake_case
 
 
+@dataclass
 class AppsyncRouter(RouterABC):
     priority: int = 110
+    # Nested actions are cached so that the same action (And so the same event handlers) is used for each event
+    _nested_actions: Dict[Tuple[str, str], Action] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _actions_by_field_name: Optional[Dict[str, Action]] = field(
+        default=None, init=False, repr=False
+    )
 
     def create_handler(self, event: ExternalType, context) -> Optional[EventHandlerABC]:
         if isinstance(event, list):
@@ -40,6 +49,16 @@ class AppsyncRouter(RouterABC):
                 return handler
 
     def find_action_for_parent_type(self, parent_type_name: str, field_name: str):
+        nested_actions = self._nested_actions
+        key = (parent_type_name, field_name)
+        nested_action = nested_actions.get(key)
+        if nested_action is None:
+            nested_action = self.create_nested_action(parent_type_name, field_name)
+            if nested_action:
+                nested_actions[key] = nested_action
+        return nested_action
+
+    def create_nested_action(self, parent_type_name: str, field_name: str):
         field_name = to_snake_case(field_name)
         for action, _ in self.web_trigger_actions:
             sig = inspect.signature(action.fn)
@@ -63,9 +82,13 @@ class AppsyncRouter(RouterABC):
                 return nested_action
 
     def find_action_for_field_name(self, field_name: str) -> Optional[Action]:
-        for action, _ in self.web_trigger_actions:
-            action_field_name = action.name[0] + action.name.title()[1:].replace(
-                "_", ""
-            )
-            if action_field_name == field_name:
-                return action
+        actions_by_field_name = self._actions_by_field_name
+        if actions_by_field_name is None:
+            actions_by_field_name = {}
+            for action, _ in self.web_trigger_actions:
+                action_field_name = action.name[0] + action.name.title()[1:].replace(
+                    "_", ""
+                )
+                actions_by_field_name.setdefault(action_field_name, action)
+            self._actions_by_field_name = actions_by_field_name
+        return actions_by_field_name.get(field_name)
@@ -2,7 +2,8 @@ from typing import Optional
 
 from marshy.types import ExternalType
 
-from servey.finder.action_finder_abc import find_actions
+from servey.errors import ServeyError
+from servey.finder.action_finder_abc import get_action_by_name
 from servey.servey_aws.event_handler.event_handler_abc import (
     get_event_handlers,
     EventHandlerABC,
@@ -17,7 +18,9 @@ class Router(RouterABC):
         action_name = event.get("action_name", None)
         if action_name is None:
             return
-        action = next(a for a in find_actions() if a.name == action_name)
+        action = get_action_by_name(action_name)
+        if action is None:
+            raise ServeyError(f"no_such_action:{action_name}")
         handlers = get_event_handlers(action)
         for handler in handlers:
             if handler.is_usable(event, context):
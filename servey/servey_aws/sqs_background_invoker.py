@@ -1,5 +1,4 @@
 import inspect
-import json
 from dataclasses import dataclass, field
 from typing import Optional, Any
 
@@ -13,6 +12,7 @@ from servey.event_channel.background.background_invoker_abc import (
     BackgroundInvokerFactoryABC,
     T,
 )
+from servey.json_codec.json_codec_abc import get_default_json_codec
 from servey.servey_aws import is_lambda_env
 from servey.util import get_servey_main
 
@@ -38,7 +38,9 @@ class SqsSBackgroundInvoker(BackgroundInvokerABC[T]):
         queue_url = self.get_queue_url()
         kwargs = {
             "QueueUrl": queue_url,
-            "MessageBody": json.dumps(self.event_marshaller.dump(event)),
+            "MessageBody": get_default_json_codec()
+            .dumps(self.event_marshaller.dump(event))
+            .decode("utf-8"),
         }
         if delay:
             kwargs["DelaySeconds"] = delay
@@ -8,13 +8,15 @@ Usage:
 """
 
 import argparse
+import asyncio
 import inspect
 import json
 
 from marshy import get_default_marshy_context
 
 from servey.action.util import get_marshaller_for_params
-from servey.finder.action_finder_abc import find_actions
+from servey.executor.timeout import call_with_timeout, run_with_timeout
+from servey.finder.action_finder_abc import get_action_by_name
 
 
 def main():
@@ -24,12 +26,19 @@ def main():
     parser.add_argument("--event", default="{}")
     args = parser.parse_args()
 
-    action = next((a for a in find_actions() if a.name == args.action), None)
+    action = get_action_by_name(args.action)
     if not action:
         raise ValueError(f"no_such_action:{args.action}")
     marshaller = get_marshaller_for_params(action.fn, set())
     kwargs = marshaller.load(json.loads(args.event))
-    result = action.fn(**kwargs)
+    if inspect.iscoroutinefunction(action.fn):
+        result = asyncio.run(
+            run_with_timeout(action.fn(**kwargs), action.timeout, action.name)
+        )
+    else:
+        result = call_with_timeout(
+            lambda: action.fn(**kwargs), action.timeout, action.name
+        )
     return_annotation = inspect.signature(action.fn).return_annotation
     if return_annotation != inspect.Parameter.empty:
         result = get_default_marshy_context().dump(result, return_annotation)
@@ -1,9 +1,8 @@
 from __future__ import annotations
-import json
 import logging
 from dataclasses import dataclass
 from string import Formatter
-from typing import Tuple, Any, Optional, Dict, List, Iterator, Awaitable
+from typing import Tuple, Any, Optional, Dict, List, Iterator
 
 from json_urley import query_str_to_json_obj
 from marshy.marshaller.marshaller_abc import MarshallerABC
@@ -12,16 +11,29 @@ from schemey import Schema
 from schemey.util import filter_none
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from starlette.responses import Response
 from starlette.routing import Route
 
 from servey.action.action import Action
 from servey.action.example import Example
 from servey.action.util import move_ref_items_to_components
+from servey.cache_control.cache_header import CacheHeader
+from servey.executor.executor_abc import ExecutorABC, get_default_executor
+from servey.executor.timeout import ActionTimeoutError, run_with_timeout
+from servey.json_codec.json_codec_abc import get_default_json_codec
 from servey.servey_starlette.action_endpoint.action_endpoint_abc import (
     ActionEndpointABC,
 )
+from servey.servey_starlette.action_endpoint.query_decoder import (
+    QueryDecoder,
+    create_query_decoder,
+)
+from servey.servey_starlette.json_codec_response import JsonCodecResponse
 from servey.trigger.web_trigger import WebTriggerMethod, BODY_METHODS
+from servey.validation.output_validation_policy_abc import OutputValidationPolicyABC
+from servey.validation.output_validation_policy_factory import (
+    get_default_output_validation_policy,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -40,11 +52,22 @@ class ActionEndpoint(ActionEndpointABC):
     params_schema: Optional[Schema]
     result_marshaller: MarshallerABC
     result_schema: Optional[Schema] = None
+    executor: Optional[ExecutorABC] = None
+    output_validation_policy: Optional[OutputValidationPolicyABC] = None
 
     def __post_init__(self):
         self.field_names = {
             fname for _, fname, _, _ in Formatter().parse(self.path) if fname
         }
+        if not self.executor:
+            self.executor = self.action.executor or get_default_executor()
+        if not self.output_validation_policy:
+            self.output_validation_policy = get_default_output_validation_policy()
+        self.query_decoder: Optional[QueryDecoder] = None
+        if self.params_schema and any(m not in BODY_METHODS for m in self.methods):
+            self.query_decoder = create_query_decoder(
+                self.params_schema.schema, self.field_names
+            )
 
     def get_action(self) -> Action:
         return self.action
@@ -62,18 +85,46 @@ class ActionEndpoint(ActionEndpointABC):
     ) -> Response:
         kwargs = await self.parse_request(request)
         kwargs.update(context)
-        result = self.action.fn(**kwargs)
-        if isinstance(result, Awaitable):
-            result = await result
+        validators = await self.get_validators(kwargs)
+        if validators and validators.is_not_modified(
+            request.headers.get("If-None-Match"),
+            request.headers.get("If-Modified-Since"),
+        ):
+            return Response(None, 304, validators.get_validator_http_headers())
+        result = await self.invoke(kwargs)
         # Lazy action resolution would be done here!
         response = self.render_response(result)
+        if validators:
+            response.headers.update(validators.get_validator_http_headers())
         return response
 
+    async def invoke(self, kwargs: Dict[str, Any]) -> Any:
+        """Invoke the action using the executor, responding with a 504 if it does not complete within its timeout"""
+        try:
+            return await run_with_timeout(
+                self.executor.execute(self.action.fn, kwargs),
+                self.action.timeout,
+                self.action.name,
+            )
+        except ActionTimeoutError as e:
+            raise HTTPException(504, "timeout") from e
+
+    async def get_validators(self, kwargs: Dict[str, Any]) -> Optional[CacheHeader]:
+        """Get an etag / updated_at for the kwargs given without invoking the action, if supported"""
+        cache_control = self.action.cache_control
+        if not cache_control or not cache_control.supports_cache_header_for_params():
+            return None
+        return await self.executor.execute(
+            cache_control.get_cache_header_for_params, {"kwargs": kwargs}
+        )
+
     async def parse_request(self, request: Request):
         method = WebTriggerMethod(request.method.lower())
         if method in BODY_METHODS:
             body = await request.body()
-            params: ExternalItemType = json.loads(body) if body else {}
+            params: ExternalItemType = (
+                get_default_json_codec().loads(body) if body else {}
+            )
             if request.path_params:
                 params.update(request.path_params)
             error = next(self.params_schema.iter_errors(params), None)
@@ -85,10 +136,14 @@ class ActionEndpoint(ActionEndpointABC):
                 query_str = request.scope["query_string"] or b""
                 if isinstance(query_str, bytes):
                     query_str = query_str.decode("latin-1")
-                json_obj = query_str_to_json_obj(query_str)
-                if request.path_params:
-                    json_obj.update(request.path_params)
-                json_obj = _fix_strings(json_obj, self.params_schema.schema)
+                json_obj = None
+                if self.query_decoder:
+                    json_obj = self.query_decoder.decode(query_str, request.path_params)
+                if json_obj is None:
+                    json_obj = query_str_to_json_obj(query_str)
+                    if request.path_params:
+                        json_obj.update(request.path_params)
+                    json_obj = _fix_strings(json_obj, self.params_schema.schema)
                 self.params_schema.validate(json_obj)
                 kwargs = self.params_marshaller.load(json_obj)
             except Exception as exc:
@@ -98,11 +153,12 @@ class ActionEndpoint(ActionEndpointABC):
 
     def render_response(self, result: Any):
         result_content = self.result_marshaller.dump(result)
-        if self.result_schema:
-            error = next(self.result_schema.iter_errors(result_content), None)
-            if error:
-                raise HTTPException(500, str(error))
-        return JSONResponse(result_content)
+        error = self.output_validation_policy.check(
+            self.action.name, self.result_schema, result_content
+        )
+        if error:
+            raise HTTPException(500, str(error))
+        return JsonCodecResponse(result_content)
 
     def to_openapi_schema(self, schema: ExternalItemType):
         paths: ExternalItemType = schema["paths"]
@@ -4,7 +4,7 @@ from typing import Dict, Optional, Any
 from marshy.types import ExternalItemType
 from schemey import schema_from_type
 from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from starlette.responses import Response
 from starlette.routing import Route
 
 from servey.action.action import Action
@@ -14,6 +14,7 @@ from servey.servey_starlette.action_endpoint.action_endpoint_abc import (
     ActionEndpointABC,
 )
 from servey.servey_starlette.error_response import ErrorResponse
+from servey.servey_starlette.json_codec_response import JsonCodecResponse
 
 
 @dataclass
@@ -43,7 +44,7 @@ class AuthorizingActionEndpoint(ActionEndpointABC):
     ) -> Response:
         authorization = parse_authorization(self.authorizer, request)
         if not self.get_action().access_control.is_executable(authorization):
-            return JSONResponse({"error": "unauthorized"}, 401)
+            return JsonCodecResponse({"error": "unauthorized"}, 401)
         if self.auth_kwarg_name:
             context[self.auth_kwarg_name] = authorization
         response = await self.action_endpoint.execute_with_context(request, context)
@@ -88,8 +89,14 @@ class AuthorizingActionEndpoint(ActionEndpointABC):
 def parse_authorization(
     authorizer: AuthorizerABC, request: Request
 ) -> Optional[Authorization]:
+    state = request.scope.get("state")
+    if state and "authorization" in state:
+        # Already authorized for this request (e.g.: Once for a whole batch of calls, or by a rate limiter)
+        return state["authorization"]
     token = request.headers.get("Authorization")
     if not token or not token.startswith("Bearer "):
         return
     token = token[7:]
-    return authorizer.authorize(token)
+    authorization = authorizer.authorize(token)
+    request.scope.setdefault("state", {})["authorization"] = authorization
+    return authorization
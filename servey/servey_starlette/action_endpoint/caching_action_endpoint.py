@@ -1,27 +1,69 @@
-from dataclasses import dataclass
-from typing import Dict, Any
+import os
+from dataclasses import dataclass, field
+from time import time
+from typing import Dict, Any, Optional, Hashable, Tuple
 from email.utils import parsedate_to_datetime
 
 from marshy.types import ExternalItemType
 from schemey import schema_from_type
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 from starlette.routing import Route
 
 from servey.action.action import Action
+from servey.cache_control.cache_header import CacheHeader
 from servey.servey_starlette.action_endpoint.action_endpoint_abc import (
     ActionEndpointABC,
 )
+from servey.servey_starlette.action_endpoint.request_key import (
+    get_context_key,
+    get_params_key,
+)
 from servey.servey_starlette.error_response import ErrorResponse
+from servey.util.lru_cache import LruCache
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    headers: Tuple[Tuple[str, str], ...]
+    cache_header: CacheHeader
+
+    def to_response(self) -> Response:
+        return Response(
+            self.body, 200, dict(self.headers), media_type="application/json"
+        )
+
+
+def _cached_response_size(cached_response: CachedResponse) -> int:
+    return len(cached_response.body) + sum(
+        len(k) + len(v) for k, v in cached_response.headers
+    )
+
+
+def create_response_cache() -> LruCache[CachedResponse]:
+    """
+    Create a cache for responses bounded by the number of bytes given in the SERVEY_RESPONSE_CACHE_MAX_BYTES
+    environment variable (Default 64Mb)
+    """
+    max_bytes = int(
+        os.environ.get("SERVEY_RESPONSE_CACHE_MAX_BYTES") or 64 * 1024 * 1024
+    )
+    return LruCache(max_size=max_bytes, sizer=_cached_response_size)
 
 
 @dataclass
 class CachingActionEndpoint(ActionEndpointABC):
     """
-    Wrapper for an endpoint adding http caching
+    Wrapper for an endpoint adding http caching. Responses to GET requests with an expiry (e.g.: From a
+    TtlCacheControl) are also stored in the response cache until they expire, so repeated requests skip
+    executing the action entirely. Private responses are only shared between requests for the same subject.
     """
 
     action_endpoint: ActionEndpointABC
+    response_cache: Optional[LruCache[CachedResponse]] = None
+    # Whether responses are private is determined by the cache control, so is learned from the first response
+    private: Optional[bool] = field(default=None, init=False)
 
     def get_action(self) -> Action:
         return self.action_endpoint.get_action()
@@ -35,25 +77,77 @@ class CachingActionEndpoint(ActionEndpointABC):
     async def execute_with_context(
         self, request: Request, context: Dict[str, Any]
     ) -> Response:
-        response = await self.action_endpoint.execute_with_context(request, context)
-        if response.status_code != 200:
-            return response
-        # noinspection PyUnresolvedReferences
-        cache_header = self.get_action().cache_control.get_cache_header_from_content(
-            response.body
-        )
-        if_none_match = request.headers.get("If-None-Match")
-        if_modified_since = request.headers.get("If-Modified-Since")
-        if if_none_match and cache_header.etag:
-            if cache_header.etag == if_none_match:
-                response = Response(None, 304)
-        elif if_modified_since and cache_header.updated_at:
-            if_modified_since_date = parsedate_to_datetime(if_modified_since)
-            if if_modified_since_date >= cache_header.updated_at:
-                response = Response(None, 304)
+        cache_key = self.get_cache_key(request, context)
+        cached_response = self.get_cached_response(cache_key)
+        if cached_response:
+            response = cached_response.to_response()
+            cache_header = cached_response.cache_header
+        else:
+            response = await self.action_endpoint.execute_with_context(request, context)
+            if response.status_code != 200 or isinstance(response, StreamingResponse):
+                return response
+            # noinspection PyUnresolvedReferences
+            cache_header = (
+                self.get_action().cache_control.get_cache_header_from_content(
+                    response.body
+                )
+            )
+            # The wrapped endpoint may already have set validators without building the full content
+            cache_header = cache_header.with_validators(_get_validators(response))
+            self.store_response(cache_key, response, cache_header)
+        if cache_header.is_not_modified(
+            request.headers.get("If-None-Match"),
+            request.headers.get("If-Modified-Since"),
+        ):
+            response = Response(None, 304)
         response.headers.update(cache_header.get_http_headers())
         return response
 
+    def get_cache_key(
+        self, request: Request, context: Dict[str, Any]
+    ) -> Optional[Tuple[Hashable, Hashable]]:
+        """
+        Get a tuple of public and private keys for the request given, or None if the response should not be
+        stored. Keys are based on the normalized parameters for the request, with private keys also including
+        the authorization subject from the context.
+        """
+        if self.response_cache is None or request.method != "GET":
+            return None
+        context_key = get_context_key(context)
+        if context_key is None:
+            return None
+        public_key = (self.get_action().name, get_params_key(request))
+        return public_key, (public_key, context_key)
+
+    def get_cached_response(
+        self, cache_key: Optional[Tuple[Hashable, Hashable]]
+    ) -> Optional[CachedResponse]:
+        if not cache_key:
+            return None
+        public_key, private_key = cache_key
+        return self.response_cache.get(private_key if self.private else public_key)
+
+    def store_response(
+        self,
+        cache_key: Optional[Tuple[Hashable, Hashable]],
+        response: Response,
+        cache_header: CacheHeader,
+    ):
+        if not cache_key or not cache_header.expire_at:
+            return
+        expire_at = cache_header.expire_at.timestamp()
+        if expire_at <= time():
+            return
+        public_key, private_key = cache_key
+        cached_response = CachedResponse(
+            body=response.body,
+            headers=tuple(response.headers.items()),
+            cache_header=cache_header,
+        )
+        self.private = cache_header.private
+        key = private_key if cache_header.private else public_key
+        self.response_cache.put(key, cached_response, expire_at)
+
     def to_openapi_schema(self, schema: ExternalItemType):
         self.action_endpoint.to_openapi_schema(schema)
 
@@ -72,3 +166,14 @@ class CachingActionEndpoint(ActionEndpointABC):
                     continue
                 responses: Dict = path_method["responses"]
                 responses["304"] = {"description": "not_modified", "content": {}}
+
+
+def _get_validators(response: Response) -> Optional[CacheHeader]:
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return None
+    return CacheHeader(
+        etag=etag,
+        updated_at=parsedate_to_datetime(last_modified) if last_modified else None,
+    )
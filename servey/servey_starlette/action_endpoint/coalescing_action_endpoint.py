@@ -0,0 +1,85 @@
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Hashable, Tuple
+
+from marshy.types import ExternalItemType
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from servey.action.action import Action
+from servey.servey_starlette.action_endpoint.action_endpoint_abc import (
+    ActionEndpointABC,
+)
+from servey.servey_starlette.action_endpoint.request_key import (
+    get_context_key,
+    get_params_key,
+)
+from servey.util.single_flight import SingleFlight
+
+
+@dataclass
+class CoalescingActionEndpoint(ActionEndpointABC):
+    """
+    Wrapper for an endpoint which coalesces identical concurrent GET requests, so that a burst of requests for the
+    same resource results in a single execution of the action, with the response content shared between them
+    (Each request gets its own response object, so headers set on one do not leak into the others). Requests
+    are only considered identical if their parameters, authorization subject and scopes, and conditional headers
+    all match.
+    """
+
+    action_endpoint: ActionEndpointABC
+    single_flight: SingleFlight = field(default_factory=SingleFlight)
+
+    def get_action(self) -> Action:
+        return self.action_endpoint.get_action()
+
+    def get_route(self) -> Route:
+        route = self.action_endpoint.get_route()
+        return Route(
+            route.path, name=route.name, endpoint=self.execute, methods=route.methods
+        )
+
+    async def execute_with_context(
+        self, request: Request, context: Dict[str, Any]
+    ) -> Response:
+        key = self.get_coalesce_key(request, context)
+        if key is None:
+            return await self.action_endpoint.execute_with_context(request, context)
+        body, status_code, media_type, raw_headers = await self.single_flight.run_async(
+            key, lambda: self._execute_shared(request, context)
+        )
+        response = Response(body, status_code, media_type=media_type)
+        response.raw_headers = list(raw_headers)
+        return response
+
+    async def _execute_shared(
+        self, request: Request, context: Dict[str, Any]
+    ) -> Tuple[bytes, int, Optional[str], Tuple[Tuple[bytes, bytes], ...]]:
+        """Execute the wrapped endpoint, returning only the immutable parts of the response for sharing"""
+        response = await self.action_endpoint.execute_with_context(request, context)
+        return (
+            response.body,
+            response.status_code,
+            response.media_type,
+            tuple(response.raw_headers),
+        )
+
+    def get_coalesce_key(
+        self, request: Request, context: Dict[str, Any]
+    ) -> Optional[Hashable]:
+        """Get the key for requests which may share a response, or None if the request should not be coalesced"""
+        if request.method != "GET":
+            return None
+        context_key = get_context_key(context)
+        if context_key is None:
+            return None
+        return (
+            self.get_action().name,
+            get_params_key(request),
+            context_key,
+            request.headers.get("If-None-Match"),
+            request.headers.get("If-Modified-Since"),
+        )
+
+    def to_openapi_schema(self, schema: ExternalItemType):
+        self.action_endpoint.to_openapi_schema(schema)
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from typing import Dict, Any
+
+from marshy.types import ExternalItemType
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from servey.action.action import Action
+from servey.executor.concurrency_limiter import (
+    ConcurrencyLimiter,
+    ConcurrencyLimitError,
+)
+from servey.servey_starlette.action_endpoint.action_endpoint_abc import (
+    ActionEndpointABC,
+)
+from servey.servey_starlette.json_codec_response import JsonCodecResponse
+
+
+@dataclass
+class ConcurrencyLimitingActionEndpoint(ActionEndpointABC):
+    """
+    Wrapper for an endpoint bounding the number of concurrent executions of its action. Requests beyond the limit
+    (And queue) are rejected immediately with a Retry-After header rather than tying up the server.
+    """
+
+    action_endpoint: ActionEndpointABC
+    limiter: ConcurrencyLimiter
+
+    def get_action(self) -> Action:
+        return self.action_endpoint.get_action()
+
+    def get_route(self) -> Route:
+        route = self.action_endpoint.get_route()
+        return Route(
+            route.path, name=route.name, endpoint=self.execute, methods=route.methods
+        )
+
+    async def execute_with_context(
+        self, request: Request, context: Dict[str, Any]
+    ) -> Response:
+        try:
+            async with self.limiter.limit_concurrency():
+                return await self.action_endpoint.execute_with_context(request, context)
+        except ConcurrencyLimitError as e:
+            return JsonCodecResponse(
+                {"error": "overloaded"},
+                e.limit.status_code,
+                {"Retry-After": str(e.limit.retry_after)},
+            )
+
+    def to_openapi_schema(self, schema: ExternalItemType):
+        self.action_endpoint.to_openapi_schema(schema)
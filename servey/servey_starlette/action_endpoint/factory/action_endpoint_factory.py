@@ -6,7 +6,11 @@ from marshy import MarshyContext, get_default_marshy_context
 from schemey import get_default_schema_context, SchemaContext
 
 from servey.action.action import Action
-from servey.action.util import get_marshaller_for_params, get_schema_for_params
+from servey.action.util import (
+    get_marshaller_for_params,
+    get_schema_for_params,
+    get_stream_item_type,
+)
 from servey.errors import ServeyError
 from servey.servey_starlette.action_endpoint.action_endpoint import ActionEndpoint
 from servey.servey_starlette.action_endpoint.action_endpoint_abc import (
@@ -15,7 +19,13 @@ from servey.servey_starlette.action_endpoint.action_endpoint_abc import (
 from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory_abc import (
     ActionEndpointFactoryABC,
 )
+from servey.servey_starlette.action_endpoint.streaming_action_endpoint import (
+    StreamFormat,
+    StreamingActionEndpoint,
+)
 from servey.trigger.web_trigger import WebTrigger
+from servey.validation.compiled_schema import compile_schema
+from servey.validation.output_validation_policy_abc import OutputValidationPolicyABC
 
 
 @dataclass
@@ -26,7 +36,10 @@ class ActionEndpointFactory(ActionEndpointFactoryABC):
     )
     schema_context: SchemaContext = field(default_factory=get_default_schema_context)
     validate_output: bool = True
+    output_validation_policy: Optional[OutputValidationPolicyABC] = None
     path_pattern: str = "/actions/{action_name}"
+    # Format for actions returning iterators, where the client does not request one explicitly
+    stream_format: StreamFormat = StreamFormat.JSON_ARRAY
 
     def create(
         self,
@@ -51,21 +64,32 @@ class ActionEndpointFactory(ActionEndpointFactoryABC):
             result_type = inspect.signature(action.fn).return_annotation
             if result_type == inspect.Signature.empty:
                 raise ServeyError(f"missing_return_type:{action.fn}")
-            endpoint = ActionEndpoint(
+            kwargs = {}
+            item_type = get_stream_item_type(result_type)
+            if item_type:
+                # Iterators are streamed, so marshalling and validation are per item
+                result_type = item_type
+                endpoint_type = StreamingActionEndpoint
+                kwargs["stream_format"] = self.stream_format
+            else:
+                endpoint_type = ActionEndpoint
+            endpoint = endpoint_type(
                 action=action,
                 path=path,
                 methods=tuple(methods),
                 params_marshaller=get_marshaller_for_params(
                     action.fn, skip_args, self.marshaller_context
                 ),
-                params_schema=get_schema_for_params(
-                    action.fn, skip_args, self.schema_context
+                params_schema=compile_schema(
+                    get_schema_for_params(action.fn, skip_args, self.schema_context)
                 ),
                 result_marshaller=self.marshaller_context.get_marshaller(result_type),
                 result_schema=(
-                    self.schema_context.schema_from_type(result_type)
+                    compile_schema(self.schema_context.schema_from_type(result_type))
                     if self.validate_output
                     else None
                 ),
+                output_validation_policy=self.output_validation_policy,
+                **kwargs,
             )
             return endpoint
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Set
 
 from servey.action.action import Action
@@ -7,16 +7,22 @@ from servey.servey_starlette.action_endpoint.action_endpoint_abc import (
 )
 from servey.servey_starlette.action_endpoint.caching_action_endpoint import (
     CachingActionEndpoint,
+    CachedResponse,
+    create_response_cache,
 )
 from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory_abc import (
     ActionEndpointFactoryABC,
 )
+from servey.util.lru_cache import LruCache
 
 
 @dataclass
 class CachingActionEndpointFactory(ActionEndpointFactoryABC):
     priority: int = 150
     skip: bool = False
+    response_cache: Optional[LruCache[CachedResponse]] = field(
+        default_factory=create_response_cache
+    )
 
     def create(
         self,
@@ -28,7 +34,7 @@ class CachingActionEndpointFactory(ActionEndpointFactoryABC):
             return
         action_endpoint = self._get_wrapped_endpoint(action, skip_args, factories)
         if action_endpoint:
-            return CachingActionEndpoint(action_endpoint)
+            return CachingActionEndpoint(action_endpoint, self.response_cache)
 
     def _get_wrapped_endpoint(
         self,
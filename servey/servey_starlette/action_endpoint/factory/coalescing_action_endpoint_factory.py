@@ -0,0 +1,65 @@
+import inspect
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+
+from servey.action.action import Action
+from servey.action.util import get_stream_item_type
+from servey.servey_starlette.action_endpoint.action_endpoint_abc import (
+    ActionEndpointABC,
+)
+from servey.servey_starlette.action_endpoint.coalescing_action_endpoint import (
+    CoalescingActionEndpoint,
+)
+from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory_abc import (
+    ActionEndpointFactoryABC,
+)
+from servey.trigger.web_trigger import WebTrigger, WebTriggerMethod
+from servey.util.single_flight import SingleFlight
+
+
+@dataclass
+class CoalescingActionEndpointFactory(ActionEndpointFactoryABC):
+    """
+    Factory wrapping endpoints for actions which opted in to coalescing (action.coalesce) and are exposed over GET.
+    Sits outside the caching layer, so that concurrent misses for the same resource share a single execution.
+    """
+
+    priority: int = 175
+    skip: bool = False
+    single_flight: SingleFlight = field(default_factory=SingleFlight)
+
+    def create(
+        self,
+        action: Action,
+        skip_args: Set[str],
+        factories: List[ActionEndpointFactoryABC],
+    ) -> Optional[ActionEndpointABC]:
+        if self.skip or not action.coalesce or not _has_get_trigger(action):
+            return
+        if get_stream_item_type(inspect.signature(action.fn).return_annotation):
+            return  # A stream can only be consumed once, so can't be shared
+        action_endpoint = self._get_wrapped_endpoint(action, skip_args, factories)
+        if action_endpoint:
+            return CoalescingActionEndpoint(action_endpoint, self.single_flight)
+
+    def _get_wrapped_endpoint(
+        self,
+        action: Action,
+        skip_args: Set[str],
+        factories: List[ActionEndpointFactoryABC],
+    ) -> Optional[ActionEndpointABC]:
+        self.skip = True
+        try:
+            for factory in factories:
+                action_endpoint = factory.create(action, skip_args, factories)
+                if action_endpoint:
+                    return action_endpoint
+        finally:
+            self.skip = False
+
+
+def _has_get_trigger(action: Action) -> bool:
+    return any(
+        isinstance(t, WebTrigger) and t.method == WebTriggerMethod.GET
+        for t in action.triggers
+    )
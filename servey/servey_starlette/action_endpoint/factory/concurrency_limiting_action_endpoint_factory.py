@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from typing import List, Optional, Set
+
+from servey.action.action import Action
+from servey.executor.concurrency_limiter import get_concurrency_limiter
+from servey.servey_starlette.action_endpoint.action_endpoint_abc import (
+    ActionEndpointABC,
+)
+from servey.servey_starlette.action_endpoint.concurrency_limiting_action_endpoint import (
+    ConcurrencyLimitingActionEndpoint,
+)
+from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory_abc import (
+    ActionEndpointFactoryABC,
+)
+
+
+@dataclass
+class ConcurrencyLimitingActionEndpointFactory(ActionEndpointFactoryABC):
+    """
+    Factory wrapping endpoints for actions with a concurrency limit. Sits inside the caching layer, so responses
+    from the cache do not require a slot.
+    """
+
+    priority: int = 125
+    skip: bool = False
+
+    def create(
+        self,
+        action: Action,
+        skip_args: Set[str],
+        factories: List[ActionEndpointFactoryABC],
+    ) -> Optional[ActionEndpointABC]:
+        if self.skip:
+            return
+        limiter = get_concurrency_limiter(action)
+        if not limiter:
+            return
+        action_endpoint = self._get_wrapped_endpoint(action, skip_args, factories)
+        if action_endpoint:
+            return ConcurrencyLimitingActionEndpoint(action_endpoint, limiter)
+
+    def _get_wrapped_endpoint(
+        self,
+        action: Action,
+        skip_args: Set[str],
+        factories: List[ActionEndpointFactoryABC],
+    ) -> Optional[ActionEndpointABC]:
+        self.skip = True
+        try:
+            for factory in factories:
+                action_endpoint = factory.create(action, skip_args, factories)
+                if action_endpoint:
+                    return action_endpoint
+        finally:
+            self.skip = False
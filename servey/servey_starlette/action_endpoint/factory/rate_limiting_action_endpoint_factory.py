@@ -0,0 +1,54 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+
+from servey.action.action import Action
+from servey.security.authorizer.authorizer_abc import AuthorizerABC
+from servey.security.authorizer.authorizer_factory_abc import get_default_authorizer
+from servey.servey_starlette.action_endpoint.action_endpoint_abc import (
+    ActionEndpointABC,
+)
+from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory_abc import (
+    ActionEndpointFactoryABC,
+)
+from servey.servey_starlette.action_endpoint.rate_limiting_action_endpoint import (
+    RateLimitingActionEndpoint,
+)
+
+
+@dataclass
+class RateLimitingActionEndpointFactory(ActionEndpointFactoryABC):
+    """
+    Factory wrapping endpoints for actions with a rate limit. Sits outside the authorization layer, so rejected
+    requests are not checked for access, and the parsed authorization is reused.
+    """
+
+    priority: int = 225
+    authorizer: AuthorizerABC = field(default_factory=get_default_authorizer)
+    skip: bool = False
+
+    def create(
+        self,
+        action: Action,
+        skip_args: Set[str],
+        factories: List[ActionEndpointFactoryABC],
+    ) -> Optional[ActionEndpointABC]:
+        if self.skip or not action.rate_limit:
+            return
+        action_endpoint = self._get_wrapped_endpoint(action, skip_args, factories)
+        if action_endpoint:
+            return RateLimitingActionEndpoint(action_endpoint, self.authorizer)
+
+    def _get_wrapped_endpoint(
+        self,
+        action: Action,
+        skip_args: Set[str],
+        factories: List[ActionEndpointFactoryABC],
+    ) -> Optional[ActionEndpointABC]:
+        self.skip = True
+        try:
+            for factory in factories:
+                action_endpoint = factory.create(action, skip_args, factories)
+                if action_endpoint:
+                    return action_endpoint
+        finally:
+            self.skip = False
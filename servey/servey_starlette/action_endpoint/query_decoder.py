@@ -0,0 +1,105 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Set, Mapping
+from urllib.parse import parse_qsl
+
+from marshy.types import ExternalItemType, ExternalType
+
+Coercer = Callable[[str], ExternalType]
+
+
+@dataclass(frozen=True)
+class QueryDecoder:
+    """
+    Plan for decoding query strings for an endpoint, built once from the params schema. Each scalar parameter
+    maps directly to a coercer, so flat query strings avoid the generic json-urley pipeline. Returns None
+    for any query string the plan cannot handle (Nested parameters, type hints, repeated keys), in which case
+    the caller should fall back to json-urley.
+    """
+
+    coercers: Dict[str, Coercer]
+
+    def decode(
+        self, query_str: str, path_params: Optional[Mapping[str, ExternalType]]
+    ) -> Optional[ExternalItemType]:
+        coercers = self.coercers
+        result = {}
+        if query_str:
+            for key, value in parse_qsl(query_str, keep_blank_values=True):
+                coercer = coercers.get(key)
+                if coercer is None or key in result:
+                    return None
+                result[key] = coercer(value)
+        if path_params:
+            for key, value in path_params.items():
+                if isinstance(value, str):
+                    value = coercers[key](value)
+                result[key] = value
+        return result
+
+
+def create_query_decoder(
+    params_schema: ExternalItemType, path_param_names: Set[str]
+) -> Optional[QueryDecoder]:
+    """Create a decoder for the schema given, or None if no request could use one"""
+    properties = params_schema.get("properties")
+    if params_schema.get("type") != "object" or not isinstance(properties, dict):
+        return None
+    coercers = {}
+    for key, property_schema in properties.items():
+        if "." in key or "~" in key:
+            continue  # Keys require escaping
+        coercer = _get_coercer(property_schema)
+        if coercer:
+            coercers[key] = coercer
+    if not coercers or any(p not in coercers for p in path_param_names):
+        return None
+    return QueryDecoder(coercers)
+
+
+def _get_coercer(schema: ExternalItemType) -> Optional[Coercer]:
+    nullable = False
+    any_of = schema.get("anyOf")
+    if any_of:
+        non_nulls = [s for s in any_of if s != {"type": "null"}]
+        if len(non_nulls) != 1 or len(any_of) != 2:
+            return None
+        nullable = True
+        schema = non_nulls[0]
+    enum = schema.get("enum")
+    if enum is not None:
+        if not all(isinstance(e, str) for e in enum):
+            return None
+        return _nullable_str if nullable else _str
+    type_ = schema.get("type")
+    if type_ == "string":
+        return _nullable_str if nullable else _str
+    if type_ in ("boolean", "integer", "number"):
+        return _typed_value
+    return None
+
+
+def _str(value: str) -> str:
+    return value
+
+
+def _nullable_str(value: str) -> Optional[str]:
+    return None if value == "null" else value
+
+
+def _typed_value(value: str) -> ExternalType:
+    """Json urley type inference for values without type hints"""
+    if value == "null":
+        return None
+    if value == "true":
+        return True
+    if value == "false":
+        return False
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    return value
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from typing import Dict, Any
+
+from marshy.types import ExternalItemType
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from servey.action.action import Action
+from servey.rate_limit.rate_limiter import (
+    RateLimitError,
+    check_rate_limit_async,
+)
+from servey.security.authorizer.authorizer_abc import AuthorizerABC
+from servey.servey_starlette.action_endpoint.action_endpoint_abc import (
+    ActionEndpointABC,
+)
+from servey.servey_starlette.action_endpoint.authorizing_action_endpoint import (
+    parse_authorization,
+)
+from servey.servey_starlette.json_codec_response import JsonCodecResponse
+
+
+@dataclass
+class RateLimitingActionEndpoint(ActionEndpointABC):
+    """
+    Wrapper for an endpoint applying the rate limit of its action, keyed by the subject of the authorization for the
+    request. Requests exceeding the limit are rejected with a Retry-After header before any other work is done.
+    """
+
+    action_endpoint: ActionEndpointABC
+    authorizer: AuthorizerABC
+
+    def get_action(self) -> Action:
+        return self.action_endpoint.get_action()
+
+    def get_route(self) -> Route:
+        route = self.action_endpoint.get_route()
+        return Route(
+            route.path, name=route.name, endpoint=self.execute, methods=route.methods
+        )
+
+    async def execute_with_context(
+        self, request: Request, context: Dict[str, Any]
+    ) -> Response:
+        authorization = parse_authorization(self.authorizer, request)
+        try:
+            await check_rate_limit_async(self.get_action(), authorization)
+        except RateLimitError as e:
+            return JsonCodecResponse(
+                {"error": "rate_limited"},
+                e.status_code,
+                {"Retry-After": str(e.retry_after)},
+            )
+        return await self.action_endpoint.execute_with_context(request, context)
+
+    def to_openapi_schema(self, schema: ExternalItemType):
+        self.action_endpoint.to_openapi_schema(schema)
@@ -0,0 +1,29 @@
+from typing import Any, Dict, Hashable, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from starlette.requests import Request
+
+from servey.security.authorization import Authorization
+
+
+def get_params_key(request: Request) -> Hashable:
+    """Get a key for the query and path parameters of the request given, independent of their order"""
+    query_string = request.scope.get("query_string") or b""
+    if isinstance(query_string, bytes):
+        query_string = query_string.decode("latin-1")
+    params = tuple(sorted(parse_qsl(query_string, keep_blank_values=True)))
+    path_params = tuple(sorted((request.path_params or {}).items()))
+    return params, path_params
+
+
+def get_context_key(context: Dict[str, Any]) -> Optional[Tuple[Hashable, ...]]:
+    """
+    Get a key for the context given, based on the subject and scopes of any authorization within it. Returns None
+    if the context contains anything else, since we can't tell how a result depends on it.
+    """
+    key = []
+    for name, value in sorted(context.items()):
+        if not isinstance(value, Authorization):
+            return None
+        key.append((name, value.subject_id, value.scopes))
+    return tuple(key)
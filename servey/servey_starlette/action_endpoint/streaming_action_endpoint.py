@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Iterator, Union
+
+from marshy.types import ExternalItemType
+from schemey.util import filter_none
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+
+from servey.action.util import move_ref_items_to_components
+from servey.json_codec.json_codec_abc import get_default_json_codec
+from servey.servey_starlette.action_endpoint.action_endpoint import ActionEndpoint
+
+
+class StreamFormat(Enum):
+    JSON_ARRAY = "application/json"
+    NDJSON = "application/x-ndjson"
+
+
+@dataclass
+class StreamingActionEndpoint(ActionEndpoint):
+    """
+    Endpoint for actions returning an Iterator / AsyncIterator. Items are marshalled (Using the result marshaller
+    and schema, which are for the item type) and written as they are produced, so the full result is never held in
+    memory. The response is newline delimited json if requested in the Accept header, and an incrementally written
+    json array otherwise.
+    """
+
+    stream_format: StreamFormat = StreamFormat.JSON_ARRAY
+
+    async def execute_with_context(
+        self, request: Request, context: Dict[str, Any]
+    ) -> Response:
+        kwargs = await self.parse_request(request)
+        kwargs.update(context)
+        validators = await self.get_validators(kwargs)
+        if validators and validators.is_not_modified(
+            request.headers.get("If-None-Match"),
+            request.headers.get("If-Modified-Since"),
+        ):
+            return Response(None, 304, validators.get_validator_http_headers())
+        result = await self.invoke(kwargs)
+        stream_format = self.get_stream_format(request)
+        response = StreamingResponse(
+            self.render_stream(result, stream_format), media_type=stream_format.value
+        )
+        if validators:
+            response.headers.update(validators.get_validator_http_headers())
+        return response
+
+    def get_stream_format(self, request: Request) -> StreamFormat:
+        accept = request.headers.get("Accept") or ""
+        if StreamFormat.NDJSON.value in accept:
+            return StreamFormat.NDJSON
+        return self.stream_format
+
+    def render_stream(
+        self, items: Union[Iterator, AsyncIterator], stream_format: StreamFormat
+    ) -> Union[Iterator[bytes], AsyncIterator[bytes]]:
+        if hasattr(items, "__aiter__"):
+            return self._render_async_stream(items, stream_format)
+        # Starlette iterates sync iterators in a thread pool, so slow generators do not block the event loop
+        return self._render_stream(items, stream_format)
+
+    def _render_stream(
+        self, items: Iterator, stream_format: StreamFormat
+    ) -> Iterator[bytes]:
+        array = stream_format == StreamFormat.JSON_ARRAY
+        if array:
+            yield b"["
+        first = True
+        for item in items:
+            yield self.render_item(item, stream_format, first)
+            first = False
+        if array:
+            yield b"]"
+
+    async def _render_async_stream(
+        self, items: AsyncIterator, stream_format: StreamFormat
+    ) -> AsyncIterator[bytes]:
+        array = stream_format == StreamFormat.JSON_ARRAY
+        if array:
+            yield b"["
+        first = True
+        async for item in items:
+            yield self.render_item(item, stream_format, first)
+            first = False
+        if array:
+            yield b"]"
+
+    def render_item(self, item: Any, stream_format: StreamFormat, first: bool) -> bytes:
+        content = self.result_marshaller.dump(item)
+        error = self.output_validation_policy.check(
+            self.action.name, self.result_schema, content
+        )
+        if error:
+            # Headers have already been sent, so the best we can do is abort the stream
+            raise error
+        encoded = get_default_json_codec().dumps(content)
+        if stream_format == StreamFormat.NDJSON:
+            return encoded + b"\n"
+        return encoded if first else b"," + encoded
+
+    def response_to_openapi_schema(
+        self, responses: ExternalItemType, components: ExternalItemType
+    ):
+        schema = self.result_schema.schema
+        schema = move_ref_items_to_components(schema, schema, components)
+        array_content = {"schema": {"type": "array", "items": schema}}
+        if self.action.examples:
+            array_content["examples"] = {
+                e.name: filter_none({"summary": e.description, "value": e.result})
+                for e in self.action.examples
+                if e.include_in_schema
+            }
+        responses["200"] = {
+            "description": "Successful Response",
+            "content": {
+                StreamFormat.JSON_ARRAY.value: array_content,
+                StreamFormat.NDJSON.value: {"schema": schema},
+            },
+        }
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+
+from marshy.types import ExternalType
+from starlette.requests import Request
+from starlette.responses import Response
+
+from servey.json_codec.json_codec_abc import get_default_json_codec
+from servey.servey_starlette.middleware.content_encoder import (
+    gzip_encoder,
+    select_encoder,
+)
+from servey.util import secure_hash_content
+
+_GZIP_ENCODERS = (gzip_encoder(9),)
+
+
+@dataclass(frozen=True)
+class EncodedDocument:
+    """
+    Json document (e.g.: An OpenAPI schema) which does not change for the life of the process, encoded and
+    compressed once so that serving it is just writing bytes.
+    """
+
+    content: bytes
+    gzip_content: bytes
+    etag: str
+    media_type: str = "application/json"
+
+    @staticmethod
+    def from_json(document: ExternalType) -> "EncodedDocument":
+        content = get_default_json_codec().dumps(document)
+        return EncodedDocument(
+            content=content,
+            gzip_content=_GZIP_ENCODERS[0].compress(content),
+            etag=f'"{secure_hash_content(content)}"',
+        )
+
+    def to_response(self, request: Request) -> Response:
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if request.headers.get("If-None-Match") == self.etag:
+            return Response(None, 304, headers)
+        if select_encoder(request.headers.get("Accept-Encoding"), _GZIP_ENCODERS):
+            headers["Content-Encoding"] = "gzip"
+            return Response(self.gzip_content, 200, headers, self.media_type)
+        return Response(self.content, 200, headers, self.media_type)
@@ -7,6 +7,7 @@ from marshy.marshaller.marshaller_abc import MarshallerABC
 
 from servey.event_channel.websocket.event_filter_abc import EventFilterABC
 from servey.event_channel.websocket.websocket_sender import WebsocketSenderABC, T
+from servey.json_codec.json_codec_abc import get_default_json_codec
 from servey.servey_starlette.event_channel.local import get_connections_by_name
 
 LOGGER = logging.getLogger(__name__)
@@ -27,14 +28,19 @@ class StarletteWebsocketSender(WebsocketSenderABC[T]):
         if not connections:
             return
         loop = asyncio.get_event_loop()
-        json_event = self.event_marshaller.dump(event)
+        # Encode once for all connections
+        text = (
+            get_default_json_codec()
+            .dumps(self.event_marshaller.dump(event))
+            .decode("utf-8")
+        )
         for connection in connections.connections:
             # noinspection PyBroadException
             try:
                 if not self.event_filter or self.event_filter.should_publish(
                     event, connection.authorization
                 ):
-                    sending = connection.websocket.send_json(json_event)
+                    sending = connection.websocket.send_text(text)
                     loop.create_task(sending)
             except Exception:
                 LOGGER.exception("failed_to_send_data")
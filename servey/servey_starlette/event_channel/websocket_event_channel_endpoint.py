@@ -1,4 +1,3 @@
-import json
 import logging
 from uuid import uuid4
 
@@ -6,6 +5,7 @@ from starlette.endpoints import WebSocketEndpoint
 from starlette.websockets import WebSocket
 
 from servey.errors import ServeyError
+from servey.json_codec.json_codec_abc import get_default_json_codec
 from servey.security.authorizer.authorizer_factory_abc import get_default_authorizer
 from servey.servey_starlette.event_channel.local import (
     LocalConnection,
@@ -47,7 +47,7 @@ class WebsocketEventChannelEndpoint(WebSocketEndpoint):
             )
 
     async def on_receive(self, websocket: WebSocket, data: str) -> None:
-        event = json.loads(data)
+        event = get_default_json_codec().loads(data)
         type_ = event["type"]
         connection_id = websocket.path_params["connection_id"]
         connection = get_connections_by_id().get(connection_id)
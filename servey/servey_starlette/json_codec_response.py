@@ -0,0 +1,28 @@
+from typing import Any, Optional, Mapping
+
+from starlette.background import BackgroundTask
+from starlette.responses import JSONResponse
+
+from servey.json_codec.json_codec_abc import JsonCodecABC, get_default_json_codec
+
+
+class JsonCodecResponse(JSONResponse):
+    """
+    JSON response encoded using the json codec rather than the standard library
+    """
+
+    # pylint: disable=R0913,R0917
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        json_codec: Optional[JsonCodecABC] = None,
+    ):
+        self.json_codec = json_codec or get_default_json_codec()
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        return self.json_codec.dumps(content)
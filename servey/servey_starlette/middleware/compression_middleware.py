@@ -0,0 +1,131 @@
+from dataclasses import dataclass, field
+from typing import Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from servey.servey_starlette.middleware.content_encoder import (
+    ContentEncoder,
+    StreamCompressor,
+    select_encoder,
+)
+from servey.util.lru_cache import LruCache
+
+
+def _compressed_size(entry: Tuple[bytes, bytes]) -> int:
+    # The raw body is retained for comparison, so counts towards the size as well as the compressed body
+    return len(entry[0]) + len(entry[1])
+
+
+def create_compressed_cache(max_bytes: int) -> LruCache[Tuple[bytes, bytes]]:
+    return LruCache(max_size=max_bytes, sizer=_compressed_size)
+
+
+@dataclass
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing responses using the best encoding accepted by the client. Responses are only
+    compressed if their content type matches, and (If not streamed) they exceed the minimum size. Compressed bodies
+    of responses with an ETag are cached, so identical responses (e.g.: From the response cache) are not
+    recompressed on every request.
+    """
+
+    app: ASGIApp
+    encoders: Sequence[ContentEncoder]
+    minimum_size: int = 500
+    content_types: Tuple[str, ...] = ("application/json", "text/")
+    compressed_cache: Optional[LruCache[Tuple[bytes, bytes]]] = field(
+        default_factory=lambda: create_compressed_cache(16 * 1024 * 1024)
+    )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            encoder = select_encoder(
+                Headers(scope=scope).get("accept-encoding"), self.encoders
+            )
+            if encoder:
+                responder = _CompressionResponder(self, encoder, send)
+                await self.app(scope, receive, responder.send)
+                return
+        await self.app(scope, receive, send)
+
+    def is_compressible(self, status: int, headers: Headers) -> bool:
+        if status < 200 or status in (204, 304) or "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type") or ""
+        return content_type.startswith(self.content_types)
+
+    def compress(
+        self, encoder: ContentEncoder, body: bytes, etag: Optional[str]
+    ) -> bytes:
+        if not etag or self.compressed_cache is None:
+            return encoder.compress(body)
+        key = (encoder.name, etag)
+        entry = self.compressed_cache.get(key)
+        # The body is compared in case of etags which are not unique between resources. (The cached body is
+        # usually the same object as the body from the response cache, so this is cheap)
+        if entry and entry[0] == body:
+            return entry[1]
+        compressed = encoder.compress(body)
+        self.compressed_cache.put(key, (body, compressed))
+        return compressed
+
+
+@dataclass
+class _CompressionResponder:
+    middleware: CompressionMiddleware
+    encoder: ContentEncoder
+    send_: Send
+    start_message: Optional[Message] = None
+    passthrough: bool = False
+    stream_compressor: Optional[StreamCompressor] = None
+
+    async def send(self, message: Message):
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Headers are not sent until we know whether we will compress the body
+            self.start_message = message
+        elif message_type != "http.response.body" or self.passthrough:
+            await self.send_(message)
+        elif self.stream_compressor:
+            await self.send_stream_body(message)
+        else:
+            await self.send_first_body(message)
+
+    async def send_first_body(self, message: Message):
+        start_message = self.start_message
+        # Copied, as the raw headers may belong to a response object which is reused
+        headers = MutableHeaders(raw=list(start_message["headers"]))
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not self.middleware.is_compressible(start_message["status"], headers) or (
+            not more_body and len(body) < self.middleware.minimum_size
+        ):
+            self.passthrough = True
+            await self.send_(start_message)
+            await self.send_(message)
+            return
+        start_message = dict(start_message, headers=headers.raw)
+        headers["Content-Encoding"] = self.encoder.name
+        headers.add_vary_header("Accept-Encoding")
+        if more_body:
+            del headers["Content-Length"]
+            self.stream_compressor = self.encoder.create_stream_compressor()
+            await self.send_(start_message)
+            await self.send_stream_body(message)
+            return
+        body = self.middleware.compress(self.encoder, body, headers.get("etag"))
+        headers["Content-Length"] = str(len(body))
+        await self.send_(start_message)
+        await self.send_({"type": "http.response.body", "body": body})
+
+    async def send_stream_body(self, message: Message):
+        more_body = message.get("more_body", False)
+        body = self.stream_compressor.compress(message.get("body", b""))
+        if not more_body:
+            body += self.stream_compressor.flush()
+        elif not body:
+            return
+        await self.send_(
+            {"type": "http.response.body", "body": body, "more_body": more_body}
+        )
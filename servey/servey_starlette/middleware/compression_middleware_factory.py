@@ -0,0 +1,55 @@
+import os
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from starlette.middleware import Middleware
+
+from servey.servey_starlette.middleware.compression_middleware import (
+    CompressionMiddleware,
+    create_compressed_cache,
+)
+from servey.servey_starlette.middleware.content_encoder import (
+    ContentEncoder,
+    get_available_encoders,
+)
+from servey.servey_starlette.middleware.middleware_factory_abc import (
+    MiddlewareFactoryABC,
+)
+
+
+@dataclass
+class CompressionMiddlewareFactory(MiddlewareFactoryABC):
+    """
+    Factory for middleware compressing responses. gzip is always available, with brotli and zstd used in preference
+    when installed. Compression may be disabled by setting the SERVEY_COMPRESSION environment variable to 0.
+    """
+
+    enabled: bool = field(
+        default_factory=lambda: os.environ.get("SERVEY_COMPRESSION") != "0"
+    )
+    encoders: List[ContentEncoder] = field(default_factory=get_available_encoders)
+    minimum_size: int = field(
+        default_factory=lambda: int(
+            os.environ.get("SERVEY_COMPRESSION_MINIMUM_SIZE") or "500"
+        )
+    )
+    content_types: Tuple[str, ...] = (
+        "application/json",
+        "application/x-ndjson",
+        "application/javascript",
+        "image/svg+xml",
+        "text/",
+    )
+    compressed_cache_max_bytes: int = 16 * 1024 * 1024
+
+    def create(self) -> Optional[Middleware]:
+        if self.enabled and self.encoders:
+            return Middleware(
+                CompressionMiddleware,
+                encoders=tuple(self.encoders),
+                minimum_size=self.minimum_size,
+                content_types=self.content_types,
+                compressed_cache=create_compressed_cache(
+                    self.compressed_cache_max_bytes
+                ),
+            )
@@ -0,0 +1,106 @@
+import gzip
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence
+
+
+class StreamCompressor(Protocol):
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk of data, returning any output available so far"""
+
+    def flush(self) -> bytes:
+        """Finish the stream, returning any remaining output"""
+
+
+@dataclass(frozen=True)
+class ContentEncoder:
+    """Http content encoding (e.g.: gzip), with functions for compressing a complete body or a stream of chunks"""
+
+    name: str
+    compress: Callable[[bytes], bytes]
+    create_stream_compressor: Callable[[], StreamCompressor]
+
+
+def gzip_encoder(level: int = 6) -> ContentEncoder:
+    return ContentEncoder(
+        name="gzip",
+        compress=lambda body: gzip.compress(body, level, mtime=0),
+        create_stream_compressor=lambda: zlib.compressobj(level, zlib.DEFLATED, 31),
+    )
+
+
+def brotli_encoder(quality: int = 4) -> Optional[ContentEncoder]:
+    try:
+        import brotli  # pylint: disable=C0415
+    except ModuleNotFoundError:
+        return None
+
+    return ContentEncoder(
+        name="br",
+        compress=lambda body: brotli.compress(body, quality=quality),
+        create_stream_compressor=lambda: _BrotliStreamCompressor(
+            brotli.Compressor(quality=quality)
+        ),
+    )
+
+
+@dataclass
+class _BrotliStreamCompressor:
+    compressor: Any
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self.compressor.finish()
+
+
+def zstd_encoder(level: int = 3) -> Optional[ContentEncoder]:
+    try:
+        import zstandard  # pylint: disable=C0415
+    except ModuleNotFoundError:
+        return None
+    compressor = zstandard.ZstdCompressor(level=level)
+    return ContentEncoder(
+        name="zstd",
+        compress=compressor.compress,
+        create_stream_compressor=compressor.compressobj,
+    )
+
+
+def get_available_encoders() -> List[ContentEncoder]:
+    """Get available encoders in order of preference - brotli and zstd are only available when installed"""
+    encoders = [brotli_encoder(), zstd_encoder(), gzip_encoder()]
+    return [e for e in encoders if e]
+
+
+def select_encoder(
+    accept_encoding: Optional[str], encoders: Sequence[ContentEncoder]
+) -> Optional[ContentEncoder]:
+    """Select the most preferred of the encoders given which the client accepts"""
+    if not accept_encoding:
+        return None
+    accepted = _parse_accept_encoding(accept_encoding)
+    wildcard = accepted.get("*", 0)
+    for encoder in encoders:
+        if accepted.get(encoder.name, wildcard) > 0:
+            return encoder
+    return None
+
+
+@lru_cache(maxsize=256)
+def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    # Clients send a small number of distinct headers, so parsed results are cached
+    result = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0
+        result[name.strip().lower()] = quality
+    return result
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Iterator, List
+from typing import Dict, Iterator, List, Optional
 
 from starlette.routing import Route
 
@@ -15,6 +15,17 @@ from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory_abc
 )
 from servey.servey_starlette.route_factory.route_factory_abc import RouteFactoryABC
 
+# Endpoints mounted by action route factories, by action name, so other route factories can reuse them
+_mounted_action_endpoints: Dict[str, ActionEndpointABC] = {}
+
+
+def get_mounted_action_endpoint(action: Action) -> Optional[ActionEndpointABC]:
+    """Get the endpoint mounted for the action given, if any"""
+    action_endpoint = _mounted_action_endpoints.get(action.name)
+    if action_endpoint and action_endpoint.get_action() == action:
+        return action_endpoint
+    return None
+
 
 @dataclass
 class ActionRouteFactory(RouteFactoryABC):
@@ -35,6 +46,7 @@ class ActionRouteFactory(RouteFactoryABC):
     def create_route(self, action: Action) -> Route:
         action_endpoint = self.create_action_endpoint(action)
         if action_endpoint:
+            _mounted_action_endpoints[action.name] = action_endpoint
             route = action_endpoint.get_route()
             return route
 
@@ -1,17 +1,18 @@
 import os
 from dataclasses import field, dataclass
-from typing import Iterator, List, Union
+from typing import Iterator, List, Optional, Union
 
 from marshy.types import ExternalItemType
 from schemey import Schema
 from schemey.util import filter_none
 from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from starlette.responses import Response
 from starlette.routing import Route
 
 from servey.action.util import move_ref_items_to_components
 from servey.event_channel.websocket.websocket_event_channel import WebsocketEventChannel
 from servey.finder.event_channel_finder_abc import find_event_channels_by_type
+from servey.servey_starlette.encoded_document import EncodedDocument
 from servey.servey_starlette.route_factory.route_factory_abc import RouteFactoryABC
 
 
@@ -26,6 +27,9 @@ class AsyncapiRouteFactory(RouteFactoryABC):
     version: str = field(
         default_factory=lambda: os.environ.get("SERVEY_API_VERSION") or "0.1.0"
     )
+    _document: Optional[EncodedDocument] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @staticmethod
     def get_websocket_channels() -> List[WebsocketEventChannel]:
@@ -42,8 +46,16 @@ class AsyncapiRouteFactory(RouteFactoryABC):
     # pylint: disable=W0613
     # noinspection PyUnusedLocal
     def endpoint(self, request: Request) -> Response:
-        schema = self.asyncapi_schema()
-        return JSONResponse(schema)
+        return self.get_document().to_response(request)
+
+    def get_document(self) -> EncodedDocument:
+        """Get the encoded schema, which is generated on first use only"""
+        document = self._document
+        if document is None:
+            document = self._document = EncodedDocument.from_json(
+                self.asyncapi_schema()
+            )
+        return document
 
     def asyncapi_schema(self) -> ExternalItemType:
         components = {}
@@ -0,0 +1,185 @@
+import asyncio
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Any, Dict, Iterator, Optional
+
+from json_urley import json_obj_to_query_str
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from servey.action.action import Action
+from servey.finder.action_finder_abc import find_actions
+from servey.json_codec.json_codec_abc import JsonCodecABC, get_default_json_codec
+from servey.security.authorization import AuthorizationError
+from servey.security.authorizer.authorizer_abc import AuthorizerABC
+from servey.security.authorizer.authorizer_factory_abc import get_default_authorizer
+from servey.servey_starlette.action_endpoint.action_endpoint_abc import (
+    ActionEndpointABC,
+)
+from servey.servey_starlette.action_endpoint.authorizing_action_endpoint import (
+    parse_authorization,
+)
+from servey.servey_starlette.json_codec_response import JsonCodecResponse
+from servey.servey_starlette.route_factory.action_route_factory import (
+    ActionRouteFactory,
+    get_mounted_action_endpoint,
+)
+from servey.servey_starlette.route_factory.route_factory_abc import RouteFactoryABC
+
+LOGGER = getLogger(__name__)
+_CONDITIONAL_HEADERS = (b"if-none-match", b"if-modified-since")
+
+
+@dataclass
+class BatchRouteFactory(RouteFactoryABC):
+    """
+    Route factory mounting a single endpoint which invokes multiple actions in one request. The body is a list of
+    calls in the form {"action": <name>, "params": {...}}, and the response is a list of {"status": <code>,
+    "result": ...} or {"status": <code>, "error": ...} in the same order. Calls reuse the endpoints mounted by
+    the action route factory (Which has a higher priority), so they share its caches and coalescing.
+    """
+
+    priority: int = 105
+    path: str = "/batch"
+    max_calls: int = 50
+    # Used only to create endpoints for actions which were not already mounted
+    action_route_factory: Optional[ActionRouteFactory] = None
+
+    def create_routes(self) -> Iterator[Route]:
+        action_endpoints = {}
+        for action in find_actions():
+            action_endpoint = self.get_action_endpoint(action)
+            if action_endpoint:
+                action_endpoints[action.name] = action_endpoint
+        if action_endpoints:
+            batch_endpoint = BatchEndpoint(action_endpoints, self.max_calls)
+            yield Route(
+                self.path,
+                name="batch",
+                endpoint=batch_endpoint.execute,
+                methods=["POST"],
+                include_in_schema=False,
+            )
+
+    def get_action_endpoint(self, action: Action) -> Optional[ActionEndpointABC]:
+        action_endpoint = get_mounted_action_endpoint(action)
+        if action_endpoint:
+            return action_endpoint
+        if not self.action_route_factory:
+            self.action_route_factory = ActionRouteFactory()
+        return self.action_route_factory.create_action_endpoint(action)
+
+
+@dataclass
+class BatchEndpoint:
+    """
+    Endpoint executing a batch of calls concurrently. Each call goes through the same endpoint (And so the same
+    authorization, validation and marshalling) as if it were a separate request, but the bearer token is only
+    authorized once for the whole batch.
+    """
+
+    action_endpoints: Dict[str, ActionEndpointABC]
+    max_calls: int = 50
+    authorizer: AuthorizerABC = field(default_factory=get_default_authorizer)
+    json_codec: JsonCodecABC = field(default_factory=get_default_json_codec)
+
+    async def execute(self, request: Request) -> Response:
+        try:
+            calls = self.json_codec.loads(await request.body() or b"[]")
+        except ValueError:
+            calls = None
+        error = self.get_error(calls)
+        if error:
+            return JsonCodecResponse({"error": error}, 400, json_codec=self.json_codec)
+        try:
+            # Stored in the request state, which is shared with all calls
+            request.state.authorization = parse_authorization(self.authorizer, request)
+        except AuthorizationError:
+            return JsonCodecResponse(
+                {"error": "unauthorized"}, 401, json_codec=self.json_codec
+            )
+        results = await asyncio.gather(
+            *[self.execute_call(request, call) for call in calls]
+        )
+        body = b"[" + b",".join(results) + b"]"
+        return Response(body, media_type="application/json")
+
+    def get_error(self, calls: Any) -> Optional[str]:
+        if not isinstance(calls, list):
+            return "invalid_batch"
+        if len(calls) > self.max_calls:
+            return f"too_many_calls:{self.max_calls}"
+        for call in calls:
+            if not isinstance(call, dict) or not isinstance(call.get("action"), str):
+                return "invalid_call"
+            if not isinstance(call.get("params", {}), dict):
+                return "invalid_params"
+
+    async def execute_call(self, request: Request, call: Dict[str, Any]) -> bytes:
+        action_endpoint = self.action_endpoints.get(call["action"])
+        if not action_endpoint:
+            return self.encode_error(404, "unknown_action")
+        call_request = self.build_call_request(
+            request, action_endpoint.get_route(), call.get("params") or {}
+        )
+        try:
+            response = await action_endpoint.execute_with_context(call_request, {})
+        except HTTPException as e:
+            return self.encode_error(e.status_code, e.detail)
+        except AuthorizationError:
+            return self.encode_error(401, "unauthorized")
+        except Exception:  # pylint: disable=W0703
+            LOGGER.exception(f"batch_call_failed:{call['action']}")
+            return self.encode_error(500, "internal_error")
+        return await self.encode_response(response)
+
+    def build_call_request(
+        self, request: Request, route: Route, params: Dict[str, Any]
+    ) -> Request:
+        # Conditional headers apply to the batch as a whole, so sub calls should never respond with a 304
+        headers = [
+            (key, value)
+            for key, value in request.scope["headers"]
+            if key.lower() not in _CONDITIONAL_HEADERS
+        ]
+        scope = dict(request.scope, path=route.path, path_params={}, headers=headers)
+        body = b""
+        if "GET" in route.methods:
+            scope["method"] = "GET"
+            scope["query_string"] = json_obj_to_query_str(params).encode("latin-1")
+        else:
+            scope["method"] = next(iter(route.methods))
+            scope["query_string"] = b""
+            body = self.json_codec.dumps(params)
+
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        return Request(scope, receive)
+
+    async def encode_response(self, response: Response) -> bytes:
+        if hasattr(response, "body_iterator"):
+            chunks = []
+            async for chunk in response.body_iterator:
+                chunks.append(chunk if isinstance(chunk, bytes) else chunk.encode())
+            body = b"".join(chunks)
+        else:
+            body = response.body
+        if not body:
+            body = b"null"
+        elif not _is_json(response):
+            body = self.json_codec.dumps(body.decode(response.charset))
+        key = b'"result"' if response.status_code < 400 else b'"error"'
+        # The body is already json, so there is no need to decode and re-encode it
+        return b'{"status":%d,%s:%s}' % (response.status_code, key, body)
+
+    def encode_error(self, status: int, error: Any) -> bytes:
+        return self.json_codec.dumps({"status": status, "error": error})
+
+
+def _is_json(response: Response) -> bool:
+    # The content type header is checked, as the media type is not set on responses built from raw headers
+    content_type = response.headers.get("content-type") or ""
+    return content_type.split(";")[0].strip() == "application/json"
@@ -1,15 +1,16 @@
 import os
 from dataclasses import field, dataclass
-from typing import Iterator
+from typing import Iterator, Optional
 
 from marshy.types import ExternalItemType
 from schemey.util import filter_none
 from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from starlette.responses import Response
 from starlette.routing import Route, Mount
 from starlette.staticfiles import StaticFiles
 
 from servey.finder.action_finder_abc import find_actions
+from servey.servey_starlette.encoded_document import EncodedDocument
 from servey.servey_starlette.route_factory.action_route_factory import (
     ActionRouteFactory,
 )
@@ -31,6 +32,9 @@ class OpenapiRouteFactory(RouteFactoryABC):
     debug: bool = field(
         default_factory=lambda: int(os.environ.get("SERVER_DEBUG", "1")) == 1
     )
+    _document: Optional[EncodedDocument] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def create_routes(self) -> Iterator[Route]:
         if not self.debug:
@@ -46,8 +50,17 @@ class OpenapiRouteFactory(RouteFactoryABC):
     # pylint: disable=W0613
     # noinspection PyUnusedLocal
     def endpoint(self, request: Request) -> Response:
-        schema = self.openapi_schema()
-        return JSONResponse(schema)
+        return self.get_document().to_response(request)
+
+    def get_document(self) -> EncodedDocument:
+        """
+        Get the encoded schema. This is generated on first use only, as finding actions and building their
+        endpoints is expensive, and the result does not change for the life of the process.
+        """
+        document = self._document
+        if document is None:
+            document = self._document = EncodedDocument.from_json(self.openapi_schema())
+        return document
 
     def openapi_schema(self) -> ExternalItemType:
         schema = {
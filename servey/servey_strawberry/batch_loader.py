@@ -0,0 +1,146 @@
+import inspect
+import os
+from dataclasses import dataclass, field
+from time import time
+from typing import Optional, List, Any, Hashable, Tuple, Dict
+
+from strawberry.dataloader import DataLoader
+from strawberry.types import Info
+
+from servey.action.batch_invoker import BatchInvoker
+from servey.security.authorization import Authorization
+from servey.security.authorizer.authorizer_abc import AuthorizerABC
+from servey.security.authorizer.authorizer_factory_abc import get_default_authorizer
+from servey.util.lru_cache import LruCache
+
+# Key within the graphql context under which data loaders for the current request are stored
+DATA_LOADERS_CONTEXT_KEY = "servey_data_loaders"
+
+_default_batch_cache = None
+
+
+# pylint: disable=W0603
+def get_default_batch_cache() -> Optional[LruCache[Tuple[Any]]]:
+    """
+    Get the cache of batch results shared between requests, bounded by the number of entries in the
+    SERVEY_BATCH_CACHE_MAX_SIZE environment variable. If this is not set, results are not shared between requests.
+    """
+    global _default_batch_cache
+    if _default_batch_cache is None:
+        max_size = int(os.environ.get("SERVEY_BATCH_CACHE_MAX_SIZE") or 0)
+        if not max_size:
+            return None
+        _default_batch_cache = LruCache(max_size=max_size)
+    return _default_batch_cache
+
+
+# pylint: disable=R0902
+@dataclass(eq=False)
+class BatchLoader:
+    """
+    Loader for a field with a batch invoker. A DataLoader (Which batches and deduplicates loads) is created for each
+    request and held in the graphql context, so nothing is retained or shared between requests unless a shared cache
+    is given. Results in the shared cache expire after the ttl, and are keyed by the authorization subject and scopes,
+    so they are only shared between requests with the same authorization.
+    """
+
+    name: str
+    batch_invoker: BatchInvoker
+    ttl: int = 10
+    shared_cache: Optional[LruCache[Tuple[Any]]] = field(
+        default_factory=get_default_batch_cache
+    )
+    authorizer: Optional[AuthorizerABC] = None
+    last_sweep: float = field(default_factory=time, init=False)
+
+    def get_data_loader(self, info: Info) -> DataLoader:
+        context = info.context
+        if not isinstance(context, dict):
+            # No request scoped storage is available, so loads are not batched
+            return self.create_data_loader(info)
+        data_loaders: Dict[int, DataLoader] = context.get(DATA_LOADERS_CONTEXT_KEY)
+        if data_loaders is None:
+            data_loaders = context[DATA_LOADERS_CONTEXT_KEY] = {}
+        data_loader = data_loaders.get(id(self))
+        if data_loader is None:
+            data_loader = data_loaders[id(self)] = self.create_data_loader(info)
+        return data_loader
+
+    def create_data_loader(self, info: Info) -> DataLoader:
+        if self.shared_cache is None:
+            load_fn = self.invoke
+        else:
+            scope = self.get_scope(info)
+
+            async def load_fn(keys: List[Any]) -> List[Any]:
+                return await self.load_with_shared_cache(scope, keys)
+
+        return DataLoader(
+            load_fn=load_fn, max_batch_size=self.batch_invoker.max_batch_size
+        )
+
+    async def invoke(self, keys: List[Any]) -> List[Any]:
+        results = self.batch_invoker.fn(keys)
+        if inspect.isawaitable(results):
+            results = await results
+        return results
+
+    async def load_with_shared_cache(
+        self, scope: Hashable, keys: List[Any]
+    ) -> List[Any]:
+        cache = self.shared_cache
+        now = time()
+        if now - self.last_sweep > self.ttl:
+            self.last_sweep = now
+            cache.remove_expired(now)
+        results = [None] * len(keys)
+        missing_indexes = []
+        cache_keys = [_get_cache_key(self.name, scope, key) for key in keys]
+        for index, cache_key in enumerate(cache_keys):
+            # Values are wrapped in a tuple, as None may be a valid result
+            cached = None if cache_key is None else cache.get(cache_key, now)
+            if cached is None:
+                missing_indexes.append(index)
+            else:
+                results[index] = cached[0]
+        if missing_indexes:
+            loaded = await self.invoke([keys[i] for i in missing_indexes])
+            expire_at = now + self.ttl
+            for index, result in zip(missing_indexes, loaded):
+                results[index] = result
+                cache_key = cache_keys[index]
+                if cache_key is not None and not isinstance(result, BaseException):
+                    cache.put(cache_key, (result,), expire_at)
+        return results
+
+    def get_scope(self, info: Info) -> Hashable:
+        authorization = self.get_authorization(info)
+        if authorization:
+            return authorization.subject_id, authorization.scopes
+        return None
+
+    def get_authorization(self, info: Info) -> Optional[Authorization]:
+        context = info.context
+        if not isinstance(context, dict):
+            return None
+        authorization = context.get("authorization")
+        if authorization:
+            return authorization
+        request = context.get("request")
+        if request:
+            token = request.headers.get("Authorization")
+            if token and token.lower().startswith("bearer "):
+                if not self.authorizer:
+                    self.authorizer = get_default_authorizer()
+                authorization = self.authorizer.authorize(token[7:])
+                context["authorization"] = authorization
+                return authorization
+
+
+def _get_cache_key(name: str, scope: Hashable, key: Any) -> Optional[Hashable]:
+    cache_key = (name, scope, key)
+    try:
+        hash(cache_key)
+        return cache_key
+    except TypeError:
+        return None
@@ -0,0 +1,84 @@
+"""
+Collection of the cache headers for fields resolved by actions during a graphql operation. Headers are only collected
+for operations which may be cached (See ServeyGraphQL), and are then combined into a cache header for the response.
+Any field resolved by an action without a cache control makes the whole response uncacheable.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional, List, Type, Any, Iterator
+
+from marshy import get_default_marshy_context
+from marshy.marshaller.marshaller_abc import MarshallerABC
+
+from servey.action.action import Action
+from servey.cache_control.cache_header import CacheHeader
+from servey.trigger.web_trigger import WebTrigger, UPDATE_METHODS
+
+# Headers for the current operation. (None if headers are not being collected) A None header means uncacheable
+_cache_headers: ContextVar[Optional[List[Optional[CacheHeader]]]] = ContextVar(
+    "servey_cache_headers", default=None
+)
+
+
+@contextmanager
+def collect_cache_headers() -> Iterator[List[Optional[CacheHeader]]]:
+    """Collect cache headers within the current context, yielding the list to which they are added"""
+    cache_headers = []
+    token = _cache_headers.set(cache_headers)
+    try:
+        yield cache_headers
+    finally:
+        _cache_headers.reset(token)
+
+
+def mark_uncacheable():
+    cache_headers = _cache_headers.get()
+    if cache_headers is not None:
+        cache_headers.append(None)
+
+
+def combine_cache_headers(
+    cache_headers: List[Optional[CacheHeader]],
+) -> Optional[CacheHeader]:
+    """Combine the headers given, returning None if there are none or any field was uncacheable"""
+    if not cache_headers or None in cache_headers:
+        return None
+    return cache_headers[0].combine_with(cache_headers[1:])
+
+
+@dataclass
+class CacheHeaderRecorder:
+    """Records the cache header for results of an action, if headers are being collected"""
+
+    action: Action
+    return_type: Type
+    marshaller: Optional[MarshallerABC] = field(default=None, init=False)
+    cacheable: bool = field(init=False)
+
+    def __post_init__(self):
+        self.cacheable = bool(self.action.cache_control) and not _is_mutation(
+            self.action
+        )
+
+    def record(self, result: Any):
+        cache_headers = _cache_headers.get()
+        if cache_headers is None:
+            return
+        if not self.cacheable:
+            cache_headers.append(None)
+            return
+        if self.marshaller is None:
+            # Resolved lazily, as the return type may contain forward references
+            marshy_context = get_default_marshy_context()
+            self.marshaller = marshy_context.get_marshaller(self.return_type)
+        item = self.marshaller.dump(result)
+        cache_headers.append(self.action.cache_control.get_cache_header(item))
+
+
+def _is_mutation(action: Action) -> bool:
+    return any(
+        isinstance(t, WebTrigger) and t.method in UPDATE_METHODS
+        for t in action.triggers
+    )
@@ -0,0 +1,88 @@
+"""
+Cache of parsed and validated graphql documents keyed by the sha256 hash of the query text, so that operations sent
+repeatedly are only parsed and validated once. The query text is retained too, so clients may send just the hash of a
+query previously sent (Automatic Persisted Queries).
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Optional, List, Tuple, Type, Iterator
+
+from graphql import DocumentNode, GraphQLError
+from strawberry.extensions import SchemaExtension
+
+from servey.util.lru_cache import LruCache
+
+
+@dataclass
+class CachedDocument:
+    query: str
+    document: DocumentNode
+    # Validation results are only reused for the same set of rules
+    validation_rules: Optional[Tuple] = None
+    errors: Optional[List[GraphQLError]] = None
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def create_document_cache() -> LruCache[CachedDocument]:
+    """
+    Create a cache for documents bounded by the number of entries given in the SERVEY_GRAPHQL_DOCUMENT_CACHE_SIZE
+    environment variable (Default 1024)
+    """
+    max_size = int(os.environ.get("SERVEY_GRAPHQL_DOCUMENT_CACHE_SIZE") or 1024)
+    return LruCache(max_size=max_size)
+
+
+class DocumentCacheExtension(SchemaExtension):
+    """
+    Extension skipping parsing and validation for documents in the cache. Extensions are created for each operation,
+    so the cache is a class attribute (See create_document_cache_extension)
+    """
+
+    document_cache: LruCache[CachedDocument] = None
+    cache_key: Optional[str] = None
+    cached_document: Optional[CachedDocument] = None
+
+    def on_parse(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        query = execution_context.query
+        if query:
+            self.cache_key = get_query_hash(query)
+            self.cached_document = self.document_cache.get(self.cache_key)
+            if self.cached_document:
+                execution_context.graphql_document = self.cached_document.document
+        yield
+        document = execution_context.graphql_document
+        if self.cached_document is None and self.cache_key and document:
+            self.cached_document = CachedDocument(query, document)
+            self.document_cache.put(self.cache_key, self.cached_document)
+
+    def on_validate(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        cached_document = self.cached_document
+        validation_rules = execution_context.validation_rules
+        if (
+            cached_document
+            and cached_document.errors is not None
+            and cached_document.validation_rules == validation_rules
+            and execution_context.errors is None
+        ):
+            execution_context.errors = list(cached_document.errors)
+        yield
+        if cached_document and cached_document.errors is None:
+            cached_document.validation_rules = validation_rules
+            cached_document.errors = list(execution_context.errors or [])
+
+
+def create_document_cache_extension(
+    document_cache: LruCache[CachedDocument],
+) -> Type[DocumentCacheExtension]:
+    return type(
+        "DocumentCacheExtension",
+        (DocumentCacheExtension,),
+        {"document_cache": document_cache},
+    )
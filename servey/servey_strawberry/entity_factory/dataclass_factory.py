@@ -1,20 +1,21 @@
 import dataclasses
 import inspect
 from dataclasses import is_dataclass, fields, dataclass, MISSING
-from datetime import datetime
 from decimal import Decimal
-from typing import Type, Optional, Dict, Any, Callable, Union
+from typing import Type, Optional, Dict, Any, Callable
 
 import strawberry
-from dateutil.relativedelta import relativedelta
-from strawberry.dataloader import DataLoader, AbstractCache
+from strawberry.types import Info
 
 from servey.action.action import Action, get_action
 from servey.action.batch_invoker import BatchInvoker
 from servey.cache_control.cache_control_abc import CacheControlABC
+from servey.servey_strawberry.batch_loader import BatchLoader
+from servey.servey_strawberry.cache_headers import CacheHeaderRecorder
 from servey.servey_strawberry.entity_factory.entity_factory_abc import (
     EntityFactoryABC,
 )
+from servey.servey_strawberry.query_limits import ACTION_METADATA_KEY
 from servey.servey_strawberry.schema_factory import SchemaFactory
 from servey.servey_strawberry.schema_factory_lazy_input import SchemaFactoryLazyInput
 from servey.servey_strawberry.schema_factory_lazy_type import SchemaFactoryLazyType
@@ -100,6 +101,10 @@ def build_resolvable_field(
     key: str,
     params: Dict[str, Any],
 ):
+    # Batch results are marshalled for cache headers using the type from before filtering
+    recorder = CacheHeaderRecorder(
+        action, inspect.signature(action.fn).return_annotation
+    )
     for handler_filter in schema_factory.handler_filters:
         action, continue_filtering = handler_filter.filter(action, schema_factory)
         if not continue_filtering:
@@ -108,57 +113,32 @@ def build_resolvable_field(
     fn = action.fn
     if action.batch_invoker:
         fn = _wrap_fn_in_data_loader(
-            action.fn, action.batch_invoker, action.cache_control
+            action.fn, action.batch_invoker, action.cache_control, recorder
         )
     sig = inspect.signature(fn)
     return_type = schema_factory.get_type(sig.return_annotation)
     params["__annotations__"][key] = return_type
-    params[key] = strawberry.field(resolver=fn)
+    params[key] = strawberry.field(resolver=fn, metadata={ACTION_METADATA_KEY: action})
 
 
 def _wrap_fn_in_data_loader(
-    fn: Callable, batch_invoker: BatchInvoker, cache_control: CacheControlABC
+    fn: Callable,
+    batch_invoker: BatchInvoker,
+    cache_control: CacheControlABC,
+    recorder: CacheHeaderRecorder,
 ):
     ttl = cache_control.ttl if hasattr(cache_control, "ttl") else 10
-    data_loader = DataLoader(
-        load_fn=batch_invoker.fn,
-        max_batch_size=batch_invoker.max_batch_size,
-        cache_map=_UserCache(relativedelta(seconds=ttl)),
-    )
+    # Fields sharing a batch function may share cached results
+    load_fn = batch_invoker.fn
+    name = f"{load_fn.__module__}.{load_fn.__qualname__}"
+    batch_loader = BatchLoader(name, batch_invoker, ttl)
 
     sig = inspect.signature(fn)
 
-    async def wrapper(self) -> sig.return_annotation:
+    async def wrapper(self, info: Info) -> sig.return_annotation:
         args = batch_invoker.arg_extractor(self)
-        result = await data_loader.load(*args)
+        result = await batch_loader.get_data_loader(info).load(*args)
+        recorder.record(result)
         return result
 
     return wrapper
-
-
-@dataclass
-class _UserCacheEntry:
-    value: Any
-    expire_at: datetime
-
-
-class _UserCache(AbstractCache):
-    def __init__(self, expire_in: relativedelta):
-        self.cache: Dict[Any, _UserCacheEntry] = {}
-        self.expire_in = expire_in
-
-    def get(self, key: Any) -> Union[Any, None]:
-        entry = self.cache.get(key)
-        if entry and entry.expire_at > datetime.now():
-            return entry.value
-
-    def set(self, key: Any, value: Any) -> None:
-        self.cache[key] = _UserCacheEntry(
-            value, datetime.now() + self.expire_in
-        )  # store data in the cache
-
-    def delete(self, key: Any) -> None:
-        del self.cache[key]  # delete key from the cache
-
-    def clear(self) -> None:
-        self.cache.clear()  # clear the cache
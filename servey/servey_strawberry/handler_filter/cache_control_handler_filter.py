@@ -0,0 +1,56 @@
+import dataclasses
+import inspect
+from typing import Tuple, Awaitable
+
+from servey.action.action import Action
+from servey.servey_strawberry.cache_headers import CacheHeaderRecorder
+from servey.servey_strawberry.handler_filter.handler_filter_abc import (
+    HandlerFilterABC,
+)
+from servey.servey_strawberry.schema_factory import SchemaFactory
+
+
+class CacheControlHandlerFilter(HandlerFilterABC):
+    """
+    Filter recording the cache header for the result of each resolver, so that http caching may be applied to the
+    response for the operation as a whole. Runs before the types are converted for strawberry, so the result can
+    be marshalled in the same way as for other transports. Nested fields with a batch invoker are recorded when
+    loaded instead.
+    """
+
+    priority: int = 125
+
+    def filter(
+        self,
+        action: Action,
+        schema_factory: SchemaFactory,
+    ) -> Tuple[Action, bool]:
+        fn = action.fn
+        sig = inspect.signature(fn)
+        recorder = CacheHeaderRecorder(action, sig.return_annotation)
+
+        if inspect.iscoroutinefunction(fn):
+
+            async def resolver(*args, **kwargs):
+                result = await fn(*args, **kwargs)
+                recorder.record(result)
+                return result
+
+        else:
+
+            def resolver(*args, **kwargs):
+                result = fn(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    return _record_async(recorder, result)
+                recorder.record(result)
+                return result
+
+        resolver.__signature__ = sig
+        wrapped_action = dataclasses.replace(action, fn=resolver)
+        return wrapped_action, True
+
+
+async def _record_async(recorder: CacheHeaderRecorder, awaitable: Awaitable):
+    result = await awaitable
+    recorder.record(result)
+    return result
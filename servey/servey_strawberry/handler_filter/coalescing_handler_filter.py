@@ -0,0 +1,67 @@
+import dataclasses
+import inspect
+from dataclasses import dataclass, field
+from typing import Any, Hashable, Tuple
+
+from servey.action.action import Action
+from servey.security.authorization import Authorization
+from servey.servey_strawberry.handler_filter.handler_filter_abc import (
+    HandlerFilterABC,
+)
+from servey.servey_strawberry.schema_factory import SchemaFactory
+from servey.util.single_flight import SingleFlight
+
+
+@dataclass
+class CoalescingHandlerFilter(HandlerFilterABC):
+    """
+    Filter coalescing identical concurrent resolver invocations for actions which opted in (action.coalesce).
+    Runs before authorization wraps the action, so the authorization subject and scopes form part of the key.
+    """
+
+    priority: int = 130
+    single_flight: SingleFlight = field(default_factory=SingleFlight)
+
+    def filter(
+        self,
+        action: Action,
+        schema_factory: SchemaFactory,
+    ) -> Tuple[Action, bool]:
+        if not action.coalesce:
+            return action, True
+        fn = action.fn
+        single_flight = self.single_flight
+
+        if inspect.iscoroutinefunction(fn):
+
+            async def resolver(*args, **kwargs):
+                key = _get_key(action.name, args, kwargs)
+                return await single_flight.run_async(key, lambda: fn(*args, **kwargs))
+
+        else:
+
+            def resolver(*args, **kwargs):
+                key = _get_key(action.name, args, kwargs)
+                return single_flight.run(key, lambda: fn(*args, **kwargs))
+
+        resolver.__signature__ = inspect.signature(fn)
+        wrapped_action = dataclasses.replace(action, fn=resolver)
+        return wrapped_action, True
+
+
+def _get_key(name: str, args: Tuple, kwargs: dict) -> Hashable:
+    return (
+        name,
+        tuple(_get_value_key(a) for a in args),
+        tuple(sorted((k, _get_value_key(v)) for k, v in kwargs.items())),
+    )
+
+
+def _get_value_key(value: Any) -> Hashable:
+    if isinstance(value, Authorization):
+        return value.subject_id, value.scopes
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
@@ -0,0 +1,40 @@
+import dataclasses
+import inspect
+from typing import Awaitable, Tuple
+
+from servey.action.action import Action
+from servey.executor.concurrency_limiter import get_concurrency_limiter
+from servey.servey_strawberry.handler_filter.handler_filter_abc import (
+    HandlerFilterABC,
+)
+from servey.servey_strawberry.schema_factory import SchemaFactory
+
+
+class ConcurrencyLimitingHandlerFilter(HandlerFilterABC):
+    """
+    Filter enforcing the concurrency limit of an action on resolvers. Rejected invocations raise a
+    ConcurrencyLimitError, reported as an error for the field. Limits are shared with other transports.
+    """
+
+    priority: int = 135
+
+    def filter(
+        self,
+        action: Action,
+        schema_factory: SchemaFactory,
+    ) -> Tuple[Action, bool]:
+        limiter = get_concurrency_limiter(action)
+        if not limiter:
+            return action, True
+        fn = action.fn
+
+        async def resolver(*args, **kwargs):
+            async with limiter.limit_concurrency():
+                result = fn(*args, **kwargs)
+                if isinstance(result, Awaitable):
+                    result = await result
+                return result
+
+        resolver.__signature__ = inspect.signature(fn)
+        wrapped_action = dataclasses.replace(action, fn=resolver)
+        return wrapped_action, True
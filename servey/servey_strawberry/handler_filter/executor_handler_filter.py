@@ -0,0 +1,43 @@
+import dataclasses
+import inspect
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Tuple
+
+from servey.action.action import Action
+from servey.executor.executor_abc import ExecutorABC, get_default_executor
+from servey.executor.inline_executor import InlineExecutor
+from servey.servey_strawberry.handler_filter.handler_filter_abc import (
+    HandlerFilterABC,
+)
+from servey.servey_strawberry.schema_factory import SchemaFactory
+
+
+@dataclass
+class ExecutorHandlerFilter(HandlerFilterABC):
+    """
+    Filter running sync resolvers using the executor for the action (By default a bounded thread pool shared with
+    other transports), so they do not block the event loop and sibling fields of an operation run concurrently.
+    Runs before the other filters, so timeouts and concurrency limits apply to the offloaded function. Actions
+    using the INLINE executor are left as they are.
+    """
+
+    priority: int = 145
+    executor: ExecutorABC = field(default_factory=get_default_executor)
+
+    def filter(
+        self,
+        action: Action,
+        schema_factory: SchemaFactory,
+    ) -> Tuple[Action, bool]:
+        fn = action.fn
+        executor = action.executor or self.executor
+        if inspect.iscoroutinefunction(fn) or isinstance(executor, InlineExecutor):
+            return action, True
+
+        async def resolver(*args, **kwargs):
+            return await executor.execute(partial(fn, *args), kwargs)
+
+        resolver.__signature__ = inspect.signature(fn)
+        wrapped_action = dataclasses.replace(action, fn=resolver)
+        return wrapped_action, True
@@ -0,0 +1,88 @@
+import dataclasses
+import inspect
+from dataclasses import dataclass, field
+from inspect import Parameter
+from typing import Optional, Tuple
+
+from strawberry.types import Info
+
+from servey.action.action import Action
+from servey.rate_limit.rate_limiter import check_rate_limit, check_rate_limit_async
+from servey.security.authorization import Authorization
+from servey.security.authorizer.authorizer_abc import AuthorizerABC
+from servey.security.authorizer.authorizer_factory_abc import get_default_authorizer
+from servey.servey_strawberry.handler_filter.handler_filter_abc import (
+    HandlerFilterABC,
+)
+from servey.servey_strawberry.schema_factory import SchemaFactory
+
+
+@dataclass
+class RateLimitingHandlerFilter(HandlerFilterABC):
+    """
+    Filter applying the rate limit of an action to resolvers, keyed by the subject of the authorization for the
+    request. Rejected invocations raise a RateLimitError, reported as an error for the field. Buckets are shared
+    with other transports. Async resolvers check the limit without blocking the event loop.
+    """
+
+    priority: int = 110
+    authorizer: AuthorizerABC = field(default_factory=get_default_authorizer)
+    info_kwarg_name: str = "info"
+
+    def filter(
+        self,
+        action: Action,
+        schema_factory: SchemaFactory,
+    ) -> Tuple[Action, bool]:
+        if not action.rate_limit:
+            return action, True
+        fn = action.fn
+        sig = inspect.signature(fn)
+        # If an inner filter already requires the info, it is shared rather than added again
+        pop_info = self.info_kwarg_name not in sig.parameters
+        if pop_info:
+            sig = sig.replace(
+                parameters=[
+                    *sig.parameters.values(),
+                    Parameter(
+                        name=self.info_kwarg_name,
+                        kind=Parameter.KEYWORD_ONLY,
+                        annotation=Info,
+                    ),
+                ]
+            )
+
+        def get_info(kwargs):
+            if pop_info:
+                return kwargs.pop(self.info_kwarg_name)
+            return kwargs[self.info_kwarg_name]
+
+        if inspect.iscoroutinefunction(fn):
+
+            async def resolver(*args, **kwargs):
+                info = get_info(kwargs)
+                await check_rate_limit_async(action, self.get_authorization(info))
+                return await fn(*args, **kwargs)
+
+        else:
+
+            def resolver(*args, **kwargs):
+                info = get_info(kwargs)
+                check_rate_limit(action, self.get_authorization(info))
+                return fn(*args, **kwargs)
+
+        resolver.__signature__ = sig
+        wrapped_action = dataclasses.replace(action, fn=resolver)
+        return wrapped_action, True
+
+    def get_authorization(self, info: Info) -> Optional[Authorization]:
+        authorization = info.context.get("authorization")
+        if authorization:
+            return authorization
+        request = info.context.get("request")
+        if request:
+            token = request.headers.get("Authorization")
+            if token and token.lower().startswith("bearer "):
+                authorization = self.authorizer.authorize(token[7:])
+                info.context["authorization"] = authorization
+                return authorization
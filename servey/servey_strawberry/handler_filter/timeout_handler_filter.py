@@ -0,0 +1,38 @@
+import dataclasses
+import inspect
+from typing import Tuple
+
+from servey.action.action import Action
+from servey.executor.timeout import run_with_timeout
+from servey.servey_strawberry.handler_filter.handler_filter_abc import (
+    HandlerFilterABC,
+)
+from servey.servey_strawberry.schema_factory import SchemaFactory
+
+
+class TimeoutHandlerFilter(HandlerFilterABC):
+    """
+    Filter enforcing the action timeout on resolvers - async resolvers are cancelled at the deadline. Sync
+    resolvers are offloaded to the executor first (See ExecutorHandlerFilter) so are abandoned at the deadline,
+    except those using the INLINE executor, which run directly on the event loop so cannot be interrupted.
+    """
+
+    priority: int = 140
+
+    def filter(
+        self,
+        action: Action,
+        schema_factory: SchemaFactory,
+    ) -> Tuple[Action, bool]:
+        fn = action.fn
+        if not action.timeout or not inspect.iscoroutinefunction(fn):
+            return action, True
+
+        async def resolver(*args, **kwargs):
+            return await run_with_timeout(
+                fn(*args, **kwargs), action.timeout, action.name
+            )
+
+        resolver.__signature__ = inspect.signature(fn)
+        wrapped_action = dataclasses.replace(action, fn=resolver)
+        return wrapped_action, True
@@ -0,0 +1,226 @@
+"""
+Static analysis of graphql operations, rejecting those which are too deep, use too many aliases or are too costly before
+they are executed. Fields resolved by actions have a cost (Lower for those with a batch invoker, since they are loaded
+together), and the cost of fields within a list is multiplied by an assumed list size.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional, Tuple, Type, Union
+
+from graphql import (
+    GraphQLError,
+    ValidationRule,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    FieldNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    GraphQLObjectType,
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNonNull,
+    get_named_type,
+)
+
+from servey.action.action import Action
+
+# Key within the metadata of strawberry fields for the action resolving the field
+ACTION_METADATA_KEY = "servey_action"
+
+_CompositeType = Union[GraphQLObjectType, GraphQLInterfaceType]
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.environ.get(name) or default)
+
+
+@dataclass(frozen=True)
+class QueryLimits:
+    max_depth: int = field(
+        default_factory=lambda: _env_int("SERVEY_GRAPHQL_MAX_DEPTH", 10)
+    )
+    max_aliases: int = field(
+        default_factory=lambda: _env_int("SERVEY_GRAPHQL_MAX_ALIASES", 15)
+    )
+    max_cost: int = field(
+        default_factory=lambda: _env_int("SERVEY_GRAPHQL_MAX_COST", 1000)
+    )
+    # Cost of a field resolved by an action
+    action_cost: int = 10
+    # Cost of a field resolved by an action with a batch invoker
+    batch_action_cost: int = 1
+    # Cost of a field which is simply an attribute
+    attribute_cost: int = 0
+    # Assumed number of items in a list, by which the cost of fields within the list are multiplied
+    list_size: int = 10
+
+    def get_field_cost(self, action: Optional[Action]) -> int:
+        if action is None:
+            return self.attribute_cost
+        if action.batch_invoker:
+            return self.batch_action_cost
+        return self.action_cost
+
+
+@dataclass
+class OperationStats:
+    depth: int = 0
+    aliases: int = 0
+    cost: int = 0
+
+
+class QueryLimitsRule(ValidationRule):
+    """
+    Validation rule enforcing query limits. (See create_query_limits_rule) The stats for each fragment are computed
+    once for each type and depth at which it is spread, so repeated spreads do not multiply the work of analysis.
+    """
+
+    query_limits: QueryLimits = None
+
+    def __init__(self, context):
+        super().__init__(context)
+        self.fragment_stats: Dict[Tuple[str, str, int], OperationStats] = {}
+
+    # pylint: disable=W0613
+    def enter_operation_definition(self, node: OperationDefinitionNode, *args):
+        root_type = self.context.schema.get_root_type(node.operation)
+        if root_type is None:
+            return
+        stats = self.analyze(node.selection_set, root_type, 1, frozenset())
+        limits = self.query_limits
+        if stats.depth > limits.max_depth:
+            self.report_limit_error("max_depth_exceeded", stats.depth, node)
+        if stats.aliases > limits.max_aliases:
+            self.report_limit_error("max_aliases_exceeded", stats.aliases, node)
+        if stats.cost > limits.max_cost:
+            self.report_limit_error("max_cost_exceeded", stats.cost, node)
+
+    def report_limit_error(self, code: str, value: int, node: OperationDefinitionNode):
+        self.report_error(
+            GraphQLError(f"{code}:{value}", node, extensions={"code": code.upper()})
+        )
+
+    def is_exceeded(self, stats: OperationStats) -> bool:
+        limits = self.query_limits
+        return (
+            stats.depth > limits.max_depth
+            or stats.aliases > limits.max_aliases
+            or stats.cost > limits.max_cost
+        )
+
+    def analyze(
+        self,
+        selection_set: Optional[SelectionSetNode],
+        parent_type: _CompositeType,
+        depth: int,
+        fragment_names: FrozenSet[str],
+    ) -> OperationStats:
+        """
+        Get the stats for the selection set given, with fields directly within it at the depth given. The cost is
+        for a single instance of the parent type, so should be multiplied by the number of instances. Analysis
+        stops once a limit is exceeded, as the operation will be rejected anyway.
+        """
+        stats = OperationStats()
+        if selection_set is None:
+            return stats
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                selection_stats = self.analyze_field(
+                    selection, parent_type, depth, fragment_names
+                )
+            elif isinstance(selection, InlineFragmentNode):
+                type_ = parent_type
+                if selection.type_condition:
+                    type_ = self.context.schema.get_type(
+                        selection.type_condition.name.value
+                    )
+                selection_stats = self.analyze(
+                    selection.selection_set, type_, depth, fragment_names
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                selection_stats = self.analyze_fragment_spread(
+                    selection, depth, fragment_names
+                )
+            else:
+                continue
+            stats.depth = max(stats.depth, selection_stats.depth)
+            stats.aliases += selection_stats.aliases
+            stats.cost += selection_stats.cost
+            if self.is_exceeded(stats):
+                break
+        return stats
+
+    def analyze_fragment_spread(
+        self,
+        node: FragmentSpreadNode,
+        depth: int,
+        fragment_names: FrozenSet[str],
+    ) -> OperationStats:
+        name = node.name.value
+        fragment = self.context.get_fragment(name)
+        # Cycles are reported by another rule
+        if fragment is None or name in fragment_names:
+            return OperationStats()
+        type_name = fragment.type_condition.name.value
+        key = (name, type_name, depth)
+        stats = self.fragment_stats.get(key)
+        if stats is None:
+            stats = self.analyze(
+                fragment.selection_set,
+                self.context.schema.get_type(type_name),
+                depth,
+                fragment_names | {name},
+            )
+            self.fragment_stats[key] = stats
+        return stats
+
+    def analyze_field(
+        self,
+        node: FieldNode,
+        parent_type: _CompositeType,
+        depth: int,
+        fragment_names: FrozenSet[str],
+    ) -> OperationStats:
+        stats = OperationStats()
+        name = node.name.value
+        if name.startswith("__"):
+            return stats  # Introspection is not limited
+        if node.alias:
+            stats.aliases += 1
+        field_def = getattr(parent_type, "fields", {}).get(name)
+        if field_def is None:
+            return stats  # Unknown fields are reported by another rule
+        stats.depth = depth
+        if depth > self.query_limits.max_depth:
+            return stats  # Already rejected, so no need to go deeper
+        stats.cost = self.query_limits.get_field_cost(_get_action(field_def))
+        child_stats = self.analyze(
+            node.selection_set,
+            get_named_type(field_def.type),
+            depth + 1,
+            fragment_names,
+        )
+        multiplier = self.query_limits.list_size if _is_list(field_def.type) else 1
+        stats.depth = max(stats.depth, child_stats.depth)
+        stats.aliases += child_stats.aliases
+        stats.cost += multiplier * child_stats.cost
+        return stats
+
+
+def _get_action(field_def) -> Optional[Action]:
+    strawberry_field = (field_def.extensions or {}).get("strawberry-definition")
+    metadata = getattr(strawberry_field, "metadata", None) or {}
+    return metadata.get(ACTION_METADATA_KEY)
+
+
+def _is_list(type_) -> bool:
+    while isinstance(type_, (GraphQLNonNull, GraphQLList)):
+        if isinstance(type_, GraphQLList):
+            return True
+        type_ = type_.of_type
+    return False
+
+
+def create_query_limits_rule(query_limits: QueryLimits) -> Type[QueryLimitsRule]:
+    return type("QueryLimitsRule", (QueryLimitsRule,), {"query_limits": query_limits})
@@ -1,12 +1,13 @@
 import logging
 from dataclasses import dataclass, field, fields, is_dataclass
-from typing import Type, Dict, List, Set
+from typing import Type, Dict, List, Set, Optional
 
 import strawberry
 import typing_inspect
 from injecty import get_impls
 from marshy.factory.optional_marshaller_factory import get_optional_type
 from strawberry.annotation import StrawberryAnnotation
+from strawberry.extensions import AddValidationRules
 
 # noinspection PyProtectedMember
 from strawberry.field import StrawberryField, UNRESOLVED
@@ -22,6 +23,12 @@ from servey.servey_strawberry.entity_factory.entity_factory_abc import (
 from servey.servey_strawberry.handler_filter.handler_filter_abc import (
     HandlerFilterABC,
 )
+from servey.servey_strawberry.servey_schema import ServeySchema
+from servey.servey_strawberry.query_limits import (
+    QueryLimits,
+    ACTION_METADATA_KEY,
+    create_query_limits_rule,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -41,6 +48,8 @@ class SchemaFactory:
     subscription: Dict[str, StrawberryField] = field(default_factory=dict)
     entity_factories: List[EntityFactoryABC] = field(default_factory=list)
     handler_filters: List[HandlerFilterABC] = field(default_factory=list)
+    # Operations exceeding these limits are rejected before execution. (None to disable)
+    query_limits: Optional[QueryLimits] = field(default_factory=QueryLimits)
 
     def get_input(self, annotation: Type) -> Type:
         if getattr(annotation, "__name__", None) not in (None, "List", "Optional"):
@@ -72,7 +81,7 @@ class SchemaFactory:
             if not continue_filtering:
                 break
 
-        f = strawberry.field(resolver=action.fn)
+        f = strawberry.field(resolver=action.fn, metadata={ACTION_METADATA_KEY: action})
         f.name = action.name
         if trigger.method in UPDATE_METHODS:
             self.mutation[f.name] = f
@@ -167,7 +176,11 @@ class SchemaFactory:
         if not queries:
             LOGGER.warning("No graphql queries found - skipping schema generation")
             return None  # strawberry requires an API has at least 1 query!
-        schema = strawberry.Schema(queries, mutations, subscriptions)
+        extensions = []
+        if self.query_limits:
+            query_limits_rule = create_query_limits_rule(self.query_limits)
+            extensions.append(AddValidationRules([query_limits_rule]))
+        schema = ServeySchema(queries, mutations, subscriptions, extensions=extensions)
         return schema
 
 
@@ -0,0 +1,230 @@
+import json
+import os
+from time import time
+from typing import Optional, Dict, Any, Hashable, Tuple
+
+from graphql import GraphQLError
+from starlette.requests import Request
+from starlette.responses import Response
+from strawberry.asgi import GraphQL
+from strawberry.http import GraphQLRequestData, GraphQLHTTPResponse
+from strawberry.http.async_base_view import AsyncHTTPRequestAdapter
+from strawberry.http.base import BaseRequestProtocol
+from strawberry.types import ExecutionResult
+from strawberry.unset import UNSET
+
+from servey.cache_control.cache_header import CacheHeader
+from servey.servey_starlette.action_endpoint.caching_action_endpoint import (
+    CachedResponse,
+)
+from servey.servey_strawberry.cache_headers import (
+    collect_cache_headers,
+    combine_cache_headers,
+    mark_uncacheable,
+)
+from servey.servey_strawberry.document_cache import (
+    CachedDocument,
+    get_query_hash,
+)
+from servey.util.lru_cache import LruCache
+
+
+class PersistedQueryError(Exception):
+    def __init__(self, message: str, code: str):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+
+def _cached_response_size(cached_response: CachedResponse) -> int:
+    return len(cached_response.body)
+
+
+def create_graphql_response_cache() -> Optional[LruCache[CachedResponse]]:
+    """
+    Create a cache for graphql responses bounded by the number of bytes given in the
+    SERVEY_GRAPHQL_RESPONSE_CACHE_MAX_BYTES environment variable. If this is not set, responses are not cached.
+    """
+    max_bytes = int(os.environ.get("SERVEY_GRAPHQL_RESPONSE_CACHE_MAX_BYTES") or 0)
+    if not max_bytes:
+        return None
+    return LruCache(max_size=max_bytes, sizer=_cached_response_size)
+
+
+class ServeyGraphQL(GraphQL):
+    """
+    GraphQL app supporting Automatic Persisted Queries: A request may include the sha256 hash of its query in
+    extensions.persistedQuery, and omit the query if it was previously sent. Queries are retained in the document
+    cache, so if a query has been evicted the client is told to send it again. Queries may also be sent using GET.
+
+    Responses to GET and persisted queries where every field was resolved by an action with a cache control
+    include a combined ETag / Cache-Control, and conditional requests get a 304. If a response cache is given,
+    responses with an expiry are stored until they expire, so identical operations are not executed again.
+    """
+
+    def __init__(
+        self,
+        *args,
+        document_cache: LruCache[CachedDocument],
+        response_cache: Optional[LruCache[CachedResponse]] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.document_cache = document_cache
+        self.response_cache = response_cache
+
+    def should_render_graphiql(self, request: BaseRequestProtocol) -> bool:
+        if request.query_params.get("extensions"):
+            return False
+        return super().should_render_graphiql(request)
+
+    async def run(
+        self,
+        request: Request,
+        context: Optional[Any] = UNSET,
+        root_value: Optional[Any] = UNSET,
+    ) -> Response:
+        cache_key = await self.get_cache_key(request)
+        if cache_key is None:
+            return await super().run(request, context, root_value)
+        cached_response = self.get_cached_response(cache_key)
+        if cached_response:
+            response = cached_response.to_response()
+            cache_header = cached_response.cache_header
+        else:
+            with collect_cache_headers() as cache_headers:
+                response = await super().run(request, context, root_value)
+            cache_header = combine_cache_headers(cache_headers)
+            if response.status_code != 200 or cache_header is None:
+                return response
+            self.store_response(cache_key, response, cache_header)
+        if cache_header.is_not_modified(
+            request.headers.get("If-None-Match"),
+            request.headers.get("If-Modified-Since"),
+        ):
+            response = Response(None, 304)
+        response.headers.update(cache_header.get_http_headers())
+        return response
+
+    async def get_cache_key(
+        self, request: Request
+    ) -> Optional[Tuple[Hashable, Hashable]]:
+        """
+        Get a tuple of public and private keys for the request given, or None if http caching does not apply.
+        Only GET requests and persisted queries are cached. Keys are based on the query hash, variables and operation
+        name, with private keys also including the Authorization header.
+        """
+        if not isinstance(request, Request):
+            return None
+        try:
+            if request.method == "GET":
+                data = self.parse_query_params(request.query_params)
+            elif "application/json" in (request.headers.get("content-type") or ""):
+                data = await request.json()
+            else:
+                return None
+            extensions = data.get("extensions")
+            if isinstance(extensions, str):
+                extensions = json.loads(extensions)
+        except (ValueError, AttributeError):
+            return None  # Invalid requests are rejected when executed
+        persisted_query = (extensions or {}).get("persistedQuery")
+        if persisted_query:
+            query_hash = persisted_query.get("sha256Hash")
+        elif request.method == "GET" and data.get("query"):
+            query_hash = get_query_hash(data["query"])
+        else:
+            return None
+        public_key = (
+            query_hash,
+            json.dumps(data.get("variables"), sort_keys=True),
+            data.get("operationName"),
+        )
+        return public_key, (public_key, request.headers.get("Authorization"))
+
+    def get_cached_response(
+        self, cache_key: Tuple[Hashable, Hashable]
+    ) -> Optional[CachedResponse]:
+        if self.response_cache is None:
+            return None
+        public_key, private_key = cache_key
+        return self.response_cache.get(public_key) or self.response_cache.get(
+            private_key
+        )
+
+    def store_response(
+        self,
+        cache_key: Tuple[Hashable, Hashable],
+        response: Response,
+        cache_header: CacheHeader,
+    ):
+        if self.response_cache is None or not cache_header.expire_at:
+            return
+        expire_at = cache_header.expire_at.timestamp()
+        if expire_at <= time():
+            return
+        public_key, private_key = cache_key
+        cached_response = CachedResponse(
+            body=response.body,
+            headers=(("content-type", response.headers["content-type"]),),
+            cache_header=cache_header,
+        )
+        key = private_key if cache_header.private else public_key
+        self.response_cache.put(key, cached_response, expire_at)
+
+    async def process_result(
+        self, request: Request, result: ExecutionResult
+    ) -> GraphQLHTTPResponse:
+        if result.errors:
+            mark_uncacheable()
+        return await super().process_result(request, result)
+
+    async def execute_operation(
+        self, request, context, root_value: Optional[Any]
+    ) -> ExecutionResult:
+        try:
+            return await super().execute_operation(request, context, root_value)
+        except PersistedQueryError as e:
+            error = GraphQLError(e.message, extensions={"code": e.code})
+            return ExecutionResult(data=None, errors=[error])
+
+    async def parse_http_body(
+        self, request: AsyncHTTPRequestAdapter
+    ) -> GraphQLRequestData:
+        content_type = request.content_type or ""
+        if "application/json" in content_type:
+            # Parsed once, as the body may already have been read for the cache key
+            data = await request.request.json()
+        elif request.method == "GET" and not content_type.startswith(
+            "multipart/form-data"
+        ):
+            data = self.parse_query_params(request.query_params)
+        else:
+            return await super().parse_http_body(request)
+        return GraphQLRequestData(
+            query=self.get_query(data),
+            variables=data.get("variables"),
+            operation_name=data.get("operationName"),
+        )
+
+    def get_query(self, data: Dict[str, Any]) -> Optional[str]:
+        query = data.get("query")
+        extensions = data.get("extensions")
+        if isinstance(extensions, str):
+            extensions = json.loads(extensions)
+        persisted_query = (extensions or {}).get("persistedQuery")
+        if not persisted_query:
+            return query
+        query_hash = persisted_query.get("sha256Hash")
+        if query:
+            if get_query_hash(query) != query_hash:
+                raise PersistedQueryError(
+                    "provided sha does not match query", "BAD_REQUEST"
+                )
+            return query
+        cached_document = self.document_cache.get(query_hash)
+        if cached_document is None:
+            raise PersistedQueryError(
+                "PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND"
+            )
+        return cached_document.query
@@ -0,0 +1,23 @@
+import asyncio
+
+import strawberry
+from strawberry.types import ExecutionResult
+
+
+class ServeySchema(strawberry.Schema):
+    """
+    Schema in which resolvers for sync actions may be coroutines (See ExecutorHandlerFilter). When called from
+    synchronous code, execute_sync runs the operation on a new event loop, so it works for every schema.
+    """
+
+    def execute_sync(self, *args, **kwargs) -> ExecutionResult:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # A private loop, so the event loop for the current thread is left as it is
+            loop = asyncio.new_event_loop()
+            try:
+                return loop.run_until_complete(self.execute(*args, **kwargs))
+            finally:
+                loop.close()
+        return super().execute_sync(*args, **kwargs)
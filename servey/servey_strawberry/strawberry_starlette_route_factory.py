@@ -1,7 +1,7 @@
 import os
 from dataclasses import dataclass, field
 from logging import getLogger
-from typing import Iterator
+from typing import Iterator, Optional
 
 from starlette.routing import Route, WebSocketRoute, Mount
 from starlette.staticfiles import StaticFiles
@@ -9,6 +9,7 @@ from starlette.staticfiles import StaticFiles
 from servey.servey_starlette.route_factory.route_factory_abc import (
     RouteFactoryABC,
 )
+from servey.util.lru_cache import LruCache
 
 LOGGER = getLogger(__name__)
 
@@ -23,6 +24,10 @@ class StrawberryStarletteRouteFactory(RouteFactoryABC):
     debug: bool = field(
         default_factory=lambda: int(os.environ.get("SERVER_DEBUG", "1")) == 1
     )
+    # Parsed and validated documents, shared by all requests. (Created with the routes)
+    document_cache: Optional[LruCache] = None
+    # Responses to cacheable operations. (Created with the routes if SERVEY_GRAPHQL_RESPONSE_CACHE_MAX_BYTES is set)
+    response_cache: Optional[LruCache] = None
 
     def create_routes(self) -> Iterator[Route]:
         # Create an authenticator object based on username and password
@@ -30,13 +35,37 @@ class StrawberryStarletteRouteFactory(RouteFactoryABC):
             from servey.servey_strawberry.schema_factory import (
                 create_schema,
             )
-            from strawberry.asgi import GraphQL
+            from servey.servey_strawberry.document_cache import (
+                create_document_cache,
+                create_document_cache_extension,
+            )
+            from servey.servey_strawberry.servey_graphql import (
+                ServeyGraphQL,
+                create_graphql_response_cache,
+            )
 
+            if self.document_cache is None:
+                self.document_cache = create_document_cache()
+            if self.response_cache is None:
+                self.response_cache = create_graphql_response_cache()
             schema = create_schema()
             if not schema:
                 return
-            graphql_app = GraphQL(schema, debug=self.debug)
-            yield Route(path=self.graphql_path, methods=["post"], endpoint=graphql_app)
+            # Extensions are read for each operation, so may be added after the schema is created
+            schema.extensions = [
+                *schema.extensions,
+                create_document_cache_extension(self.document_cache),
+            ]
+            graphql_app = ServeyGraphQL(
+                schema,
+                graphiql=False,
+                debug=self.debug,
+                document_cache=self.document_cache,
+                response_cache=self.response_cache,
+            )
+            yield Route(
+                path=self.graphql_path, methods=["get", "post"], endpoint=graphql_app
+            )
             yield WebSocketRoute(path=self.graphql_path, endpoint=graphql_app)
             if self.debug:
                 # add as template route
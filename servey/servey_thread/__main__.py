@@ -19,6 +19,6 @@ _THREADS = []
 _LOGGER.info("Starting threads for actions...")
 for action, trigger in find_actions_with_trigger_type(FixedRateTrigger):
     _LOGGER.info(f"Starting: {action.name}")
-    t = FixedRateTriggerThread(action.fn, trigger, DAEMON)
+    t = FixedRateTriggerThread(action.fn, trigger, DAEMON, action.timeout, action.name)
     _THREADS.append(t)
     t.start()
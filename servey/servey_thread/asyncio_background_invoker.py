@@ -1,7 +1,9 @@
 import asyncio
+import inspect
 from asyncio import get_event_loop
 from dataclasses import dataclass
-from typing import Optional, Callable, Awaitable
+from functools import partial
+from typing import Optional, Awaitable
 
 from servey.action.action import Action
 from servey.event_channel.background.background_invoker_abc import (
@@ -9,6 +11,8 @@ from servey.event_channel.background.background_invoker_abc import (
     BackgroundInvokerFactoryABC,
     T,
 )
+from servey.executor.executor_abc import get_default_executor
+from servey.executor.timeout import run_with_timeout
 
 
 @dataclass
@@ -17,7 +21,7 @@ class AsyncioBackgroundInvoker(BackgroundInvokerABC):
 
     def invoke(self, event: T, delay: int = 0):
         loop = get_event_loop()
-        asyncio.run_coroutine_threadsafe(action_fn(self.action.fn, event, delay), loop)
+        asyncio.run_coroutine_threadsafe(action_fn(self.action, event, delay), loop)
 
 
 class AsyncioBackgroundInvokerFactory(BackgroundInvokerFactoryABC):
@@ -27,10 +31,17 @@ class AsyncioBackgroundInvokerFactory(BackgroundInvokerFactoryABC):
         return AsyncioBackgroundInvoker(action)
 
 
-async def action_fn(fn: Callable, event: T, delay: int):
+async def action_fn(action: Action, event: T, delay: int):
     if delay:
         await asyncio.sleep(delay)
-    result = fn(event)
+    fn = action.fn
+    if inspect.iscoroutinefunction(fn):
+        awaitable = fn(event)
+    else:
+        # Sync functions are run by the executor so they can be abandoned at the timeout rather than blocking the loop
+        executor = action.executor or get_default_executor()
+        awaitable = executor.execute(partial(fn, event), {})
+    result = await run_with_timeout(awaitable, action.timeout, action.name)
     if isinstance(result, Awaitable):
         result = await result
     return result
@@ -1,19 +1,50 @@
+import logging
 import time
-from threading import Thread
-from typing import Callable
+from threading import Event, Thread
+from typing import Callable, Optional
 
+from servey.executor.timeout import ActionTimeoutError, call_with_timeout
 from servey.trigger.fixed_rate_trigger import FixedRateTrigger
 
+LOGGER = logging.getLogger(__name__)
+
 
 class FixedRateTriggerThread(Thread):
+    """
+    Thread invoking a function at a fixed rate. A run abandoned at its timeout keeps going in the background, so
+    ticks are skipped until it finishes rather than overlapping with it.
+    """
+
+    # pylint: disable=R0913,R0917
     def __init__(
-        self, fn: Callable, fixed_rate_trigger: FixedRateTrigger, daemon: bool
+        self,
+        fn: Callable,
+        fixed_rate_trigger: FixedRateTrigger,
+        daemon: bool,
+        timeout: Optional[float] = None,
+        action_name: Optional[str] = None,
     ):
         Thread.__init__(self, daemon=daemon)
         self.fn = fn
         self.fixed_rate_trigger = fixed_rate_trigger
+        self.timeout = timeout
+        self.action_name = action_name or getattr(fn, "__name__", "action")
+        self.in_progress = Event()
 
     def run(self):
         while True:
             time.sleep(self.fixed_rate_trigger.interval)
-            self.fn()
+            if self.in_progress.is_set():
+                LOGGER.warning("fixed_rate_tick_skipped:%s", self.action_name)
+                continue
+            self.in_progress.set()
+            try:
+                call_with_timeout(self.invoke, self.timeout, self.action_name)
+            except ActionTimeoutError:
+                pass  # Already logged and counted - the schedule continues
+
+    def invoke(self):
+        try:
+            return self.fn()
+        finally:
+            self.in_progress.clear()
@@ -23,6 +23,7 @@ class WebPageActionEndpoint(ActionEndpoint):
     )
 
     def __post_init__(self):
+        super().__post_init__()
         if not self.template_name:
             self.template_name = f"{self.action.name}.j2"
 
@@ -36,10 +37,11 @@ class WebPageActionEndpoint(ActionEndpoint):
             if self.result_marshaller
             else None
         )
-        if self.result_schema:
-            error = next(self.result_schema.iter_errors(result_content), None)
-            if error:
-                raise HTTPException(500, str(error))
+        error = self.output_validation_policy.check(
+            self.action.name, self.result_schema, result_content
+        )
+        if error:
+            raise HTTPException(500, str(error))
         body = self.template.render(model=result_content)
 
         return Response(content=body, headers=result.headers)
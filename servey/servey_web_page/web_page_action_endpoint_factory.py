@@ -14,6 +14,8 @@ from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory_abc
 )
 from servey.servey_web_page.web_page_action_endpoint import WebPageActionEndpoint
 from servey.servey_web_page.web_page_trigger import WebPageTrigger
+from servey.validation.compiled_schema import compile_schema
+from servey.validation.output_validation_policy_abc import OutputValidationPolicyABC
 
 
 @dataclass
@@ -28,6 +30,7 @@ class WebPageActionEndpointFactory(ActionEndpointFactoryABC):
     )
     schema_context: SchemaContext = field(default_factory=get_default_schema_context)
     validate_output: bool = True
+    output_validation_policy: Optional[OutputValidationPolicyABC] = None
     path_pattern: str = "/actions/{action_name}"
 
     def create(
@@ -54,8 +57,8 @@ class WebPageActionEndpointFactory(ActionEndpointFactoryABC):
             params_marshaller=get_marshaller_for_params(
                 action.fn, skip_args, self.marshaller_context
             ),
-            params_schema=get_schema_for_params(
-                action.fn, skip_args, self.schema_context
+            params_schema=compile_schema(
+                get_schema_for_params(action.fn, skip_args, self.schema_context)
             ),
             result_marshaller=(
                 self.marshaller_context.get_marshaller(result_type)
@@ -63,10 +66,11 @@ class WebPageActionEndpointFactory(ActionEndpointFactoryABC):
                 else None
             ),
             result_schema=(
-                self.schema_context.schema_from_type(result_type)
+                compile_schema(self.schema_context.schema_from_type(result_type))
                 if self.validate_output and result_type
                 else None
             ),
+            output_validation_policy=self.output_validation_policy,
             template_name=trigger.template_name,
             response_headers={"Content-Type": content_type},
         )
@@ -20,6 +20,8 @@ from servey.servey_aws.event_handler.event_handler_abc import EventHandlerFactor
 from servey.servey_web_page.redirect import Redirect
 from servey.servey_web_page.web_page_response import WebPageResponse
 from servey.servey_web_page.web_page_trigger import WebPageTrigger, get_environment
+from servey.validation.compiled_schema import compile_schema
+from servey.validation.output_validation_policy_abc import OutputValidationPolicyABC
 
 
 @dataclass
@@ -54,6 +56,11 @@ class WebPageEventHandler(ApiGatewayEventHandler):
             result = WebPageResponse(result, headers=self.response_headers)
 
         dumped = self.result_marshaller.dump(result.model)
+        error = self.output_validation_policy.check(
+            self.action.name, self.result_schema, dumped
+        )
+        if error:
+            raise error
         body = self.template.render(model=dumped)
         response = {
             "statusCode": result.status_code,
@@ -70,6 +77,7 @@ class WebPageEventHandlerFactory(EventHandlerFactoryABC):
     auth_kwarg_name: Optional[str] = None
     authorizer: Optional[AuthorizerABC] = None
     validate_output: bool = True
+    output_validation_policy: Optional[OutputValidationPolicyABC] = None
     priority: int = 110
 
     def create(self, action: Action) -> Optional[WebPageEventHandler]:
@@ -84,7 +92,9 @@ class WebPageEventHandlerFactory(EventHandlerFactoryABC):
             fn, set(), self.schema_context.marshy_context
         )
         result_marshaller = None
-        param_schema = get_schema_for_params(fn, set(), self.schema_context)
+        param_schema = compile_schema(
+            get_schema_for_params(fn, set(), self.schema_context)
+        )
         result_schema = None
         sig = inspect.signature(fn)
         if sig.return_annotation != inspect.Signature.empty:
@@ -92,8 +102,8 @@ class WebPageEventHandlerFactory(EventHandlerFactoryABC):
                 sig.return_annotation
             )
             if self.validate_output:
-                result_schema = self.schema_context.schema_from_type(
-                    sig.return_annotation
+                result_schema = compile_schema(
+                    self.schema_context.schema_from_type(sig.return_annotation)
                 )
         authorizer = (
             get_default_authorizer()
@@ -110,6 +120,7 @@ class WebPageEventHandlerFactory(EventHandlerFactoryABC):
             auth_kwarg_name=auth_kwarg_name,
             authorizer=authorizer,
             priority=self.priority,
+            output_validation_policy=self.output_validation_policy,
             template_name=trigger.template_name or f"{action.name}.j2",
             response_headers={"Content-Type": content_type},
         )
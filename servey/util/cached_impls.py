@@ -0,0 +1,35 @@
+"""
+Memoized lookup of injecty implementations. get_impls resolves type hints and sorts implementations on every call, which
+is too costly for code run per request / event. Results here are reused until the implementations registered in the
+default context change.
+"""
+
+from threading import Lock
+from typing import Dict, Type, Tuple, FrozenSet, TypeVar
+
+from injecty import get_default_injecty_context, get_impls
+
+T = TypeVar("T")
+
+_cached_impls: Dict[Tuple[int, Type], Tuple[FrozenSet[Type], Tuple[Type, ...]]] = {}
+_cached_impls_lock = Lock()
+
+
+def get_cached_impls(base: Type[T]) -> Tuple[Type[T], ...]:
+    """Get the implementations of the base given, sorted in the same way as get_impls"""
+    context = get_default_injecty_context()
+    registered = context.impls.get(base) or frozenset()
+    key = (id(context), base)
+    entry = _cached_impls.get(key)
+    if entry is None or entry[0] != registered:
+        with _cached_impls_lock:
+            entry = _cached_impls.get(key)
+            if entry is None or entry[0] != registered:
+                impls = tuple(get_impls(base, permit_no_impl=True))
+                entry = _cached_impls[key] = (frozenset(registered), impls)
+    return entry[1]
+
+
+def clear_cached_impls():
+    with _cached_impls_lock:
+        _cached_impls.clear()
@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from time import time
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+def _unit_size(_) -> int:
+    return 1
+
+
+@dataclass
+class LruCacheStats:
+    """
+    Counters for a cache, suitable for exporting as metrics.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class LruCache(Generic[V]):
+    """
+    Thread safe, bounded least recently used cache. The size of each value is determined by the sizer (By default
+    every value has a size of 1, so max_size is a number of entries, but a sizer returning a number of bytes can
+    be used to bound memory instead). Values may have an expiry timestamp, after which they are not returned.
+    """
+
+    max_size: int = 1024
+    sizer: Callable[[V], int] = _unit_size
+    stats: LruCacheStats = field(default_factory=LruCacheStats, init=False)
+    size: int = field(default=0, init=False)
+    _entries: "OrderedDict[Hashable, Tuple[V, int, Optional[float]]]" = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+
+    def get(self, key: Hashable, now: Optional[float] = None) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            value, size, expire_at = entry
+            if expire_at is not None and expire_at <= (now or time()):
+                del self._entries[key]
+                self.size -= size
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: V, expire_at: Optional[float] = None) -> bool:
+        """Store the value given, returning False if it was too large to store"""
+        size = self.sizer(value)
+        if size > self.max_size:
+            return False
+        with self._lock:
+            existing = self._entries.pop(key, None)
+            if existing:
+                self.size -= existing[1]
+            self._entries[key] = (value, size, expire_at)
+            self.size += size
+            while self.size > self.max_size:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+                self.stats.evictions += 1
+        return True
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            existing = self._entries.pop(key, None)
+            if existing:
+                self.size -= existing[1]
+
+    def remove_expired(self, now: Optional[float] = None) -> int:
+        """Remove all expired entries (Which are otherwise only removed when requested), returning the number removed"""
+        now = now or time()
+        with self._lock:
+            expired = [
+                key
+                for key, (_, _, expire_at) in self._entries.items()
+                if expire_at is not None and expire_at <= now
+            ]
+            for key in expired:
+                _, size, _ = self._entries.pop(key)
+                self.size -= size
+        return len(expired)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._entries)
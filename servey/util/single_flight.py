@@ -0,0 +1,64 @@
+import asyncio
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key, so that only the first caller (the leader) executes the
+    function, and all callers arriving while it is in flight share its result (or exception). Nothing is retained
+    once the call completes - this is not a cache, so callers arriving after completion trigger a new execution.
+    """
+
+    executions: int = field(default=0, init=False)
+    coalesced: int = field(default=0, init=False)
+    _in_flight: Dict[Hashable, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+
+    async def run_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        # Tasks are bound to an event loop, so they are only shared within the same loop
+        key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            task = self._in_flight.get(key)
+            if task is None:
+                self.executions += 1
+                task = asyncio.ensure_future(fn())
+                self._in_flight[key] = task
+                task.add_done_callback(lambda t: self._done(key, t))
+            else:
+                self.coalesced += 1
+        # Shielded so that a cancelled follower does not cancel the execution for everyone else
+        return await asyncio.shield(task)
+
+    def run(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Synchronous version, for coalescing calls from multiple threads"""
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                self.executions += 1
+                future = Future()
+                self._in_flight[key] = future
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            self._done(key, future)
+        return future.result()
+
+    def _done(self, key: Hashable, future: Any):
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
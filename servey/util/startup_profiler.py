@@ -0,0 +1,266 @@
+"""
+Profiler for the cost of starting a servey application. Builds everything the starlette app and lambda router build
+at startup (Route factories, middleware, graphql schema, event handlers), measuring wall time and memory allocated
+for each phase, factory and action.
+"""
+
+import inspect
+import logging
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, is_dataclass
+from typing import List, Iterator, Optional
+
+from injecty import get_impls
+from marshy.types import ExternalItemType
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ProfileEntry:
+    phase: str
+    name: str
+    # Wall time in seconds
+    wall_time: float
+    # Net bytes allocated (and not yet freed), as reported by tracemalloc
+    allocated: int
+    # Error raised while building, if any
+    error: Optional[str] = None
+
+
+@dataclass
+class StartupProfiler:
+    entries: List[ProfileEntry] = field(default_factory=list)
+
+    @contextmanager
+    def measure(self, phase: str, name: str, catch_errors: bool = False):
+        """Measure the block, which may report (rather than raise) errors if catch_errors is set"""
+        tracing = tracemalloc.is_tracing()
+        allocated_before = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:  # pylint: disable=W0718
+            if not catch_errors:
+                raise
+            LOGGER.warning("startup_profile_error:%s:%s:%s", phase, name, e)
+            error = str(e) or type(e).__name__
+        finally:
+            wall_time = time.perf_counter() - start
+            allocated = (
+                tracemalloc.get_traced_memory()[0] - allocated_before if tracing else 0
+            )
+            self.entries.append(ProfileEntry(phase, name, wall_time, allocated, error))
+
+    def profile(self):
+        """Build everything built on startup, in the order the starlette app and lambda router build it"""
+        tracemalloc.start()
+        try:
+            self.profile_discovery()
+            self.profile_route_factories()
+            self.profile_middleware_factories()
+            self.profile_graphql()
+            self.profile_event_handlers()
+            self.profile_jinja()
+        finally:
+            tracemalloc.stop()
+
+    def profile_discovery(self):
+        # pylint: disable=C0415
+        from servey.finder.action_finder_abc import get_action_registry
+        from servey.finder.event_channel_finder_abc import (
+            get_event_channel_registry,
+        )
+
+        with self.measure("discovery", "injecty"):
+            from servey.servey_starlette.route_factory.route_factory_abc import (
+                RouteFactoryABC,
+            )
+
+            get_impls(RouteFactoryABC)
+        with self.measure("discovery", "actions"):
+            get_action_registry()
+        with self.measure("discovery", "event_channels"):
+            get_event_channel_registry()
+
+    def profile_route_factories(self):
+        # pylint: disable=C0415
+        from servey.finder.action_finder_abc import find_actions
+        from servey.servey_starlette.route_factory.action_route_factory import (
+            ActionRouteFactory,
+        )
+        from servey.servey_starlette.route_factory.route_factory_abc import (
+            RouteFactoryABC,
+        )
+
+        route_factories = sorted(
+            get_impls(RouteFactoryABC), key=lambda f: f.priority, reverse=True
+        )
+        for route_factory_type in route_factories:
+            name = route_factory_type.__name__
+            with self.measure("route_factory", name):
+                route_factory = route_factory_type()
+                if not isinstance(route_factory, ActionRouteFactory):
+                    list(route_factory.create_routes())
+                    continue
+                # Equivalent to create_routes, but broken down by action
+                for action in find_actions():
+                    with self.measure("action_endpoint", action.name):
+                        route_factory.create_route(action)
+
+    def profile_middleware_factories(self):
+        # pylint: disable=C0415
+        from servey.servey_starlette.middleware.middleware_factory_abc import (
+            MiddlewareFactoryABC,
+        )
+
+        for middleware_factory_type in get_impls(MiddlewareFactoryABC):
+            with self.measure("middleware_factory", middleware_factory_type.__name__):
+                middleware_factory_type().create()
+
+    def profile_graphql(self):
+        """
+        The graphql schema is also built by its route factory - it is built again here with a breakdown by action
+        """
+        try:
+            # pylint: disable=C0415
+            from servey.servey_strawberry.schema_factory import create_schema_factory
+        except ModuleNotFoundError:
+            return
+        from servey.finder.action_finder_abc import (  # pylint: disable=C0415
+            find_actions_with_trigger_type,
+        )
+        from servey.trigger.web_trigger import WebTrigger  # pylint: disable=C0415
+
+        with self.measure("graphql", "create_schema_factory"):
+            schema_factory = create_schema_factory()
+        for action, trigger in find_actions_with_trigger_type(WebTrigger):
+            with self.measure("graphql_field", action.name):
+                schema_factory.create_field_for_action(action, trigger)
+        with self.measure("graphql", "create_schema"):
+            schema_factory.create_schema()
+
+    def profile_event_handlers(self):
+        """
+        Build event handlers for the actions served by the lambda routers. Actions which are methods of dataclasses
+        are built the way the appsync router builds them, as fields of the types returned by other actions.
+        """
+        # pylint: disable=C0415
+        from servey.action.action import get_action
+        from servey.finder.action_finder_abc import find_actions
+
+        try:
+            from servey.servey_aws.event_handler.event_handler_abc import (
+                create_event_handlers,
+            )
+            from servey.servey_aws.router.appsync_router import AppsyncRouter
+            from servey.servey_aws.router.router_abc import find_routers
+        except ModuleNotFoundError:
+            return
+        with self.measure("lambda", "find_routers"):
+            find_routers()
+        appsync_router = AppsyncRouter()
+        nested_fns = set()
+        for action, _ in appsync_router.web_trigger_actions:
+            parent_type = _get_parent_type(action)
+            if not is_dataclass(parent_type):
+                continue
+            for name, value in vars(parent_type).items():
+                if get_action(value) and value not in nested_fns:
+                    nested_fns.add(value)
+                    with self.measure("event_handler", name, catch_errors=True):
+                        nested_action = appsync_router.create_nested_action(
+                            parent_type.__name__, name
+                        )
+                        create_event_handlers(nested_action)
+        for action in find_actions():
+            if action.fn in nested_fns:
+                continue
+            with self.measure("event_handler", action.name, catch_errors=True):
+                create_event_handlers(action)
+
+    def profile_jinja(self):
+        try:
+            # pylint: disable=C0415
+            from servey.servey_web_page.web_page_trigger import get_environment
+        except ModuleNotFoundError:
+            return
+        with self.measure("jinja", "get_environment"):
+            try:
+                get_environment()
+            except (ModuleNotFoundError, ValueError) as e:
+                LOGGER.info("no_templates:%s", e)
+
+    def get_phase_totals(self) -> Iterator[ProfileEntry]:
+        """Get totals for each phase. (Entries nested within others are excluded, as they are already counted)"""
+        totals = {}
+        for entry in self.entries:
+            if entry.phase in _NESTED_PHASES:
+                continue
+            wall_time, allocated = totals.get(entry.phase, (0, 0))
+            totals[entry.phase] = (
+                wall_time + entry.wall_time,
+                allocated + entry.allocated,
+            )
+        for phase, (wall_time, allocated) in totals.items():
+            yield ProfileEntry(phase, "total", wall_time, allocated)
+
+    def to_json(self) -> ExternalItemType:
+        return {
+            "entries": [_entry_to_json(e) for e in self.entries],
+            "totals": [_entry_to_json(e) for e in self.get_phase_totals()],
+        }
+
+    def to_table(self) -> str:
+        rows = [("phase", "name", "ms", "KiB", "error")]
+        for entry in (*self.entries, *self.get_phase_totals()):
+            rows.append(
+                (
+                    entry.phase,
+                    entry.name,
+                    f"{entry.wall_time * 1000:.1f}",
+                    f"{entry.allocated / 1024:.1f}",
+                    entry.error or "",
+                )
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(4)]
+        lines = []
+        for row in rows:
+            lines.append(
+                "  ".join(
+                    (
+                        row[0].ljust(widths[0]),
+                        row[1].ljust(widths[1]),
+                        row[2].rjust(widths[2]),
+                        row[3].rjust(widths[3]),
+                        row[4],
+                    )
+                ).rstrip()
+            )
+        return "\n".join(lines)
+
+
+# Phases measured within another phase
+_NESTED_PHASES = ("action_endpoint",)
+
+
+def _entry_to_json(entry: ProfileEntry) -> ExternalItemType:
+    return {
+        "phase": entry.phase,
+        "name": entry.name,
+        "wall_time_ms": round(entry.wall_time * 1000, 3),
+        "allocated_bytes": entry.allocated,
+        "error": entry.error,
+    }
+
+
+def _get_parent_type(action):
+    """Get the type for which nested actions are resolved, in the same way as the appsync router"""
+    # pylint: disable=C0415
+    from marshy.factory.optional_marshaller_factory import get_optional_type
+
+    return_type = inspect.signature(action.fn).return_annotation
+    return get_optional_type(return_type) or return_type
@@ -0,0 +1,427 @@
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Iterator, Dict, List, Tuple, Any
+
+from injecty import InjectyContext
+from jsonschema import ValidationError
+from marshy.types import ExternalType, ExternalItemType
+from schemey import Schema
+from schemey.schemey_format_checker import SchemeyFormatChecker
+
+Check = Callable[[ExternalType], Optional[ValidationError]]
+
+# Keywords which do not affect validation
+_ANNOTATIONS = frozenset(
+    (
+        "$comment",
+        "$defs",
+        "$id",
+        "$schema",
+        "default",
+        "definitions",
+        "deprecated",
+        "description",
+        "examples",
+        "name",
+        "readOnly",
+        "title",
+        "writeOnly",
+    )
+)
+_TYPE_CHECKS = {
+    "array": lambda i: isinstance(i, list),
+    "boolean": lambda i: isinstance(i, bool),
+    "integer": lambda i: (isinstance(i, int) and not isinstance(i, bool))
+    or (isinstance(i, float) and i.is_integer()),
+    "null": lambda i: i is None,
+    "number": lambda i: isinstance(i, (int, float)) and not isinstance(i, bool),
+    "object": lambda i: isinstance(i, dict),
+    "string": lambda i: isinstance(i, str),
+}
+
+
+@dataclass
+class CompiledSchema(Schema):
+    """
+    Schema where validation logic is converted to a tree of python closures once, rather than being interpreted
+    by jsonschema on every call. Schemas using keywords which are not supported by the compiler fall back to a
+    jsonschema validator which is also built only once. Unlike a standard schema, iter_errors yields only the first
+    error found.
+    """
+
+    check: Check = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.check is None:
+            self.check = compile_check(self)
+
+    def iter_errors(self, item: ExternalType) -> Iterator[ValidationError]:
+        error = self.check(item)
+        if error:
+            yield error
+
+    def validate(self, item: ExternalType, injecty_context: InjectyContext = None):
+        error = self.check(item)
+        if error:
+            raise error
+
+
+_COMPILED_SCHEMAS: Dict[Tuple[str, Any], CompiledSchema] = {}
+
+
+def compile_schema(schema: Optional[Schema]) -> Optional[CompiledSchema]:
+    """
+    Compile the schema given. Schemas are cached by value, so endpoints and event handlers for the same action
+    share the same compiled validator
+    """
+    if schema is None or isinstance(schema, CompiledSchema):
+        return schema
+    key = json.dumps(schema.schema, sort_keys=True, default=str)
+    try:
+        cache_key = (key, schema.python_type)
+        compiled = _COMPILED_SCHEMAS.get(cache_key)
+    except TypeError:  # Unhashable python type
+        cache_key = None
+        compiled = None
+    if compiled is None:
+        compiled = CompiledSchema(schema.schema, schema.python_type)
+        if cache_key:
+            _COMPILED_SCHEMAS[cache_key] = compiled
+    return compiled
+
+
+def compile_check(schema: Schema) -> Check:
+    try:
+        return _Compiler(schema.schema).compile(schema.schema)
+    except _UnsupportedError:
+        validator = schema.validator()
+
+        def interpreted_check(item: ExternalType) -> Optional[ValidationError]:
+            return next(validator.iter_errors(instance=item), None)
+
+        return interpreted_check
+
+
+class _UnsupportedError(Exception):
+    pass
+
+
+@dataclass
+class _Compiler:
+    root: ExternalItemType
+    refs: Dict[str, Check] = field(default_factory=dict)
+    format_checker: SchemeyFormatChecker = field(default_factory=SchemeyFormatChecker)
+
+    def compile(self, schema: ExternalType) -> Check:
+        if schema is True:
+            return _accept
+        if schema is False:
+            return _reject
+        if not isinstance(schema, dict):
+            raise _UnsupportedError(schema)
+        checks = []
+        handled = set(_ANNOTATIONS)
+        for keywords, compile_fn in self.keyword_compilers():
+            if any(k in schema for k in keywords):
+                handled.update(keywords)
+                checks.append(compile_fn(schema))
+        unsupported = set(schema).difference(handled)
+        if unsupported:
+            raise _UnsupportedError(unsupported)
+        return _all(checks)
+
+    def keyword_compilers(self) -> Iterator[Tuple[Tuple[str, ...], Callable]]:
+        yield ("$ref",), self.compile_ref
+        yield ("type",), _compile_type
+        yield ("enum",), _compile_enum
+        yield ("const",), _compile_const
+        yield (
+            "properties",
+            "required",
+            "additionalProperties",
+        ), self.compile_properties
+        yield ("items",), self.compile_items
+        yield ("minItems", "maxItems"), _compile_array_size
+        yield ("minLength", "maxLength"), _compile_string_length
+        yield ("pattern",), _compile_pattern
+        yield ("format",), self.compile_format
+        yield (
+            "minimum",
+            "maximum",
+            "exclusiveMinimum",
+            "exclusiveMaximum",
+        ), _compile_number_range
+        yield ("anyOf",), self.compile_any_of
+        yield ("allOf",), self.compile_all_of
+
+    def compile_ref(self, schema: ExternalItemType) -> Check:
+        ref = schema["$ref"]
+        check = self.refs.get(ref)
+        if check:
+            return check
+        if not ref.startswith("#"):
+            raise _UnsupportedError(ref)
+        # Resolve lazily to support recursive schemas
+        resolved: List[Check] = []
+
+        def ref_check(item: ExternalType) -> Optional[ValidationError]:
+            return resolved[0](item)
+
+        self.refs[ref] = ref_check
+        referenced = self.root
+        for part in ref[2:].split("/") if ref not in ("#", "#/") else []:
+            part = part.replace("~1", "/").replace("~0", "~")
+            if isinstance(referenced, list):
+                referenced = referenced[int(part)]
+            else:
+                referenced = referenced[part]
+        resolved.append(self.compile(referenced))
+        return ref_check
+
+    def compile_properties(self, schema: ExternalItemType) -> Check:
+        property_checks = {
+            k: self.compile(v) for k, v in (schema.get("properties") or {}).items()
+        }
+        required = tuple(schema.get("required") or ())
+        additional_properties = schema.get("additionalProperties", True)
+        additional_check = None
+        if additional_properties is not True:
+            additional_check = self.compile(additional_properties)
+
+        def check_properties(item: ExternalType) -> Optional[ValidationError]:
+            if not isinstance(item, dict):
+                return None
+            for key in required:
+                if key not in item:
+                    return ValidationError(
+                        f"{key!r} is a required property", validator="required"
+                    )
+            for key, value in item.items():
+                property_check = property_checks.get(key)
+                if property_check is None:
+                    if additional_check is None:
+                        continue
+                    if additional_check is _reject:
+                        return ValidationError(
+                            f"Additional properties are not allowed ({key!r} was unexpected)",
+                            validator="additionalProperties",
+                        )
+                    property_check = additional_check
+                error = property_check(value)
+                if error:
+                    error.path.appendleft(key)
+                    return error
+            return None
+
+        return check_properties
+
+    def compile_items(self, schema: ExternalItemType) -> Check:
+        item_check = self.compile(schema["items"])
+
+        def check_items(item: ExternalType) -> Optional[ValidationError]:
+            if not isinstance(item, list):
+                return None
+            for index, value in enumerate(item):
+                error = item_check(value)
+                if error:
+                    error.path.appendleft(index)
+                    return error
+            return None
+
+        return check_items
+
+    def compile_format(self, schema: ExternalItemType) -> Check:
+        format_ = schema["format"]
+        format_checker = self.format_checker
+
+        def check_format(item: ExternalType) -> Optional[ValidationError]:
+            if format_checker.conforms(item, format_):
+                return None
+            return ValidationError(f"{item!r} is not a {format_!r}", validator="format")
+
+        return check_format
+
+    def compile_any_of(self, schema: ExternalItemType) -> Check:
+        checks = [self.compile(s) for s in schema["anyOf"]]
+
+        def check_any_of(item: ExternalType) -> Optional[ValidationError]:
+            for check in checks:
+                if check(item) is None:
+                    return None
+            return ValidationError(
+                f"{item!r} is not valid under any of the given schemas",
+                validator="anyOf",
+            )
+
+        return check_any_of
+
+    def compile_all_of(self, schema: ExternalItemType) -> Check:
+        return _all([self.compile(s) for s in schema["allOf"]])
+
+
+def _accept(_: ExternalType) -> Optional[ValidationError]:
+    return None
+
+
+def _reject(item: ExternalType) -> Optional[ValidationError]:
+    return ValidationError(f"False schema does not allow {item!r}", validator="false")
+
+
+def _all(checks: List[Check]) -> Check:
+    if not checks:
+        return _accept
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(item: ExternalType) -> Optional[ValidationError]:
+        for check in checks:
+            error = check(item)
+            if error:
+                return error
+        return None
+
+    return check_all
+
+
+def _compile_type(schema: ExternalItemType) -> Check:
+    types = schema["type"]
+    if isinstance(types, str):
+        types = [types]
+    try:
+        type_checks = [_TYPE_CHECKS[t] for t in types]
+    except KeyError as e:
+        raise _UnsupportedError(types) from e
+    if len(type_checks) == 1:
+        type_check = type_checks[0]
+    else:
+
+        def type_check(item: ExternalType) -> bool:
+            return any(c(item) for c in type_checks)
+
+    description = types[0] if len(types) == 1 else types
+
+    def check_type(item: ExternalType) -> Optional[ValidationError]:
+        if type_check(item):
+            return None
+        return ValidationError(
+            f"{item!r} is not of type {description!r}", validator="type"
+        )
+
+    return check_type
+
+
+def _json_equals(a: ExternalType, b: ExternalType) -> bool:
+    """Json equality differs from python equality in that True != 1"""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_json_equals(v, b[k]) for k, v in a.items())
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_json_equals(i, j) for i, j in zip(a, b))
+    return a == b
+
+
+def _compile_enum(schema: ExternalItemType) -> Check:
+    enum = tuple(schema["enum"])
+
+    def check_enum(item: ExternalType) -> Optional[ValidationError]:
+        for value in enum:
+            if _json_equals(item, value):
+                return None
+        return ValidationError(
+            f"{item!r} is not one of {list(enum)!r}", validator="enum"
+        )
+
+    return check_enum
+
+
+def _compile_const(schema: ExternalItemType) -> Check:
+    const = schema["const"]
+
+    def check_const(item: ExternalType) -> Optional[ValidationError]:
+        if _json_equals(item, const):
+            return None
+        return ValidationError(f"{const!r} was expected", validator="const")
+
+    return check_const
+
+
+def _compile_array_size(schema: ExternalItemType) -> Check:
+    min_items = schema.get("minItems")
+    max_items = schema.get("maxItems")
+
+    def check_array_size(item: ExternalType) -> Optional[ValidationError]:
+        if not isinstance(item, list):
+            return None
+        if min_items is not None and len(item) < min_items:
+            return ValidationError(f"{item!r} is too short", validator="minItems")
+        if max_items is not None and len(item) > max_items:
+            return ValidationError(f"{item!r} is too long", validator="maxItems")
+        return None
+
+    return check_array_size
+
+
+def _compile_string_length(schema: ExternalItemType) -> Check:
+    min_length = schema.get("minLength")
+    max_length = schema.get("maxLength")
+
+    def check_string_length(item: ExternalType) -> Optional[ValidationError]:
+        if not isinstance(item, str):
+            return None
+        if min_length is not None and len(item) < min_length:
+            return ValidationError(f"{item!r} is too short", validator="minLength")
+        if max_length is not None and len(item) > max_length:
+            return ValidationError(f"{item!r} is too long", validator="maxLength")
+        return None
+
+    return check_string_length
+
+
+def _compile_pattern(schema: ExternalItemType) -> Check:
+    pattern = schema["pattern"]
+    search = re.compile(pattern).search
+
+    def check_pattern(item: ExternalType) -> Optional[ValidationError]:
+        if not isinstance(item, str) or search(item):
+            return None
+        return ValidationError(
+            f"{item!r} does not match {pattern!r}", validator="pattern"
+        )
+
+    return check_pattern
+
+
+def _compile_number_range(schema: ExternalItemType) -> Check:
+    minimum = schema.get("minimum")
+    maximum = schema.get("maximum")
+    exclusive_minimum = schema.get("exclusiveMinimum")
+    exclusive_maximum = schema.get("exclusiveMaximum")
+
+    # pylint: disable=R0911
+    def check_number_range(item: ExternalType) -> Optional[ValidationError]:
+        if not isinstance(item, (int, float)) or isinstance(item, bool):
+            return None
+        if minimum is not None and item < minimum:
+            return ValidationError(
+                f"{item!r} is less than the minimum of {minimum!r}", validator="minimum"
+            )
+        if maximum is not None and item > maximum:
+            return ValidationError(
+                f"{item!r} is greater than the maximum of {maximum!r}",
+                validator="maximum",
+            )
+        if exclusive_minimum is not None and item <= exclusive_minimum:
+            return ValidationError(
+                f"{item!r} is less than or equal to the minimum of {exclusive_minimum!r}",
+                validator="exclusiveMinimum",
+            )
+        if exclusive_maximum is not None and item >= exclusive_maximum:
+            return ValidationError(
+                f"{item!r} is greater than or equal to the maximum of {exclusive_maximum!r}",
+                validator="exclusiveMaximum",
+            )
+        return None
+
+    return check_number_range
@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+
+from servey.validation.output_validation_policy_abc import (
+    OutputValidationPolicyABC,
+    OutputValidationStats,
+)
+
+
+@dataclass
+class FirstOutputValidationPolicy(OutputValidationPolicyABC):
+    """
+    Policy which validates the first results for each action, and then stops validating. Useful for catching
+    mismatches between an action and its declared return type shortly after a deployment.
+    """
+
+    count: int = 10
+    fail_on_violation: bool = True
+    stats: OutputValidationStats = field(default_factory=OutputValidationStats)
+
+    def should_validate(self, action_name: str) -> bool:
+        return self.stats.validated.get(action_name, 0) < self.count
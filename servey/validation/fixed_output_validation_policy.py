@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+
+from servey.validation.output_validation_policy_abc import (
+    OutputValidationPolicyABC,
+    OutputValidationStats,
+)
+
+
+@dataclass
+class FixedOutputValidationPolicy(OutputValidationPolicyABC):
+    """
+    Policy which either always or never validates results
+    """
+
+    validate: bool = True
+    fail_on_violation: bool = True
+    stats: OutputValidationStats = field(default_factory=OutputValidationStats)
+
+    def should_validate(self, action_name: str) -> bool:
+        return self.validate
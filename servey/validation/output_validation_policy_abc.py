@@ -0,0 +1,64 @@
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, Optional
+
+from jsonschema import ValidationError
+from marshy.types import ExternalType
+from schemey import Schema
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class OutputValidationStats:
+    """
+    Per action counters for output validation, suitable for exporting as metrics.
+    """
+
+    validated: Dict[str, int] = field(default_factory=dict)
+    skipped: Dict[str, int] = field(default_factory=dict)
+    violations: Dict[str, int] = field(default_factory=dict)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+
+    def increment(self, counter: Dict[str, int], action_name: str) -> int:
+        with self._lock:
+            value = counter[action_name] = counter.get(action_name, 0) + 1
+            return value
+
+
+class OutputValidationPolicyABC(ABC):
+    """
+    Policy determining whether the result of an action is validated against its schema. Validation is a
+    safety net for bugs in the action itself, so it may be sampled or disabled in production.
+    """
+
+    stats: OutputValidationStats
+    fail_on_violation: bool
+
+    @abstractmethod
+    def should_validate(self, action_name: str) -> bool:
+        """Determine whether the next result for the action given should be validated"""
+
+    def check(
+        self, action_name: str, schema: Optional[Schema], result: ExternalType
+    ) -> Optional[ValidationError]:
+        """
+        Check the dumped result given against the schema, if required. Violations are counted and logged - an
+        error is returned only if the policy is configured to fail on violations.
+        """
+        if schema is None:
+            return None
+        if not self.should_validate(action_name):
+            self.stats.increment(self.stats.skipped, action_name)
+            return None
+        self.stats.increment(self.stats.validated, action_name)
+        error = next(schema.iter_errors(result), None)
+        if error is None:
+            return None
+        self.stats.increment(self.stats.violations, action_name)
+        LOGGER.warning(f"output_validation_failed:{action_name}:{error}")
+        if self.fail_on_violation:
+            return error
+        return None
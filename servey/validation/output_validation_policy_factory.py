@@ -0,0 +1,48 @@
+import os
+
+from servey.validation.first_output_validation_policy import (
+    FirstOutputValidationPolicy,
+)
+from servey.validation.fixed_output_validation_policy import (
+    FixedOutputValidationPolicy,
+)
+from servey.validation.output_validation_policy_abc import OutputValidationPolicyABC
+from servey.validation.sampled_output_validation_policy import (
+    SampledOutputValidationPolicy,
+)
+
+_default_output_validation_policy = None
+
+
+# pylint: disable=W0603
+def get_default_output_validation_policy() -> OutputValidationPolicyABC:
+    """
+    Get the default policy, as defined by the SERVEY_OUTPUT_VALIDATION environment variable:
+    * always (Default): Validate every result
+    * never: Never validate results
+    * debug: Validate every result if SERVER_DEBUG is set, otherwise never validate
+    * sample:<rate>: Validate a random sample of results. (e.g.: sample:0.05 validates 5%)
+    * first:<count>: Validate the first results for each action. (e.g.: first:10)
+    """
+    global _default_output_validation_policy
+    if not _default_output_validation_policy:
+        _default_output_validation_policy = output_validation_policy_from_str(
+            os.environ.get("SERVEY_OUTPUT_VALIDATION") or "always"
+        )
+    return _default_output_validation_policy
+
+
+def output_validation_policy_from_str(value: str) -> OutputValidationPolicyABC:
+    mode, _, arg = value.strip().lower().partition(":")
+    if mode == "always":
+        return FixedOutputValidationPolicy(True)
+    if mode == "never":
+        return FixedOutputValidationPolicy(False)
+    if mode == "debug":
+        debug = int(os.environ.get("SERVER_DEBUG", "1")) == 1
+        return FixedOutputValidationPolicy(debug)
+    if mode == "sample":
+        return SampledOutputValidationPolicy(float(arg))
+    if mode == "first":
+        return FirstOutputValidationPolicy(int(arg))
+    raise ValueError(f"invalid_output_validation_policy:{value}")
@@ -0,0 +1,22 @@
+import random
+from dataclasses import dataclass, field
+
+from servey.validation.output_validation_policy_abc import (
+    OutputValidationPolicyABC,
+    OutputValidationStats,
+)
+
+
+@dataclass
+class SampledOutputValidationPolicy(OutputValidationPolicyABC):
+    """
+    Policy which validates a random sample of results. (A rate of 0.05 validates roughly 5% of results)
+    Since only some invalid results would be caught, violations are reported rather than failing requests.
+    """
+
+    rate: float = 0.01
+    fail_on_violation: bool = False
+    stats: OutputValidationStats = field(default_factory=OutputValidationStats)
+
+    def should_validate(self, action_name: str) -> bool:
+        return random.random() < self.rate
@@ -26,9 +26,16 @@ extras_require = {
         "ruamel.yaml~=0.17",
         "strawberry-graphql~=0.177",  # We need this to generate the graphql schema - or do we?
     ],
+    "compression": [
+        "brotli~=1.0",
+        "zstandard~=0.21",
+    ],
     "web_page": [
         "Jinja2~=3.1",
     ],
+    "orjson": [
+        "orjson~=3.8",
+    ],
 }
 extras_require["all"] = list(
     {
@@ -43,3 +43,12 @@ class TestCacheHeader(TestCase):
             datetime.fromisoformat("2020-05-01"),
         )
         self.assertEqual(f, d)
+
+    def test_combine_with_private(self):
+        public = CacheHeader("a", private=False)
+        private = CacheHeader("b", must_revalidate=True)
+        self.assertFalse(public.combine_with([public]).private)
+        combined = public.combine_with([private])
+        self.assertTrue(combined.private)
+        self.assertTrue(combined.must_revalidate)
+        self.assertTrue(private.combine_with([public]).private)
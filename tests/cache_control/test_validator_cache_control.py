@@ -0,0 +1,109 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import List
+from unittest import TestCase
+
+from servey.action.action import action, get_action
+from servey.cache_control.cache_header import CacheHeader
+from servey.cache_control.ttl_cache_control import TtlCacheControl
+from servey.cache_control.validator_cache_control import ValidatorCacheControl
+from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory import (
+    ActionEndpointFactory,
+)
+from servey.servey_starlette.action_endpoint.factory.caching_action_endpoint_factory import (
+    CachingActionEndpointFactory,
+)
+from servey.trigger.web_trigger import WEB_GET
+from tests.servey_aws.test_lambda_invoker import get_invoker
+from tests.servey_starlette.action_endpoint.test_action_endpoint import (
+    build_request,
+)
+
+CALLS: List[str] = []
+
+
+def get_item_version(item_id: str) -> str:
+    return f"{item_id}-v3"
+
+
+@action(
+    triggers=(WEB_GET,),
+    cache_control=TtlCacheControl(30, ValidatorCacheControl(get_item_version)),
+)
+def get_item(item_id: str, detail: bool = False) -> str:
+    CALLS.append(item_id)
+    return f"Item {item_id}"
+
+
+class TestValidatorCacheControl(TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_get_cache_header_for_params(self):
+        cache_control = ValidatorCacheControl(get_item_version)
+        self.assertEqual(
+            CacheHeader(etag="a-v3"),
+            cache_control.get_cache_header_for_params(dict(item_id="a", detail=True)),
+        )
+        updated_at = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        cache_control = ValidatorCacheControl(lambda **kwargs: updated_at)
+        self.assertEqual(
+            CacheHeader(updated_at=updated_at),
+            cache_control.get_cache_header_for_params(dict(item_id="a")),
+        )
+        cache_control = ValidatorCacheControl(lambda: None)
+        self.assertIsNone(cache_control.get_cache_header_for_params(dict(item_id="a")))
+
+    def test_supports_cache_header_for_params(self):
+        self.assertTrue(
+            TtlCacheControl(
+                10, ValidatorCacheControl(get_item_version)
+            ).supports_cache_header_for_params()
+        )
+        self.assertFalse(TtlCacheControl(10).supports_cache_header_for_params())
+
+    def test_starlette_not_modified(self):
+        action_endpoint = CachingActionEndpointFactory(response_cache=None).create(
+            get_action(get_item), set(), [ActionEndpointFactory()]
+        )
+        loop = asyncio.get_event_loop()
+        request = build_request(query_string=b"item_id=a")
+        response = loop.run_until_complete(action_endpoint.execute(request))
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("Item a", json.loads(response.body))
+        self.assertEqual("a-v3", response.headers["etag"])
+        self.assertEqual(["a"], CALLS)
+
+        request = build_request(
+            query_string=b"item_id=b", headers={"If-None-Match": "b-v3"}
+        )
+        response = loop.run_until_complete(action_endpoint.execute(request))
+        self.assertEqual(304, response.status_code)
+        self.assertEqual("b-v3", response.headers["etag"])
+        self.assertEqual(["a"], CALLS)
+
+        request = build_request(
+            query_string=b"item_id=c", headers={"If-None-Match": "c-v2"}
+        )
+        response = loop.run_until_complete(action_endpoint.execute(request))
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(["a", "c"], CALLS)
+
+    def test_lambda_not_modified(self):
+        invoker = get_invoker(get_item)
+        event = {
+            "httpMethod": "GET",
+            "queryStringParameters": {"item_id": "a"},
+            "headers": {"If-None-Match": "a-v3"},
+        }
+        result = invoker(event, None)
+        self.assertEqual(304, result["statusCode"])
+        self.assertEqual("a-v3", result["headers"]["ETag"])
+        self.assertEqual([], CALLS)
+        event["headers"] = {"If-None-Match": "a-v2"}
+        result = invoker(event, None)
+        self.assertEqual(200, result["statusCode"])
+        self.assertEqual('"Item a"', result["body"])
+        self.assertEqual("a-v3", result["headers"]["ETag"])
+        self.assertEqual(["a"], CALLS)
@@ -0,0 +1,113 @@
+import asyncio
+import json
+from unittest import TestCase
+
+from servey.action.action import action, get_action
+from servey.action.concurrency_limit import ConcurrencyLimit
+from servey.executor.concurrency_limiter import (
+    ConcurrencyLimiter,
+    ConcurrencyLimitError,
+    get_concurrency_limiter,
+    get_concurrency_limiters,
+)
+from servey.servey_starlette.action_endpoint.concurrency_limiting_action_endpoint import (
+    ConcurrencyLimitingActionEndpoint,
+)
+from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory import (
+    ActionEndpointFactory,
+)
+from servey.servey_starlette.action_endpoint.factory.concurrency_limiting_action_endpoint_factory import (
+    ConcurrencyLimitingActionEndpointFactory,
+)
+from servey.trigger.web_trigger import WEB_GET
+from tests.servey_starlette.action_endpoint.test_action_endpoint import build_request
+
+
+class TestConcurrencyLimiter(TestCase):
+    def test_limit(self):
+        limiter = ConcurrencyLimiter("test", ConcurrencyLimit(2, max_queued=1))
+        running = []
+        max_running = 0
+
+        async def run(value: int):
+            nonlocal max_running
+            async with limiter.limit_concurrency():
+                running.append(value)
+                max_running = max(max_running, len(running))
+                await asyncio.sleep(0.01)
+                running.remove(value)
+                return value
+
+        async def run_all():
+            return await asyncio.gather(
+                *[run(i) for i in range(4)], return_exceptions=True
+            )
+
+        results = asyncio.get_event_loop().run_until_complete(run_all())
+        self.assertEqual([0, 1, 2], results[:3])
+        self.assertIsInstance(results[3], ConcurrencyLimitError)
+        self.assertEqual(2, max_running)
+        self.assertEqual(1, limiter.rejected)
+        self.assertEqual(0, limiter.in_flight)
+        self.assertEqual(0, limiter.queue_depth)
+
+    def test_queue_timeout(self):
+        limit = ConcurrencyLimit(1, max_queued=1, queue_timeout=0.01)
+        limiter = ConcurrencyLimiter("test", limit)
+
+        async def run():
+            async with limiter.limit_concurrency():
+                await asyncio.sleep(0.1)
+
+        async def run_all():
+            return await asyncio.gather(run(), run(), return_exceptions=True)
+
+        results = asyncio.get_event_loop().run_until_complete(run_all())
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], ConcurrencyLimitError)
+        self.assertEqual(1, limiter.timed_out)
+        self.assertEqual(0, limiter.in_flight)
+        self.assertEqual(0, limiter.queue_depth)
+
+    def test_action_endpoint(self):
+        limit = ConcurrencyLimit(1, status_code=429, retry_after=3)
+
+        @action(triggers=(WEB_GET,), concurrency_limit=limit)
+        async def limited_get() -> str:
+            await asyncio.sleep(0.01)
+            return "done"
+
+        factories = [
+            ConcurrencyLimitingActionEndpointFactory(),
+            ActionEndpointFactory(),
+        ]
+        endpoint = factories[0].create(get_action(limited_get), set(), factories)
+        self.assertIsInstance(endpoint, ConcurrencyLimitingActionEndpoint)
+        self.assertIs(endpoint.limiter, get_concurrency_limiters()["limited_get"])
+        self.assertIs(
+            endpoint.limiter, get_concurrency_limiter(get_action(limited_get))
+        )
+
+        async def run_all():
+            return await asyncio.gather(
+                endpoint.execute(build_request()), endpoint.execute(build_request())
+            )
+
+        responses = asyncio.get_event_loop().run_until_complete(run_all())
+        self.assertEqual("done", json.loads(responses[0].body))
+        self.assertEqual(429, responses[1].status_code)
+        self.assertEqual("3", responses[1].headers["Retry-After"])
+
+    def test_no_limit(self):
+        @action(triggers=(WEB_GET,))
+        def unlimited_get() -> str:
+            return "done"
+
+        self.assertIsNone(get_concurrency_limiter(get_action(unlimited_get)))
+        factories = [
+            ConcurrencyLimitingActionEndpointFactory(),
+            ActionEndpointFactory(),
+        ]
+        self.assertIsNone(
+            factories[0].create(get_action(unlimited_get), set(), factories)
+        )
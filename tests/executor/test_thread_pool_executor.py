@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+from unittest import TestCase
+
+from servey.action.action import action, get_action
+from servey.executor.executor_abc import get_default_executor
+from servey.executor.inline_executor import INLINE
+from servey.executor.thread_pool_executor import BoundedThreadPoolExecutor
+from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory import (
+    ActionEndpointFactory,
+)
+from servey.trigger.web_trigger import WEB_GET
+from tests.servey_starlette.action_endpoint.test_action_endpoint import build_request
+
+
+class TestThreadPoolExecutor(TestCase):
+    def test_sync_fn_runs_off_loop(self):
+        executor = BoundedThreadPoolExecutor(max_workers=2)
+        loop_thread = threading.current_thread()
+
+        def get_thread_name(suffix: str) -> str:
+            self.assertIsNot(loop_thread, threading.current_thread())
+            return threading.current_thread().name + suffix
+
+        loop = asyncio.get_event_loop()
+        result = loop.run_until_complete(
+            executor.execute(get_thread_name, dict(suffix="!"))
+        )
+        self.assertTrue(result.startswith("servey"))
+        self.assertTrue(result.endswith("!"))
+        self.assertEqual(0, executor.active_count)
+        self.assertEqual(0, executor.queue_depth)
+        executor.shutdown()
+
+    def test_async_fn_runs_on_loop(self):
+        executor = BoundedThreadPoolExecutor(max_workers=1)
+        loop_thread = threading.current_thread()
+
+        async def get_thread() -> threading.Thread:
+            return threading.current_thread()
+
+        loop = asyncio.get_event_loop()
+        result = loop.run_until_complete(executor.execute(get_thread, {}))
+        self.assertIs(loop_thread, result)
+        self.assertIsNone(executor._pool)
+
+    def test_sync_wrapper_returning_awaitable(self):
+        executor = BoundedThreadPoolExecutor(max_workers=1)
+
+        async def inner() -> int:
+            return 10
+
+        def wrapper():
+            return inner()
+
+        loop = asyncio.get_event_loop()
+        result = loop.run_until_complete(executor.execute(wrapper, {}))
+        self.assertEqual(10, result)
+        executor.shutdown()
+
+    def test_slow_sync_does_not_block_loop(self):
+        executor = BoundedThreadPoolExecutor(max_workers=2)
+        gauges = []
+
+        def slow():
+            time.sleep(0.2)
+            return "slow"
+
+        async def fast():
+            await asyncio.sleep(0.01)
+            gauges.append((executor.active_count, executor.queue_depth))
+            return "fast"
+
+        async def run_both():
+            slow_task = asyncio.ensure_future(executor.execute(slow, {}))
+            fast_result = await fast()
+            return fast_result, slow_task.done(), await slow_task
+
+        loop = asyncio.get_event_loop()
+        fast_result, slow_done, slow_result = loop.run_until_complete(run_both())
+        self.assertEqual("fast", fast_result)
+        self.assertFalse(slow_done)
+        self.assertEqual("slow", slow_result)
+        self.assertEqual([(1, 0)], gauges)
+        executor.shutdown()
+
+    def test_queue_depth(self):
+        executor = BoundedThreadPoolExecutor(max_workers=1)
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocker():
+            started.set()
+            release.wait(5)
+
+        async def run():
+            first = asyncio.ensure_future(executor.execute(blocker, {}))
+            second = asyncio.ensure_future(executor.execute(blocker, {}))
+            await asyncio.sleep(0)
+            while not started.is_set():
+                await asyncio.sleep(0.01)
+            gauges = (executor.active_count, executor.queue_depth)
+            release.set()
+            await asyncio.gather(first, second)
+            return gauges
+
+        loop = asyncio.get_event_loop()
+        self.assertEqual((1, 1), loop.run_until_complete(run()))
+        self.assertEqual((0, 0), (executor.active_count, executor.queue_depth))
+        executor.shutdown()
+
+    def test_default_executor(self):
+        self.assertIsInstance(get_default_executor(), BoundedThreadPoolExecutor)
+
+    def test_action_executor_override(self):
+        loop_thread = threading.current_thread()
+
+        @action(triggers=(WEB_GET,), executor=INLINE)
+        def current_thread_name() -> str:
+            return threading.current_thread().name
+
+        endpoint = ActionEndpointFactory().create(
+            get_action(current_thread_name), set(), []
+        )
+        self.assertIs(INLINE, endpoint.executor)
+        loop = asyncio.get_event_loop()
+        response = loop.run_until_complete(endpoint.execute(build_request()))
+        self.assertEqual(f'"{loop_thread.name}"', response.body.decode())
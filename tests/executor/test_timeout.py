@@ -0,0 +1,103 @@
+import asyncio
+import json
+import threading
+from unittest import TestCase
+
+from starlette.exceptions import HTTPException
+
+from servey.action.action import action, get_action
+from servey.executor.thread_pool_executor import BoundedThreadPoolExecutor
+from servey.executor.timeout import (
+    ActionTimeoutError,
+    call_with_timeout,
+    get_timeout_stats,
+    run_with_timeout,
+)
+from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory import (
+    ActionEndpointFactory,
+)
+from servey.trigger.web_trigger import WEB_GET
+from tests.servey_starlette.action_endpoint.test_action_endpoint import build_request
+
+
+class TestTimeout(TestCase):
+    def test_run_with_timeout(self):
+        cancelled = False
+
+        async def slow():
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        loop = asyncio.get_event_loop()
+        before = get_timeout_stats().timeouts.get("slow_async", 0)
+        with self.assertRaises(ActionTimeoutError):
+            loop.run_until_complete(run_with_timeout(slow(), 0.01, "slow_async"))
+        self.assertTrue(cancelled)
+        self.assertEqual(before + 1, get_timeout_stats().timeouts["slow_async"])
+
+    def test_run_with_timeout_completes(self):
+        async def fast():
+            return "result"
+
+        loop = asyncio.get_event_loop()
+        self.assertEqual(
+            "result", loop.run_until_complete(run_with_timeout(fast(), 1, "fast"))
+        )
+        self.assertEqual(
+            "result", loop.run_until_complete(run_with_timeout(fast(), None, "fast"))
+        )
+
+    def test_call_with_timeout(self):
+        release = threading.Event()
+        with self.assertRaises(ActionTimeoutError):
+            call_with_timeout(lambda: release.wait(5), 0.01, "slow_sync")
+        release.set()
+        self.assertEqual("result", call_with_timeout(lambda: "result", 1, "fast"))
+
+        def raise_error():
+            raise ValueError()
+
+        with self.assertRaises(ValueError):
+            call_with_timeout(raise_error, 1, "raise_error")
+
+    def test_queued_call_dropped(self):
+        executor = BoundedThreadPoolExecutor(max_workers=1)
+        release = threading.Event()
+        calls = []
+
+        def blocking(value: str) -> str:
+            calls.append(value)
+            release.wait(5)
+            return value
+
+        async def run():
+            running = asyncio.ensure_future(executor.execute(blocking, dict(value="a")))
+            await asyncio.sleep(0.01)
+            with self.assertRaises(ActionTimeoutError):
+                await run_with_timeout(
+                    executor.execute(blocking, dict(value="b")), 0.01, "blocking"
+                )
+            self.assertEqual(0, executor.queue_depth)
+            release.set()
+            return await running
+
+        loop = asyncio.get_event_loop()
+        self.assertEqual("a", loop.run_until_complete(run()))
+        executor.shutdown()
+        self.assertEqual(["a"], calls)
+
+    def test_action_endpoint_timeout(self):
+        @action(triggers=(WEB_GET,), timeout=0.01)
+        async def slow_get() -> str:
+            await asyncio.sleep(5)
+            return "done"
+
+        endpoint = ActionEndpointFactory().create(get_action(slow_get), set(), [])
+        loop = asyncio.get_event_loop()
+        with self.assertRaises(HTTPException) as context:
+            loop.run_until_complete(endpoint.execute(build_request()))
+        self.assertEqual(504, context.exception.status_code)
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+
+from servey.action.action import action
+from servey.trigger.web_trigger import WEB_GET, WEB_POST
+
+
+@action(name="renamed", triggers=(WEB_GET, WEB_POST))
+def sample() -> str:
+    return "sample"
+
+
+@action
+async def sample_async() -> str:
+    return "sample_async"
+
+
+@dataclass
+class Sample:
+    value: int
+
+    @action(triggers=WEB_GET)
+    def double(self) -> int:
+        return self.value * 2
+
+
+def _assigned() -> str:
+    return "assigned"
+
+
+assigned = action(_assigned)
+
+
+def not_an_action() -> str:
+    return "not_an_action"
@@ -2,7 +2,16 @@ import os
 from unittest import TestCase
 from unittest.mock import patch
 
-from servey.finder.action_finder_abc import find_actions
+from servey.action.action import action, get_action
+from servey.finder.action_finder_abc import (
+    ActionRegistry,
+    find_actions,
+    get_action_by_name,
+    get_action_registry,
+    invalidate_action_registry,
+)
+from servey.finder.module_action_finder import ModuleActionFinder
+from servey.trigger.web_trigger import WEB_GET, WebTrigger
 
 
 class TestActionFinder(TestCase):
@@ -10,3 +19,45 @@ class TestActionFinder(TestCase):
         with patch.dict(os.environ, {"SERVEY_MAIN": "tests.finder"}):
             action_ = next(a for a in find_actions() if a.name == "marco")
             self.assertEqual("Polo!", action_.fn())
+            self.assertEqual("Polo!", get_action_by_name("marco").fn())
+            self.assertIsNone(get_action_by_name("not_existing"))
+
+    def test_registry_cached(self):
+        with (
+            patch.dict(os.environ, {"SERVEY_MAIN": "tests.finder"}),
+            patch.object(
+                ModuleActionFinder,
+                "find_actions",
+                autospec=True,
+                side_effect=ModuleActionFinder.find_actions,
+            ) as finder_find_actions,
+        ):
+            invalidate_action_registry()
+            registry = get_action_registry()
+            self.assertIs(registry, get_action_registry())
+            self.assertEqual(1, finder_find_actions.call_count)
+            invalidate_action_registry()
+            self.assertIsNot(registry, get_action_registry())
+            self.assertEqual(2, finder_find_actions.call_count)
+
+    def test_registry_indexes(self):
+        @action(triggers=(WEB_GET,))
+        def registry_get() -> str:
+            """Dummy"""
+
+        @action
+        def registry_plain() -> str:
+            """Dummy"""
+
+        registry = ActionRegistry(
+            (get_action(registry_get), get_action(registry_plain))
+        )
+        self.assertIs(get_action(registry_get), registry.by_name["registry_get"])
+        self.assertEqual(
+            (get_action(registry_get), get_action(registry_plain)),
+            registry.by_module[__name__],
+        )
+        self.assertEqual(
+            ((get_action(registry_get), WEB_GET),),
+            registry.get_actions_with_trigger_type(WebTrigger),
+        )
@@ -0,0 +1,46 @@
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+from servey.event_channel.background.background_action_channel import (
+    BackgroundActionChannel,
+)
+from servey.event_channel.websocket.websocket_event_channel import (
+    WebsocketEventChannel,
+    websocket_event_channel,
+)
+from servey.finder.event_channel_finder_abc import (
+    EventChannelRegistry,
+    find_event_channels,
+    get_event_channel_registry,
+    invalidate_event_channel_registry,
+)
+
+
+class TestEventChannelFinder(TestCase):
+    def test_find_event_channels(self):
+        from tests.finder.event_channels.test_event_channel import my_channel
+
+        with patch.dict(os.environ, {"SERVEY_MAIN": "tests.finder"}):
+            self.assertEqual([my_channel], list(find_event_channels()))
+            registry = get_event_channel_registry()
+            self.assertIs(registry, get_event_channel_registry())
+            invalidate_event_channel_registry()
+            self.assertIsNot(registry, get_event_channel_registry())
+
+    def test_registry_indexes(self):
+        channel = websocket_event_channel("registry_channel", str)
+        registry = EventChannelRegistry((channel,))
+        self.assertIs(channel, registry.get_channel_by_name("registry_channel"))
+        self.assertIs(
+            channel,
+            registry.get_channel_by_name("registry_channel", WebsocketEventChannel),
+        )
+        self.assertIsNone(
+            registry.get_channel_by_name("registry_channel", BackgroundActionChannel)
+        )
+        self.assertIsNone(registry.get_channel_by_name("not_existing"))
+        self.assertEqual(
+            (channel,), registry.get_channels_by_type(WebsocketEventChannel)
+        )
+        self.assertEqual((), registry.get_channels_by_type(BackgroundActionChannel))
@@ -0,0 +1,79 @@
+import os
+import sys
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from servey.finder.action_finder_abc import get_action_by_name
+from servey.finder.manifest import (
+    Manifest,
+    ManifestAction,
+    ManifestEventChannel,
+    build_manifest,
+    load_action,
+    read_manifest,
+    write_manifest,
+)
+from servey.finder.module_action_finder import ModuleActionFinder
+from servey.finder.module_event_channel_finder import ModuleEventChannelFinder
+
+
+class TestManifest(TestCase):
+    def test_build_manifest(self):
+        module_name = "tests.finder.manifest_actions.sample"
+        sys.modules.pop(module_name, None)
+        manifest = build_manifest("tests.finder.manifest_actions", "tests.finder")
+        # The source is parsed rather than imported
+        self.assertNotIn(module_name, sys.modules)
+        expected_actions = (
+            ManifestAction("renamed", module_name, "sample", ("WEB_GET", "WEB_POST")),
+            ManifestAction("sample_async", module_name, "sample_async"),
+            ManifestAction("double", module_name, "Sample.double", ("WEB_GET",)),
+            ManifestAction("_assigned", module_name, "assigned"),
+        )
+        self.assertEqual(expected_actions, manifest.actions)
+        self.assertEqual(
+            (
+                ManifestEventChannel(
+                    "my_channel",
+                    "tests.finder.event_channels.test_event_channel",
+                    "my_channel",
+                ),
+            ),
+            manifest.event_channels,
+        )
+        actions = [load_action(a) for a in manifest.actions]
+        self.assertEqual(
+            ["renamed", "sample_async", "double", "_assigned"],
+            [a.name for a in actions],
+        )
+
+    def test_read_write(self):
+        manifest = build_manifest("tests.finder.manifest_actions", "tests.finder")
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "manifest.json")
+            write_manifest(manifest, path)
+            self.assertEqual(manifest, read_manifest(path))
+
+    def test_finders_use_manifest(self):
+        manifest = Manifest(
+            action_root_module="tests.finder.actions",
+            event_channel_root_module="tests.finder.event_channels",
+            actions=(
+                ManifestAction("foo", "tests.finder.test_module_action_finder", "foo"),
+            ),
+        )
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "manifest.json")
+            write_manifest(manifest, path)
+            with patch.dict(
+                os.environ, {"SERVEY_MAIN": "tests.finder", "SERVEY_MANIFEST": path}
+            ):
+                # Only the actions in the manifest are found - the package is not walked
+                actions = list(ModuleActionFinder().find_actions())
+                self.assertEqual(["foo"], [a.name for a in actions])
+                self.assertEqual(
+                    [], list(ModuleEventChannelFinder().find_event_channels())
+                )
+                self.assertIs(actions[0], get_action_by_name("foo"))
+                self.assertIsNone(get_action_by_name("marco"))
@@ -0,0 +1,50 @@
+import asyncio
+import json
+from unittest import TestCase
+
+from servey.action.action import action, get_action
+from servey.json_codec.json_codec_abc import get_default_json_codec
+from servey.json_codec.orjson_codec import OrjsonCodec
+from servey.json_codec.stdlib_json_codec import StdlibJsonCodec
+from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory import (
+    ActionEndpointFactory,
+)
+from servey.servey_starlette.json_codec_response import JsonCodecResponse
+from servey.trigger.web_trigger import WEB_POST
+from tests.servey_starlette.action_endpoint.test_action_endpoint import (
+    build_request,
+)
+
+ITEM = {"name": "Bärbel", "values": [1, 2.5, True, None], "nested": {"a": "b"}}
+
+
+class TestJsonCodec(TestCase):
+    def test_codecs_produce_same_bytes(self):
+        expected = json.dumps(ITEM, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+        for codec in (StdlibJsonCodec(), OrjsonCodec()):
+            content = codec.dumps(ITEM)
+            self.assertEqual(expected, content)
+            self.assertEqual(ITEM, codec.loads(content))
+            self.assertEqual(ITEM, codec.loads(content.decode("utf-8")))
+
+    def test_default_codec(self):
+        self.assertIsInstance(get_default_json_codec(), OrjsonCodec)
+
+    def test_response(self):
+        response = JsonCodecResponse(ITEM, json_codec=StdlibJsonCodec())
+        self.assertEqual(StdlibJsonCodec().dumps(ITEM), response.body)
+        self.assertEqual("application/json", response.headers["content-type"])
+
+    def test_action_endpoint(self):
+        @action(triggers=(WEB_POST,))
+        def echo(val: str) -> str:
+            return val
+
+        action_endpoint = ActionEndpointFactory().create(get_action(echo), set(), [])
+        request = build_request(method="POST", body='{"val": "Bärbel"}')
+        loop = asyncio.get_event_loop()
+        response = loop.run_until_complete(action_endpoint.execute(request))
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('"Bärbel"'.encode("utf-8"), response.body)
@@ -0,0 +1,160 @@
+import asyncio
+import json
+import os
+import sqlite3
+from contextlib import closing
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from servey.action.action import action, get_action
+from servey.rate_limit.memory_rate_limit_store import MemoryRateLimitStore
+from servey.rate_limit.rate_limit import RateLimit, TokenBucket
+from servey.rate_limit.rate_limiter import (
+    RateLimitError,
+    check_rate_limit,
+    check_rate_limit_async,
+)
+from servey.rate_limit.sqlite_rate_limit_store import SqliteRateLimitStore
+from servey.security.authorization import Authorization
+from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory import (
+    ActionEndpointFactory,
+)
+from servey.servey_starlette.action_endpoint.factory.rate_limiting_action_endpoint_factory import (
+    RateLimitingActionEndpointFactory,
+)
+from servey.servey_starlette.action_endpoint.rate_limiting_action_endpoint import (
+    RateLimitingActionEndpoint,
+)
+from servey.trigger.web_trigger import WEB_GET
+from tests.servey_starlette.action_endpoint.test_action_endpoint import build_request
+
+
+def _authorization(subject_id: str, *scopes: str) -> Authorization:
+    return Authorization(subject_id, frozenset(scopes), None, None)
+
+
+class TestRateLimit(TestCase):
+    def test_memory_store(self):
+        self.check_store(MemoryRateLimitStore())
+
+    def test_sqlite_store(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "rate_limit.db")
+            self.check_store(SqliteRateLimitStore(path))
+            # State is shared between store instances using the same database
+            retry_after = SqliteRateLimitStore(path).acquire(
+                "key", TokenBucket(1, 2), 101
+            )
+            self.assertEqual(1, retry_after)
+            # Async acquisitions run using the executor, rather than blocking the loop
+            store = SqliteRateLimitStore(path)
+            loop = asyncio.get_event_loop()
+            retry_after = loop.run_until_complete(
+                store.acquire_async("new_key", TokenBucket(1, 2), 101)
+            )
+            self.assertEqual(0, retry_after)
+
+    def test_sqlite_store_prunes_full_buckets(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "rate_limit.db")
+            store = SqliteRateLimitStore(path, prune_interval=10)
+            bucket = TokenBucket(rate=1, capacity=2)
+            for key in ("a", "b", "c"):
+                store.acquire(key, bucket, 100)
+            self.assertEqual({"a", "b", "c"}, self._get_sqlite_keys(path))
+            # Buckets refill at 101, but rows are not pruned until the interval has passed
+            store.acquire("a", bucket, 105)
+            self.assertEqual({"a", "b", "c"}, self._get_sqlite_keys(path))
+            store.acquire("a", bucket, 110)
+            self.assertEqual({"a"}, self._get_sqlite_keys(path))
+            # Pruned buckets are full
+            self.assertEqual(0, store.acquire("b", bucket, 110))
+            self.assertEqual(0, store.acquire("b", bucket, 110))
+            self.assertEqual(1, store.acquire("b", bucket, 110))
+
+    @staticmethod
+    def _get_sqlite_keys(path: str):
+        with closing(sqlite3.connect(path)) as connection:
+            rows = connection.execute("SELECT key FROM servey_rate_limit").fetchall()
+        return {row[0] for row in rows}
+
+    def test_sqlite_store_from_environment(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "rate_limit.db")
+            with patch.dict(os.environ, {"SERVEY_RATE_LIMIT_DB": path}):
+                self.assertEqual(path, SqliteRateLimitStore().path)
+
+    def check_store(self, store):
+        bucket = TokenBucket(rate=1, capacity=2)
+        self.assertEqual(0, store.acquire("key", bucket, 100))
+        self.assertEqual(0, store.acquire("key", bucket, 100))
+        self.assertEqual(1, store.acquire("key", bucket, 100))
+        self.assertEqual(0, store.acquire("other_key", bucket, 100))
+        self.assertEqual(0.5, store.acquire("key", bucket, 100.5))
+        self.assertEqual(0, store.acquire("key", bucket, 101))
+
+    def test_get_bucket(self):
+        subject_bucket = TokenBucket(1, 10)
+        anonymous_bucket = TokenBucket(1, 1)
+        admin_bucket = TokenBucket(10, 100)
+        rate_limit = RateLimit(
+            subject_bucket, anonymous_bucket, (("admin", admin_bucket),)
+        )
+        self.assertEqual(("anonymous", anonymous_bucket), rate_limit.get_bucket(None))
+        self.assertEqual(
+            ("subject:a", subject_bucket),
+            rate_limit.get_bucket(_authorization("a", "read")),
+        )
+        self.assertEqual(
+            ("subject:b", admin_bucket),
+            rate_limit.get_bucket(_authorization("b", "read", "admin")),
+        )
+
+    def test_check_rate_limit(self):
+        @action(rate_limit=RateLimit(TokenBucket(0.5, 1)))
+        def limited() -> str:
+            return "done"
+
+        store = MemoryRateLimitStore()
+        limited_action = get_action(limited)
+        check_rate_limit(limited_action, _authorization("a"), store)
+        check_rate_limit(limited_action, _authorization("b"), store)
+        with self.assertRaises(RateLimitError) as cm:
+            check_rate_limit(limited_action, _authorization("a"), store)
+        self.assertEqual(429, cm.exception.status_code)
+        self.assertEqual(2, cm.exception.retry_after)
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(
+            check_rate_limit_async(limited_action, _authorization("c"), store)
+        )
+        with self.assertRaises(RateLimitError):
+            loop.run_until_complete(
+                check_rate_limit_async(limited_action, _authorization("c"), store)
+            )
+
+    def test_action_endpoint(self):
+        @action(triggers=(WEB_GET,), rate_limit=RateLimit(TokenBucket(0.1, 2)))
+        def rate_limited_get() -> str:
+            return "done"
+
+        factories = [RateLimitingActionEndpointFactory(), ActionEndpointFactory()]
+        endpoint = factories[0].create(get_action(rate_limited_get), set(), factories)
+        self.assertIsInstance(endpoint, RateLimitingActionEndpoint)
+        loop = asyncio.get_event_loop()
+        responses = [
+            loop.run_until_complete(endpoint.execute(build_request())) for _ in range(3)
+        ]
+        self.assertEqual(["done", "done"], [json.loads(r.body) for r in responses[:2]])
+        self.assertEqual(429, responses[2].status_code)
+        self.assertEqual("10", responses[2].headers["Retry-After"])
+
+    def test_no_limit(self):
+        @action(triggers=(WEB_GET,))
+        def unlimited_get() -> str:
+            return "done"
+
+        factories = [RateLimitingActionEndpointFactory(), ActionEndpointFactory()]
+        self.assertIsNone(
+            factories[0].create(get_action(unlimited_get), set(), factories)
+        )
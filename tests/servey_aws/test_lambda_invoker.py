@@ -80,7 +80,7 @@ class TestLambdaInvoker(TestCase):
             "headers": {
                 "Content-Type": "application/json",
             },
-            "body": '{"name": "foo", "child_nodes": []}',
+            "body": '{"name":"foo","child_nodes":[]}',
         }
         self.assertEqual(expected_result, result)
 
@@ -111,7 +111,7 @@ class TestLambdaInvoker(TestCase):
         expected_result = {
             "statusCode": 200,
             "headers": {"Content-Type": "application/json"},
-            "body": json.dumps(dump(ROOT)),
+            "body": json.dumps(dump(ROOT), separators=(",", ":")),
         }
         self.assertEqual(expected_result, result)
 
@@ -130,7 +130,7 @@ class TestLambdaInvoker(TestCase):
         expected_result = {
             "statusCode": 200,
             "headers": headers,
-            "body": '{"name": "foo", "updated_at": "2020-01-01T00:00:00+00:00"}',
+            "body": '{"name":"foo","updated_at":"2020-01-01T00:00:00+00:00"}',
         }
         self.assertEqual(expected_result, result)
         # noinspection SpellCheckingInspection
@@ -173,7 +173,7 @@ class TestLambdaInvoker(TestCase):
             "headers": {
                 "Content-Type": "application/json",
             },
-            "body": '{"name": "foo", "child_nodes": []}',
+            "body": '{"name":"foo","child_nodes":[]}',
         }
         self.assertEqual(expected_result, result)
 
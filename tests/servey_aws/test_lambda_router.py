@@ -4,6 +4,8 @@ from unittest.mock import patch
 
 from servey.action.action import action, get_action
 from servey.errors import ServeyError
+from servey.finder.action_finder_abc import ActionRegistry
+from servey.servey_aws.event_handler.event_handler_abc import get_event_handlers
 from servey.servey_aws.lambda_router import invoke
 from servey.servey_aws.router.appsync_router import AppsyncRouter
 from servey.trigger.web_trigger import WEB_GET
@@ -16,8 +18,8 @@ class TestLambdaRouter(TestCase):
             return val
 
         with patch(
-            "servey.servey_aws.router.router.find_actions",
-            return_value=[get_action(echo_get)],
+            "servey.finder.action_finder_abc.get_action_registry",
+            return_value=ActionRegistry((get_action(echo_get),)),
         ):
             event = dict(action_name="echo_get", params=dict(val="foo"))
             result = invoke(event, None)
@@ -30,9 +32,9 @@ class TestLambdaRouter(TestCase):
             """Dummy"""
 
         with patch(
-            "servey.servey_aws.router.router.find_actions",
-            return_value=[get_action(echo_get)],
-        ), self.assertRaises(StopIteration):
+            "servey.finder.action_finder_abc.get_action_registry",
+            return_value=ActionRegistry((get_action(echo_get),)),
+        ), self.assertRaises(ServeyError):
             event = dict(action_name="not_existing")
             invoke(event, None)
 
@@ -42,8 +44,8 @@ class TestLambdaRouter(TestCase):
             """Dummy"""
 
         with patch(
-            "servey.servey_aws.router.router.find_actions",
-            return_value=[get_action(echo_get)],
+            "servey.finder.action_finder_abc.get_action_registry",
+            return_value=ActionRegistry((get_action(echo_get),)),
         ), self.assertRaises(ServeyError):
             invoke({}, None)
 
@@ -53,11 +55,8 @@ class TestLambdaRouter(TestCase):
             return val
 
         with patch(
-            "servey.servey_aws.router.router.find_actions",
-            return_value=[get_action(echo_get)],
-        ), patch(
-            "servey.finder.action_finder_abc.find_actions",
-            return_value=[get_action(echo_get)],
+            "servey.finder.action_finder_abc.get_action_registry",
+            return_value=ActionRegistry((get_action(echo_get),)),
         ):
             event = dict(path="/actions/echo-get", params=dict(val="foo"))
             result = invoke(event, None)
@@ -70,11 +69,8 @@ class TestLambdaRouter(TestCase):
             return val
 
         with patch(
-            "servey.servey_aws.router.router.find_actions",
-            return_value=[get_action(echo_get)],
-        ), patch(
-            "servey.finder.action_finder_abc.find_actions",
-            return_value=[get_action(echo_get)],
+            "servey.finder.action_finder_abc.get_action_registry",
+            return_value=ActionRegistry((get_action(echo_get),)),
         ):
             event = dict(path="/actions/echo-get", params=dict(val="foo"))
             result = invoke(event, None)
@@ -121,3 +117,23 @@ class TestLambdaRouter(TestCase):
         handler = router.create_handler(event, None)
         result = handler.handle(event, None)
         self.assertEqual(120, result)
+        self.assertIs(handler, router.create_handler(event, None))
+
+    def test_event_handlers_shared(self):
+        @action(triggers=WEB_GET)
+        def echo_get(val: str) -> str:
+            return val
+
+        action_ = get_action(echo_get)
+        handlers = get_event_handlers(action_)
+        self.assertTrue(handlers)
+        self.assertIs(handlers, get_event_handlers(action_))
+
+        # A redefined action with the same name gets new handlers
+        @action(triggers=WEB_GET, name="echo_get")
+        def echo_get_redefined(val: str) -> str:
+            return val
+
+        redefined_handlers = get_event_handlers(get_action(echo_get_redefined))
+        self.assertIsNot(handlers, redefined_handlers)
+        self.assertIs(redefined_handlers[0].action, get_action(echo_get_redefined))
@@ -7,6 +7,7 @@ from unittest.mock import patch, MagicMock
 from servey.event_channel.websocket.websocket_event_channel import (
     websocket_event_channel,
 )
+from servey.finder.event_channel_finder_abc import EventChannelRegistry
 from servey.security.authorization import ROOT
 from tests.servey_strawberry.test_schema_factory import NumberStats
 
@@ -138,8 +139,8 @@ class TestLambdaWebsocket(TestCase):
                 },
             ),
             patch(
-                "servey.finder.event_channel_finder_abc.find_event_channels",
-                return_value=[channel],
+                "servey.finder.event_channel_finder_abc.get_event_channel_registry",
+                return_value=EventChannelRegistry((channel,)),
             ),
         ):
             from servey.servey_aws import lambda_websocket
@@ -188,8 +189,8 @@ class TestLambdaWebsocket(TestCase):
                 },
             ),
             patch(
-                "servey.finder.event_channel_finder_abc.find_event_channels",
-                return_value=[channel],
+                "servey.finder.event_channel_finder_abc.get_event_channel_registry",
+                return_value=EventChannelRegistry((channel,)),
             ),
         ):
             from servey.servey_aws import lambda_websocket
@@ -237,8 +238,8 @@ class TestLambdaWebsocket(TestCase):
                 },
             ),
             patch(
-                "servey.finder.event_channel_finder_abc.find_event_channels",
-                return_value=[channel],
+                "servey.finder.event_channel_finder_abc.get_event_channel_registry",
+                return_value=EventChannelRegistry((channel,)),
             ),
         ):
             from servey.servey_aws import lambda_websocket
@@ -8,6 +8,7 @@ from servey.action.action import action, get_action
 from servey.event_channel.background.background_action_channel import (
     background_action_channel,
 )
+from servey.finder.action_finder_abc import ActionRegistry
 from servey.servey_celery.celery_config.fixed_rate_trigger_config import (
     FixedRateTriggerConfig,
 )
@@ -29,8 +30,13 @@ class TestCeleryApp(TestCase):
 
         with (
             patch(
-                "servey.finder.action_finder_abc.find_actions",
-                return_value=[get_action(ping), get_action(consume_message)],
+                "servey.finder.action_finder_abc.get_action_registry",
+                return_value=ActionRegistry(
+                    (
+                        get_action(ping),
+                        get_action(consume_message),
+                    )
+                ),
             ),
             patch(
                 "servey.servey_celery.celery_config.background_invoker_config.find_event_channels_by_type",
@@ -53,8 +59,8 @@ class TestCeleryApp(TestCase):
 
         with (
             patch(
-                "servey.finder.action_finder_abc.find_actions",
-                return_value=[get_action(pong)],
+                "servey.finder.action_finder_abc.get_action_registry",
+                return_value=ActionRegistry((get_action(pong),)),
             ),
             patch(
                 "servey.servey_celery.celery_config.background_invoker_config.find_event_channels_by_type",
@@ -2,6 +2,7 @@ from unittest import TestCase
 from unittest.mock import patch
 
 from servey.action.action import action, get_action
+from servey.finder.action_finder_abc import ActionRegistry
 from servey.servey_direct.__main__ import main
 
 
@@ -18,8 +19,8 @@ class TestServeyDirect(TestCase):
         with (
             patch("sys.argv", ["servey", "--run=action", "--action=my_action"]),
             patch(
-                "servey.servey_direct.__main__.find_actions",
-                return_value=[get_action(my_action)],
+                "servey.finder.action_finder_abc.get_action_registry",
+                return_value=ActionRegistry((get_action(my_action),)),
             ),
         ):
             main()
@@ -33,8 +34,8 @@ class TestServeyDirect(TestCase):
         with (
             patch("sys.argv", ["servey", "--run=action", "--action=does_not_exist"]),
             patch(
-                "servey.servey_direct.__main__.find_actions",
-                return_value=[get_action(my_action)],
+                "servey.finder.action_finder_abc.get_action_registry",
+                return_value=ActionRegistry((get_action(my_action),)),
             ),
         ):
             with self.assertRaises(ValueError):
@@ -0,0 +1,89 @@
+import asyncio
+import json
+from unittest import TestCase
+
+from servey.action.action import action, get_action
+from servey.servey_starlette.action_endpoint.coalescing_action_endpoint import (
+    CoalescingActionEndpoint,
+)
+from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory import (
+    ActionEndpointFactory,
+)
+from servey.servey_starlette.action_endpoint.factory.coalescing_action_endpoint_factory import (
+    CoalescingActionEndpointFactory,
+)
+from servey.trigger.web_trigger import WEB_GET, WEB_POST
+from tests.servey_starlette.action_endpoint.test_action_endpoint import build_request
+
+
+class TestCoalescingActionEndpoint(TestCase):
+    def test_coalesce_concurrent_gets(self):
+        calls = []
+
+        @action(triggers=(WEB_GET,), coalesce=True)
+        async def slow_get(val: str) -> str:
+            calls.append(val)
+            await asyncio.sleep(0.01)
+            return val
+
+        action_endpoint = CoalescingActionEndpoint(
+            ActionEndpointFactory().create(get_action(slow_get), set(), [])
+        )
+
+        async def run():
+            return await asyncio.gather(
+                *[
+                    action_endpoint.execute(build_request(query_string="val=a"))
+                    for _ in range(3)
+                ],
+                action_endpoint.execute(build_request(query_string="val=b")),
+            )
+
+        responses = asyncio.get_event_loop().run_until_complete(run())
+        self.assertEqual(["a", "b"], calls)
+        self.assertEqual(["a", "a", "a", "b"], [json.loads(r.body) for r in responses])
+        self.assertEqual(2, action_endpoint.single_flight.executions)
+        self.assertEqual(2, action_endpoint.single_flight.coalesced)
+        self.assertEqual(3, len({id(r) for r in responses[:3]}))
+        responses[0].headers["X-Rate-Limit"] = "1"
+        self.assertNotIn("X-Rate-Limit", responses[1].headers)
+        self.assertEqual(responses[0].headers["content-type"], "application/json")
+
+    def test_non_get_not_coalesced(self):
+        calls = []
+
+        @action(triggers=(WEB_POST,), coalesce=True)
+        async def slow_post(val: str) -> str:
+            calls.append(val)
+            await asyncio.sleep(0.01)
+            return val
+
+        action_endpoint = CoalescingActionEndpoint(
+            ActionEndpointFactory().create(get_action(slow_post), set(), [])
+        )
+
+        async def run():
+            return await asyncio.gather(
+                *[
+                    action_endpoint.execute(build_request("POST", body='{"val": "a"}'))
+                    for _ in range(2)
+                ]
+            )
+
+        asyncio.get_event_loop().run_until_complete(run())
+        self.assertEqual(["a", "a"], calls)
+
+    def test_factory_opt_in(self):
+        @action(triggers=(WEB_GET,))
+        def not_coalesced() -> str:
+            return "a"
+
+        @action(triggers=(WEB_GET,), coalesce=True)
+        def coalesced() -> str:
+            return "a"
+
+        factories = [CoalescingActionEndpointFactory(), ActionEndpointFactory()]
+        endpoint = factories[0].create(get_action(not_coalesced), set(), factories)
+        self.assertIsNone(endpoint)
+        endpoint = factories[0].create(get_action(coalesced), set(), factories)
+        self.assertIsInstance(endpoint, CoalescingActionEndpoint)
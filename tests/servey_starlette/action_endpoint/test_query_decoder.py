@@ -0,0 +1,108 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, List
+from unittest import TestCase
+
+from servey.action.action import action, get_action
+from servey.action.util import get_schema_for_params
+from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory import (
+    ActionEndpointFactory,
+)
+from servey.servey_starlette.action_endpoint.query_decoder import (
+    create_query_decoder,
+)
+from servey.trigger.web_trigger import WEB_GET, WebTrigger, WebTriggerMethod
+from tests.servey_starlette.action_endpoint.test_action_endpoint import (
+    build_request,
+)
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+def flat(
+    name: str,
+    count: Optional[int] = None,
+    ratio: float = 1.0,
+    enabled: bool = False,
+    color: Color = Color.RED,
+    label: Optional[str] = None,
+    point: Optional[Point] = None,
+    tags: Optional[List[str]] = None,
+):
+    """Dummy function for generating a schema"""
+
+
+class TestQueryDecoder(TestCase):
+    def test_decode_flat(self):
+        schema = get_schema_for_params(flat, set()).schema
+        decoder = create_query_decoder(schema, set())
+        self.assertEqual(
+            dict(
+                name="123",
+                count=5,
+                ratio=0.5,
+                enabled=True,
+                color="RED",
+                label=None,
+            ),
+            decoder.decode(
+                "name=123&count=5&ratio=0.5&enabled=true&color=RED&label=null", None
+            ),
+        )
+        self.assertEqual(dict(name="foo"), decoder.decode("", dict(name="foo")))
+
+    def test_decode_falls_back(self):
+        schema = get_schema_for_params(flat, set()).schema
+        decoder = create_query_decoder(schema, set())
+        self.assertIsNone(decoder.decode("name=foo&point.x=1&point.y=2", None))
+        self.assertIsNone(decoder.decode("name~s=foo", None))
+        self.assertIsNone(decoder.decode("name=foo&tags=a&tags=b", None))
+        self.assertIsNone(decoder.decode("name=foo&name=bar", None))
+        self.assertIsNone(decoder.decode("unknown=1", None))
+
+    def test_no_decoder_for_nested_path_param(self):
+        schema = get_schema_for_params(flat, set()).schema
+        self.assertIsNotNone(create_query_decoder(schema, {"name"}))
+        self.assertIsNone(create_query_decoder(schema, {"point"}))
+
+    def test_endpoint_with_path_params(self):
+        @action(triggers=(WebTrigger(WebTriggerMethod.GET, "/items/{item_id}"),))
+        def get_item(item_id: int, name: str, flag: bool = False) -> str:
+            return f"{item_id}:{name}:{flag}"
+
+        action_endpoint = ActionEndpointFactory().create(
+            get_action(get_item), set(), []
+        )
+        self.assertIsNotNone(action_endpoint.query_decoder)
+        request = build_request(
+            query_string=b"name=true&flag=true", path_params=dict(item_id="7")
+        )
+        loop = asyncio.get_event_loop()
+        response = loop.run_until_complete(action_endpoint.execute(request))
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("7:true:True", json.loads(response.body))
+
+    def test_endpoint_nested_fallback(self):
+        @action(triggers=(WEB_GET,))
+        def get_point(name: str, point: Optional[Point] = None) -> str:
+            return f"{name}:{point}"
+
+        action_endpoint = ActionEndpointFactory().create(
+            get_action(get_point), set(), []
+        )
+        request = build_request(query_string=b"name=foo&point.x=1&point.y=2")
+        loop = asyncio.get_event_loop()
+        response = loop.run_until_complete(action_endpoint.execute(request))
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("foo:Point(x=1, y=2)", json.loads(response.body))
@@ -10,10 +10,13 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 from servey.action.action import action, Action, get_action
+from servey.cache_control.secure_hash_cache_control import SecureHashCacheControl
 from servey.cache_control.timestamp_cache_control import TimestampCacheControl
 from servey.cache_control.ttl_cache_control import TtlCacheControl
+from servey.security.authorization import Authorization
 from servey.servey_starlette.action_endpoint.caching_action_endpoint import (
     CachingActionEndpoint,
+    create_response_cache,
 )
 from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory import (
     ActionEndpointFactory,
@@ -89,6 +92,86 @@ class TestCachingActionEndpoint(TestCase):
         self.assertEqual(304, response.status_code)
         self.assertEqual(b"", response.body)
 
+    def test_response_cache(self):
+        calls = []
+
+        @action(triggers=(WEB_GET,), cache_control=TtlCacheControl(30))
+        def counted_get(val: str) -> str:
+            calls.append(val)
+            return val
+
+        response_cache = create_response_cache()
+        action_endpoint = CachingActionEndpoint(
+            ActionEndpointFactory().create(get_action(counted_get), set(), []),
+            response_cache,
+        )
+        loop = asyncio.get_event_loop()
+        for query_string in ("val=bar", "val=bar", "val=baz"):
+            request = build_request(query_string=query_string)
+            response = loop.run_until_complete(action_endpoint.execute(request))
+            self.assertEqual(200, response.status_code)
+            self.assertEqual(query_string[4:], json.loads(response.body))
+            self.assertEqual("private,max-age=29", response.headers["cache-control"])
+        self.assertEqual(["bar", "baz"], calls)
+        self.assertEqual(
+            (1, 2), (response_cache.stats.hits, response_cache.stats.misses)
+        )
+
+        # A cached response should still be checked against etags
+        request = build_request(
+            query_string="val=bar",
+            headers={"If-None-Match": response.headers["etag"]},
+        )
+        response = loop.run_until_complete(action_endpoint.execute(request))
+        self.assertEqual(200, response.status_code)
+        request = build_request(
+            query_string="val=bar",
+            headers={"If-None-Match": response.headers["etag"]},
+        )
+        response = loop.run_until_complete(action_endpoint.execute(request))
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(["bar", "baz"], calls)
+
+    def test_response_cache_private(self):
+        calls = []
+
+        @action(triggers=(WEB_GET,), cache_control=TtlCacheControl(30))
+        def counted_get(val: str, authorization: Authorization) -> str:
+            calls.append(authorization.subject_id)
+            return val
+
+        response_cache = create_response_cache()
+        action_endpoint = CachingActionEndpoint(
+            ActionEndpointFactory().create(
+                get_action(counted_get), {"authorization"}, []
+            ),
+            response_cache,
+        )
+        loop = asyncio.get_event_loop()
+        user_a = Authorization("a", frozenset(), None, None)
+        user_b = Authorization("b", frozenset(), None, None)
+        for authorization in (user_a, user_a, user_b):
+            request = build_request(query_string="val=bar")
+            response = loop.run_until_complete(
+                action_endpoint.execute_with_context(
+                    request, dict(authorization=authorization)
+                )
+            )
+            self.assertEqual(200, response.status_code)
+        self.assertEqual(["a", "b"], calls)
+
+    def test_response_cache_no_expiry(self):
+        expected_response = Response(b'"foo"', 200)
+        action_ = Action(None, "foobar", cache_control=SecureHashCacheControl())
+        response_cache = create_response_cache()
+        # noinspection PyTypeChecker
+        endpoint = CachingActionEndpoint(
+            MockActionEndpoint(action_, expected_response), response_cache
+        )
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(endpoint.execute_with_context(build_request(), {}))
+        self.assertEqual(0, len(response_cache))
+
     def test_to_openapi_schema(self):
         # noinspection PyUnusedLocal
         @action(triggers=(WEB_GET,))
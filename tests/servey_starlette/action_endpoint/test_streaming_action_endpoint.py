@@ -0,0 +1,85 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator
+from unittest import TestCase
+
+from servey.action.action import action, get_action
+from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory import (
+    ActionEndpointFactory,
+)
+from servey.servey_starlette.action_endpoint.streaming_action_endpoint import (
+    StreamingActionEndpoint,
+)
+from servey.trigger.web_trigger import WEB_GET
+from tests.servey_starlette.action_endpoint.test_action_endpoint import build_request
+
+
+@dataclass
+class Item:
+    id: int
+    title: str
+
+
+@action(triggers=(WEB_GET,))
+def export_items(count: int) -> Iterator[Item]:
+    for i in range(count):
+        yield Item(i, f"Item {i}")
+
+
+@action(triggers=(WEB_GET,))
+async def export_items_async(count: int) -> AsyncIterator[Item]:
+    for i in range(count):
+        yield Item(i, f"Item {i}")
+
+
+class TestStreamingActionEndpoint(TestCase):
+    def test_json_array(self):
+        for fn in (export_items, export_items_async):
+            content_type, body = self.get_content(fn, {})
+            self.assertEqual("application/json", content_type)
+            expected = [{"id": 0, "title": "Item 0"}, {"id": 1, "title": "Item 1"}]
+            self.assertEqual(expected, json.loads(body))
+
+    def test_empty_json_array(self):
+        _, body = self.get_content(export_items, {}, "count=0")
+        self.assertEqual([], json.loads(body))
+
+    def test_ndjson(self):
+        for fn in (export_items, export_items_async):
+            content_type, body = self.get_content(
+                fn, {"Accept": "application/x-ndjson"}
+            )
+            self.assertEqual("application/x-ndjson", content_type)
+            lines = body.decode("utf-8").split("\n")
+            self.assertEqual("", lines.pop())
+            expected = [{"id": 0, "title": "Item 0"}, {"id": 1, "title": "Item 1"}]
+            self.assertEqual(expected, [json.loads(line) for line in lines])
+
+    def test_openapi_schema(self):
+        endpoint = ActionEndpointFactory().create(get_action(export_items), set(), [])
+        schema = {"paths": {}, "components": {}}
+        endpoint.to_openapi_schema(schema)
+        content = schema["paths"]["/actions/export-items"]["get"]["responses"]["200"][
+            "content"
+        ]
+        self.assertEqual("array", content["application/json"]["schema"]["type"])
+        self.assertEqual(
+            content["application/json"]["schema"]["items"],
+            content["application/x-ndjson"]["schema"],
+        )
+
+    @staticmethod
+    def get_content(fn, headers, query_string="count=2"):
+        endpoint = ActionEndpointFactory().create(get_action(fn), set(), [])
+        assert isinstance(endpoint, StreamingActionEndpoint)
+        request = build_request(query_string=query_string, headers=headers)
+
+        async def run():
+            response = await endpoint.execute(request)
+            chunks = []
+            async for chunk in response.body_iterator:
+                chunks.append(chunk)
+            return response.media_type, b"".join(chunks)
+
+        return asyncio.get_event_loop().run_until_complete(run())
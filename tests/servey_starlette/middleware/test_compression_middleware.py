@@ -0,0 +1,126 @@
+import asyncio
+import gzip
+import zlib
+from typing import List, Optional
+from unittest import TestCase
+
+from starlette.responses import Response, StreamingResponse
+
+from servey.servey_starlette.middleware.compression_middleware import (
+    CompressionMiddleware,
+)
+from servey.servey_starlette.middleware.compression_middleware_factory import (
+    CompressionMiddlewareFactory,
+)
+from servey.servey_starlette.middleware.content_encoder import (
+    ContentEncoder,
+    gzip_encoder,
+    select_encoder,
+)
+
+BODY = b'{"items": [' + b",".join(b'"item"' for _ in range(200)) + b"]}"
+
+
+class TestCompressionMiddleware(TestCase):
+    def test_compress(self):
+        middleware = CompressionMiddleware(
+            _app(Response(BODY, 200, media_type="application/json")), [gzip_encoder()]
+        )
+        messages = _run(middleware, "gzip, deflate")
+        headers = dict(messages[0]["headers"])
+        self.assertEqual(b"gzip", headers[b"content-encoding"])
+        self.assertEqual(b"Accept-Encoding", headers[b"vary"])
+        self.assertEqual(BODY, gzip.decompress(messages[1]["body"]))
+        self.assertEqual(
+            str(len(messages[1]["body"])).encode(), headers[b"content-length"]
+        )
+
+    def test_passthrough(self):
+        for response, accept_encoding in (
+            (Response(BODY, 200, media_type="application/json"), None),
+            (Response(BODY, 200, media_type="application/json"), "br"),
+            (Response(b"{}", 200, media_type="application/json"), "gzip"),
+            (Response(BODY, 200, media_type="image/png"), "gzip"),
+        ):
+            middleware = CompressionMiddleware(_app(response), [gzip_encoder()])
+            messages = _run(middleware, accept_encoding)
+            self.assertNotIn(b"content-encoding", dict(messages[0]["headers"]))
+            self.assertEqual(response.body, messages[1]["body"])
+
+    def test_reuse_compressed_by_etag(self):
+        calls = []
+        encoder = gzip_encoder()
+        counting_encoder = ContentEncoder(
+            "gzip",
+            lambda body: calls.append(body) or encoder.compress(body),
+            encoder.create_stream_compressor,
+        )
+        response = Response(BODY, 200, {"ETag": "abc"}, "application/json")
+        middleware = CompressionMiddleware(_app(response), [counting_encoder])
+        first = _run(middleware, "gzip")
+        second = _run(middleware, "gzip")
+        self.assertEqual(first[1]["body"], second[1]["body"])
+        self.assertEqual(1, len(calls))
+
+        # Same etag but different content is not reused
+        other_response = Response(BODY + b" ", 200, {"ETag": "abc"}, "application/json")
+        middleware.app = _app(other_response)
+        _run(middleware, "gzip")
+        self.assertEqual(2, len(calls))
+
+        # Both the raw and compressed bodies count towards the size of the cache
+        compressed_size = len(encoder.compress(BODY + b" "))
+        self.assertEqual(
+            len(BODY) + 1 + compressed_size, middleware.compressed_cache.size
+        )
+
+    def test_stream(self):
+        async def content():
+            for _ in range(3):
+                yield BODY
+
+        response = StreamingResponse(content(), media_type="application/x-ndjson")
+        middleware = CompressionMiddleware(
+            _app(response), [gzip_encoder()], content_types=("application/x-ndjson",)
+        )
+        messages = _run(middleware, "gzip")
+        self.assertNotIn(b"content-length", dict(messages[0]["headers"]))
+        body = b"".join(m.get("body", b"") for m in messages[1:])
+        self.assertEqual(BODY * 3, zlib.decompress(body, 31))
+
+    def test_select_encoder(self):
+        gzip_ = gzip_encoder()
+        other = ContentEncoder("br", gzip_.compress, gzip_.create_stream_compressor)
+        encoders = [other, gzip_]
+        self.assertIs(other, select_encoder("gzip, br", encoders))
+        self.assertIs(gzip_, select_encoder("gzip, br;q=0", encoders))
+        self.assertIs(other, select_encoder("*", encoders))
+        self.assertIsNone(select_encoder("identity", encoders))
+
+    def test_factory(self):
+        self.assertIsNotNone(CompressionMiddlewareFactory().create())
+        self.assertIsNone(CompressionMiddlewareFactory(enabled=False).create())
+
+
+def _app(response: Response):
+    async def app(scope, receive, send):
+        await response(scope, receive, send)
+
+    return app
+
+
+def _run(middleware: CompressionMiddleware, accept_encoding: Optional[str]) -> List:
+    headers = []
+    if accept_encoding:
+        headers.append((b"accept-encoding", accept_encoding.encode()))
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": headers}
+    messages = []
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.get_event_loop().run_until_complete(middleware(scope, receive, send))
+    return messages
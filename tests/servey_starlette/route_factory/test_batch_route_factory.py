@@ -0,0 +1,138 @@
+import asyncio
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+from servey.action.action import action, get_action
+from servey.cache_control.ttl_cache_control import TtlCacheControl
+from servey.cache_control.validator_cache_control import ValidatorCacheControl
+from servey.security.access_control.scope_access_control import ScopeAccessControl
+from servey.security.authorization import Authorization, ROOT
+from servey.security.authorizer.authorizer_factory_abc import get_default_authorizer
+from servey.servey_starlette.route_factory.action_route_factory import (
+    ActionRouteFactory,
+    get_mounted_action_endpoint,
+)
+from servey.servey_starlette.route_factory.batch_route_factory import (
+    BatchRouteFactory,
+)
+from servey.trigger.web_trigger import WEB_GET, WEB_POST
+from tests.servey_starlette.action_endpoint.test_action_endpoint import build_request
+
+
+@action(triggers=(WEB_GET,))
+def add_get(a: int, b: int) -> int:
+    return a + b
+
+
+@action(
+    triggers=(WEB_GET,),
+    cache_control=ValidatorCacheControl(lambda **kwargs: "v1"),
+)
+def versioned_get() -> str:
+    return "versioned"
+
+
+@action(triggers=(WEB_GET,), cache_control=TtlCacheControl(30))
+def cached_get(value: int) -> int:
+    return value
+
+
+@action(triggers=(WEB_GET,), coalesce=True)
+async def coalesced_get(value: int) -> int:
+    await asyncio.sleep(0.01)
+    return value
+
+
+@action(triggers=(WEB_POST,), access_control=ScopeAccessControl("root"))
+def whoami(auth: Authorization) -> str:
+    return ",".join(auth.scopes)
+
+
+class TestBatchRouteFactory(TestCase):
+    def test_batch(self):
+        calls = [
+            {"action": "add_get", "params": {"a": 1, "b": 2}},
+            {"action": "whoami"},
+            {"action": "add_get", "params": {"a": "not_an_int"}},
+            {"action": "unknown"},
+        ]
+        token = get_default_authorizer().encode(ROOT)
+        results = self.execute_batch(calls, {"Authorization": f"Bearer {token}"})
+        expected = [
+            {"status": 200, "result": 3},
+            {"status": 200, "result": "root"},
+            {"status": 422, "error": "invalid_input"},
+            {"status": 404, "error": "unknown_action"},
+        ]
+        self.assertEqual(expected, results)
+
+    def test_batch_unauthorized_call(self):
+        results = self.execute_batch([{"action": "whoami"}], {})
+        self.assertEqual(401, results[0]["status"])
+
+    def test_batch_invalid(self):
+        routes = self.create_routes()
+        request = build_request("POST", path="/batch", body='{"action": "add_get"}')
+        loop = asyncio.get_event_loop()
+        response = loop.run_until_complete(routes[0].endpoint(request))
+        self.assertEqual(400, response.status_code)
+
+    def test_batch_reuses_mounted_endpoints(self):
+        route = ActionRouteFactory().create_route(get_action(add_get))
+        batch_route_factory = BatchRouteFactory()
+        action_endpoint = batch_route_factory.get_action_endpoint(get_action(add_get))
+        self.assertIs(get_mounted_action_endpoint(get_action(add_get)), action_endpoint)
+        self.assertEqual(route.endpoint, action_endpoint.execute)
+        self.assertIsNone(batch_route_factory.action_route_factory)
+
+    def test_batch_ignores_conditional_headers(self):
+        results = self.execute_batch(
+            [{"action": "versioned_get"}], {"If-None-Match": "v1"}
+        )
+        self.assertEqual([{"status": 200, "result": "versioned"}], results)
+
+    def test_batch_cached_and_coalesced_results_are_json(self):
+        calls = [
+            {"action": "cached_get", "params": {"value": 1}},
+            {"action": "coalesced_get", "params": {"value": 5}},
+            {"action": "coalesced_get", "params": {"value": 5}},
+        ]
+        routes = self.create_routes()
+        for _ in range(2):  # The second call is served from the response cache
+            request = build_request("POST", path="/batch", body=json.dumps(calls))
+            loop = asyncio.get_event_loop()
+            response = loop.run_until_complete(routes[0].endpoint(request))
+            self.assertEqual(
+                [
+                    {"status": 200, "result": 1},
+                    {"status": 200, "result": 5},
+                    {"status": 200, "result": 5},
+                ],
+                json.loads(response.body),
+            )
+
+    @staticmethod
+    def create_routes():
+        with patch(
+            "servey.servey_starlette.route_factory.batch_route_factory.find_actions",
+            return_value=[
+                get_action(add_get),
+                get_action(versioned_get),
+                get_action(cached_get),
+                get_action(coalesced_get),
+                get_action(whoami),
+            ],
+        ):
+            return list(BatchRouteFactory().create_routes())
+
+    def execute_batch(self, calls, headers):
+        routes = self.create_routes()
+        self.assertEqual(1, len(routes))
+        request = build_request(
+            "POST", path="/batch", body=json.dumps(calls), headers=headers
+        )
+        loop = asyncio.get_event_loop()
+        response = loop.run_until_complete(routes[0].endpoint(request))
+        self.assertEqual(200, response.status_code)
+        return json.loads(response.body)
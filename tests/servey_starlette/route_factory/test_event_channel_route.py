@@ -206,8 +206,8 @@ class MockWebSocket:
     async def accept(self):
         self.accepts += 1
 
-    async def send_json(self, event: ExternalItemType):
-        self.sent.append(event)
+    async def send_text(self, data: str):
+        self.sent.append(json.loads(data))
 
 
 class NopeEventFilter(EventFilterABC[T]):
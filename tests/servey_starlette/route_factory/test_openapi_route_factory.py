@@ -0,0 +1,64 @@
+import gzip
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from servey.__main__ import generate_openapi_schema
+from servey.action.action import action, get_action
+from servey.servey_starlette.route_factory.openapi_route_factory import (
+    OpenapiRouteFactory,
+)
+from servey.trigger.web_trigger import WEB_GET
+from tests.servey_starlette.action_endpoint.test_action_endpoint import build_request
+
+
+@action(triggers=(WEB_GET,))
+def documented_get(value: str) -> str:
+    """Echo the value given"""
+    return value
+
+
+_FIND_ACTIONS = f"{OpenapiRouteFactory.__module__}.find_actions"
+
+
+class TestOpenapiRouteFactory(TestCase):
+    def test_endpoint(self):
+        with patch(
+            _FIND_ACTIONS, return_value=[get_action(documented_get)]
+        ) as find_actions:
+            factory = OpenapiRouteFactory()
+            response = factory.endpoint(build_request())
+            self.assertEqual(200, response.status_code)
+            schema = json.loads(response.body)
+            self.assertIn("/actions/documented-get", schema["paths"])
+            etag = response.headers["ETag"]
+
+            # Conditional requests for the current document are not modified
+            response = factory.endpoint(build_request(headers={"If-None-Match": etag}))
+            self.assertEqual(304, response.status_code)
+            self.assertEqual(b"", response.body)
+
+            # A pre compressed copy is served to clients accepting gzip
+            response = factory.endpoint(
+                build_request(headers={"Accept-Encoding": "gzip, br"})
+            )
+            self.assertEqual("gzip", response.headers["Content-Encoding"])
+            self.assertEqual(etag, response.headers["ETag"])
+            self.assertEqual(schema, json.loads(gzip.decompress(response.body)))
+
+            # The schema is only generated once
+            self.assertEqual(1, find_actions.call_count)
+
+    def test_generate_openapi_schema(self):
+        with TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "openapi.json")
+            with (
+                patch(_FIND_ACTIONS, return_value=[get_action(documented_get)]),
+                patch.dict(os.environ, {"OUTPUT_FILE": output_file}),
+            ):
+                generate_openapi_schema()
+                with open(output_file) as reader:
+                    schema = json.load(reader)
+        self.assertIn("/actions/documented-get", schema["paths"])
@@ -1,18 +1,60 @@
+import asyncio
+from dataclasses import dataclass
+from typing import List
 from unittest import TestCase
 
-from dateutil.relativedelta import relativedelta
+from servey.action.action import action, get_action
+from servey.action.batch_invoker import BatchInvoker
+from servey.servey_strawberry.schema_factory import create_schema_factory
+from servey.trigger.web_trigger import WEB_GET
 
-# noinspection PyProtectedMember
-from servey.servey_strawberry.entity_factory.dataclass_factory import _UserCache
+_batches = []
+
+
+def _double_all(values: List[int]) -> List[int]:
+    _batches.append(values)
+    return [v * 2 for v in values]
+
+
+@dataclass
+class Doubler:
+    value: int
+
+    @action(
+        batch_invoker=BatchInvoker(fn=_double_all, arg_extractor=lambda d: [d.value])
+    )
+    def doubled(self) -> int:
+        return self.value * 2
+
+
+@action(triggers=(WEB_GET,))
+def get_doublers(values: List[int]) -> List[Doubler]:
+    return [Doubler(v) for v in values]
 
 
 class TestDataclassFactory(TestCase):
-    def test_user_cache(self):
-        cache = _UserCache(relativedelta(seconds=10))
-        cache.set("foo", "bar")
-        self.assertEqual(cache.get("foo"), "bar")
-        cache.delete("foo")
-        self.assertIsNone(cache.get("foo"))
-        cache.set("foo", "bar")
-        cache.clear()
-        self.assertIsNone(cache.get("foo"))
+    def test_batch_loader_per_request(self):
+        schema_factory = create_schema_factory()
+        schema_factory.create_field_for_action(get_action(get_doublers), WEB_GET)
+        schema = schema_factory.create_schema()
+        query = "query{ getDoublers(values: [1, 2, 2, 3]) { doubled } }"
+        loop = asyncio.get_event_loop()
+        _batches.clear()
+        context = {}
+        result = loop.run_until_complete(schema.execute(query, context_value=context))
+        expected_result = {
+            "getDoublers": [
+                {"doubled": 2},
+                {"doubled": 4},
+                {"doubled": 4},
+                {"doubled": 6},
+            ]
+        }
+        self.assertEqual(expected_result, result.data)
+        # Loads are batched and deduplicated within the request
+        self.assertEqual([[1, 2, 3]], _batches)
+
+        # A new request gets a new loader, so values are loaded again
+        result = loop.run_until_complete(schema.execute(query, context_value={}))
+        self.assertEqual(expected_result, result.data)
+        self.assertEqual([[1, 2, 3], [1, 2, 3]], _batches)
@@ -0,0 +1,77 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from unittest import TestCase
+
+from servey.action.action import action, get_action
+from servey.cache_control.secure_hash_cache_control import SecureHashCacheControl
+from servey.cache_control.timestamp_cache_control import TimestampCacheControl
+from servey.servey_strawberry.cache_headers import (
+    collect_cache_headers,
+    combine_cache_headers,
+)
+from servey.servey_strawberry.handler_filter.cache_control_handler_filter import (
+    CacheControlHandlerFilter,
+)
+from servey.servey_strawberry.schema_factory import SchemaFactory
+from servey.trigger.web_trigger import WEB_POST
+
+
+@dataclass
+class Item:
+    title: str
+    updated_at: datetime
+
+
+class TestCacheControlHandlerFilter(TestCase):
+    def test_filter_sync(self):
+        @action(cache_control=TimestampCacheControl())
+        def dummy(title: str) -> Item:
+            return Item(title, datetime(2020, 1, 1))
+
+        filtered_action, _ = CacheControlHandlerFilter().filter(
+            get_action(dummy), SchemaFactory()
+        )
+        # Headers are not collected outside of a cacheable operation
+        self.assertEqual("a", filtered_action.fn("a").title)
+        with collect_cache_headers() as cache_headers:
+            filtered_action.fn("a")
+            filtered_action.fn("b")
+        self.assertEqual(2, len(cache_headers))
+        self.assertEqual(2020, cache_headers[0].updated_at.year)
+        self.assertNotEqual(cache_headers[0].etag, cache_headers[1].etag)
+        self.assertIsNotNone(combine_cache_headers(cache_headers))
+
+    def test_filter_async(self):
+        @action(cache_control=SecureHashCacheControl())
+        async def dummy(title: str) -> str:
+            return title
+
+        filtered_action, _ = CacheControlHandlerFilter().filter(
+            get_action(dummy), SchemaFactory()
+        )
+
+        async def run():
+            with collect_cache_headers() as cache_headers:
+                await filtered_action.fn("a")
+            return cache_headers
+
+        cache_headers = asyncio.get_event_loop().run_until_complete(run())
+        self.assertEqual(1, len(cache_headers))
+
+    def test_filter_uncacheable(self):
+        @action
+        def no_cache_control(title: str) -> str:
+            return title
+
+        @action(cache_control=SecureHashCacheControl(), triggers=(WEB_POST,))
+        def mutation(title: str) -> str:
+            return title
+
+        filter_ = CacheControlHandlerFilter()
+        for action_ in (get_action(no_cache_control), get_action(mutation)):
+            filtered_action, _ = filter_.filter(action_, SchemaFactory())
+            with collect_cache_headers() as cache_headers:
+                filtered_action.fn("a")
+            self.assertEqual([None], cache_headers)
+            self.assertIsNone(combine_cache_headers(cache_headers))
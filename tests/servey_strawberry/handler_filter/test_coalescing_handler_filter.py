@@ -0,0 +1,59 @@
+import asyncio
+from unittest import TestCase
+
+from servey.action.action import action, get_action
+from servey.security.authorization import Authorization, ROOT
+from servey.servey_strawberry.handler_filter.coalescing_handler_filter import (
+    CoalescingHandlerFilter,
+)
+from servey.servey_strawberry.schema_factory import SchemaFactory
+
+
+class TestCoalescingHandlerFilter(TestCase):
+    def test_filter_not_opted_in(self):
+        @action
+        def dummy(title: str) -> str:
+            return title
+
+        action_ = get_action(dummy)
+        filtered_action, continue_filtering = CoalescingHandlerFilter().filter(
+            action_, SchemaFactory()
+        )
+        self.assertTrue(continue_filtering)
+        self.assertIs(action_, filtered_action)
+
+    def test_filter_async(self):
+        calls = []
+
+        @action(coalesce=True)
+        async def dummy(title: str, auth: Authorization) -> str:
+            calls.append((title, auth.subject_id))
+            await asyncio.sleep(0.01)
+            return title
+
+        filter_ = CoalescingHandlerFilter()
+        filtered_action, _ = filter_.filter(get_action(dummy), SchemaFactory())
+        other_auth = Authorization("other", frozenset(), None, None)
+
+        async def run():
+            return await asyncio.gather(
+                filtered_action.fn(title="a", auth=ROOT),
+                filtered_action.fn(title="a", auth=ROOT),
+                filtered_action.fn(title="a", auth=other_auth),
+            )
+
+        self.assertEqual(
+            ["a", "a", "a"], asyncio.get_event_loop().run_until_complete(run())
+        )
+        self.assertEqual([("a", ROOT.subject_id), ("a", "other")], calls)
+        self.assertEqual(1, filter_.single_flight.coalesced)
+
+    def test_filter_sync(self):
+        @action(coalesce=True)
+        def dummy(title: str) -> str:
+            return title
+
+        filtered_action, _ = CoalescingHandlerFilter().filter(
+            get_action(dummy), SchemaFactory()
+        )
+        self.assertEqual("a", filtered_action.fn("a"))
@@ -0,0 +1,45 @@
+import asyncio
+from unittest import TestCase
+
+from servey.action.action import action, get_action
+from servey.action.concurrency_limit import ConcurrencyLimit
+from servey.executor.concurrency_limiter import ConcurrencyLimitError
+from servey.servey_strawberry.handler_filter.concurrency_limiting_handler_filter import (
+    ConcurrencyLimitingHandlerFilter,
+)
+from servey.servey_strawberry.schema_factory import SchemaFactory
+
+
+class TestConcurrencyLimitingHandlerFilter(TestCase):
+    def test_filter(self):
+        @action(concurrency_limit=ConcurrencyLimit(1))
+        async def limited_resolver(value: str) -> str:
+            await asyncio.sleep(0.01)
+            return value
+
+        filtered_action, continue_filtering = ConcurrencyLimitingHandlerFilter().filter(
+            get_action(limited_resolver), SchemaFactory()
+        )
+        self.assertTrue(continue_filtering)
+
+        async def run_all():
+            return await asyncio.gather(
+                filtered_action.fn(value="a"),
+                filtered_action.fn(value="b"),
+                return_exceptions=True,
+            )
+
+        results = asyncio.get_event_loop().run_until_complete(run_all())
+        self.assertEqual("a", results[0])
+        self.assertIsInstance(results[1], ConcurrencyLimitError)
+
+    def test_filter_unlimited(self):
+        @action
+        def unlimited_resolver(value: str) -> str:
+            return value
+
+        action_ = get_action(unlimited_resolver)
+        filtered_action, _ = ConcurrencyLimitingHandlerFilter().filter(
+            action_, SchemaFactory()
+        )
+        self.assertIs(action_, filtered_action)
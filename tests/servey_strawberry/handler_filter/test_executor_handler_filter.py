@@ -0,0 +1,78 @@
+import asyncio
+import inspect
+import threading
+import time
+from unittest import TestCase
+
+from servey.action.action import action, get_action
+from servey.executor.inline_executor import INLINE
+from servey.executor.thread_pool_executor import BoundedThreadPoolExecutor
+from servey.servey_strawberry.handler_filter.executor_handler_filter import (
+    ExecutorHandlerFilter,
+)
+from servey.servey_strawberry.schema_factory import (
+    SchemaFactory,
+    create_schema_factory,
+)
+from servey.trigger.web_trigger import WEB_GET
+
+
+@action(triggers=(WEB_GET,))
+def thread_name() -> str:
+    return threading.current_thread().name
+
+
+class TestExecutorHandlerFilter(TestCase):
+    def test_filter_sync(self):
+        @action
+        def slow(title: str) -> str:
+            time.sleep(0.1)
+            return f"{title}:{threading.current_thread().name}"
+
+        executor = BoundedThreadPoolExecutor(max_workers=2, thread_name_prefix="test")
+        filtered_action, continue_filtering = ExecutorHandlerFilter(
+            executor=executor
+        ).filter(get_action(slow), SchemaFactory())
+        self.assertTrue(continue_filtering)
+        self.assertTrue(inspect.iscoroutinefunction(filtered_action.fn))
+        self.assertEqual(inspect.signature(slow), inspect.signature(filtered_action.fn))
+
+        async def run():
+            return await asyncio.gather(
+                filtered_action.fn("a"), filtered_action.fn(title="b")
+            )
+
+        start = time.time()
+        results = asyncio.get_event_loop().run_until_complete(run())
+        # Sibling invocations run concurrently
+        self.assertLess(time.time() - start, 0.19)
+        self.assertEqual(["a", "b"], [r.split(":")[0] for r in results])
+        self.assertTrue(all(r.split(":")[1].startswith("test") for r in results))
+        executor.shutdown()
+
+    def test_filter_not_offloaded(self):
+        @action(executor=INLINE)
+        def cheap(title: str) -> str:
+            return title
+
+        @action
+        async def already_async(title: str) -> str:
+            return title
+
+        filter_ = ExecutorHandlerFilter()
+        for action_ in (get_action(cheap), get_action(already_async)):
+            filtered_action, _ = filter_.filter(action_, SchemaFactory())
+            self.assertIs(action_, filtered_action)
+
+    def test_execute_sync(self):
+        executor = BoundedThreadPoolExecutor(max_workers=1, thread_name_prefix="sync")
+        schema_factory = create_schema_factory()
+        for handler_filter in schema_factory.handler_filters:
+            if isinstance(handler_filter, ExecutorHandlerFilter):
+                handler_filter.executor = executor
+        schema_factory.create_field_for_action(get_action(thread_name), WEB_GET)
+        schema = schema_factory.create_schema()
+        result = schema.execute_sync("query{ threadName }")
+        executor.shutdown()
+        self.assertIsNone(result.errors)
+        self.assertTrue(result.data["threadName"].startswith("sync"))
@@ -0,0 +1,96 @@
+import asyncio
+import inspect
+from collections import namedtuple
+from unittest import TestCase
+
+from starlette.requests import Request
+from strawberry.types import Info
+
+from servey.action.action import action, get_action
+from servey.rate_limit.rate_limit import RateLimit, TokenBucket
+from servey.rate_limit.rate_limiter import RateLimitError
+from servey.security.authorization import Authorization, ROOT
+from servey.servey_strawberry.handler_filter.authorization_handler_filter import (
+    AuthorizationHandlerFilter,
+)
+from servey.servey_strawberry.handler_filter.rate_limiting_handler_filter import (
+    RateLimitingHandlerFilter,
+)
+from servey.servey_strawberry.schema_factory import SchemaFactory
+
+
+def _info(token: str = None) -> Info:
+    headers = []
+    if token:
+        headers.append([b"authorization", f"Bearer {token}".encode("latin-1")])
+    request = Request(dict(method="GET", type="http", headers=headers))
+    raw_info = namedtuple("RawInfo", ["context"])(context=dict(request=request))
+    # noinspection PyTypeChecker
+    return Info(raw_info, None)
+
+
+class TestRateLimitingHandlerFilter(TestCase):
+    def test_filter(self):
+        @action(rate_limit=RateLimit(TokenBucket(0.1, 1)))
+        def rate_limited_resolver(value: str) -> str:
+            return value
+
+        filtered_action, continue_filtering = RateLimitingHandlerFilter().filter(
+            get_action(rate_limited_resolver), SchemaFactory()
+        )
+        self.assertTrue(continue_filtering)
+        params = list(inspect.signature(filtered_action.fn).parameters)
+        self.assertEqual(["value", "info"], params)
+        self.assertEqual("a", filtered_action.fn(value="a", info=_info()))
+        with self.assertRaises(RateLimitError):
+            filtered_action.fn(value="b", info=_info())
+
+    def test_filter_async(self):
+        @action(rate_limit=RateLimit(TokenBucket(0.1, 1)))
+        async def rate_limited_async_resolver(value: str) -> str:
+            return value
+
+        filtered_action, _ = RateLimitingHandlerFilter().filter(
+            get_action(rate_limited_async_resolver), SchemaFactory()
+        )
+        self.assertTrue(inspect.iscoroutinefunction(filtered_action.fn))
+        loop = asyncio.get_event_loop()
+        self.assertEqual(
+            "a", loop.run_until_complete(filtered_action.fn(value="a", info=_info()))
+        )
+        with self.assertRaises(RateLimitError):
+            loop.run_until_complete(filtered_action.fn(value="b", info=_info()))
+
+    def test_filter_shares_info(self):
+        # noinspection PyUnusedLocal
+        @action(rate_limit=RateLimit(TokenBucket(0.1, 1)))
+        def rate_limited_auth_resolver(value: str, auth: Authorization) -> str:
+            return auth.subject_id
+
+        schema_factory = SchemaFactory()
+        auth_filter = AuthorizationHandlerFilter()
+        filtered_action, _ = auth_filter.filter(
+            get_action(rate_limited_auth_resolver), schema_factory
+        )
+        filtered_action, _ = RateLimitingHandlerFilter(
+            authorizer=auth_filter.authorizer
+        ).filter(filtered_action, schema_factory)
+        params = list(inspect.signature(filtered_action.fn).parameters)
+        self.assertEqual(["value", "info"], params)
+        token = auth_filter.authorizer.encode(ROOT)
+        self.assertEqual(
+            ROOT.subject_id, filtered_action.fn(value="a", info=_info(token))
+        )
+        with self.assertRaises(RateLimitError):
+            filtered_action.fn(value="b", info=_info(token))
+
+    def test_filter_unlimited(self):
+        @action
+        def unlimited_rate_resolver(value: str) -> str:
+            return value
+
+        action_ = get_action(unlimited_rate_resolver)
+        filtered_action, _ = RateLimitingHandlerFilter().filter(
+            action_, SchemaFactory()
+        )
+        self.assertIs(action_, filtered_action)
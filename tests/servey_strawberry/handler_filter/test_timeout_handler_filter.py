@@ -0,0 +1,34 @@
+import asyncio
+from unittest import TestCase
+
+from servey.action.action import action, get_action
+from servey.executor.timeout import ActionTimeoutError
+from servey.servey_strawberry.handler_filter.timeout_handler_filter import (
+    TimeoutHandlerFilter,
+)
+from servey.servey_strawberry.schema_factory import SchemaFactory
+
+
+class TestTimeoutHandlerFilter(TestCase):
+    def test_filter_async(self):
+        @action(timeout=0.01)
+        async def slow(value: str) -> str:
+            await asyncio.sleep(5)
+            return value
+
+        filtered_action, continue_filtering = TimeoutHandlerFilter().filter(
+            get_action(slow), SchemaFactory()
+        )
+        self.assertTrue(continue_filtering)
+        loop = asyncio.get_event_loop()
+        with self.assertRaises(ActionTimeoutError):
+            loop.run_until_complete(filtered_action.fn(value="a"))
+
+    def test_filter_sync(self):
+        @action
+        def fast(value: str) -> str:
+            return value
+
+        action_ = get_action(fast)
+        filtered_action, _ = TimeoutHandlerFilter().filter(action_, SchemaFactory())
+        self.assertIs(action_, filtered_action)
@@ -0,0 +1,63 @@
+import asyncio
+from types import SimpleNamespace
+from typing import List
+from unittest import TestCase
+
+from servey.action.batch_invoker import BatchInvoker
+from servey.security.authorization import Authorization
+from servey.servey_strawberry.batch_loader import BatchLoader
+from servey.util.lru_cache import LruCache
+
+
+class TestBatchLoader(TestCase):
+    def test_shared_cache(self):
+        batches = []
+
+        async def double_all(values: List[int]) -> List[int]:
+            batches.append(values)
+            return [v * 2 for v in values]
+
+        cache = LruCache(max_size=10)
+        loader = BatchLoader("double_all", BatchInvoker(double_all), 10, cache)
+        loop = asyncio.get_event_loop()
+
+        def load(context, *values):
+            info = SimpleNamespace(context=context)
+            data_loader = loader.get_data_loader(info)
+            return loop.run_until_complete(data_loader.load_many(list(values)))
+
+        self.assertEqual([2, 4], load({}, 1, 2))
+        self.assertEqual([4, 6], load({}, 2, 3))
+        self.assertEqual([[1, 2], [3]], batches)
+        self.assertEqual((1, 3), (cache.stats.hits, cache.stats.misses))
+        self.assertEqual(3, cache.size)
+
+        # Results are not shared between different authorizations
+        authorization = Authorization("user_1", frozenset(), None, None)
+        self.assertEqual([2], load(dict(authorization=authorization), 1))
+        self.assertEqual([[1, 2], [3], [1]], batches)
+
+    def test_shared_cache_expiry(self):
+        async def double_all(values: List[int]) -> List[int]:
+            return [v * 2 for v in values]
+
+        cache = LruCache(max_size=10)
+        loader = BatchLoader("double_all", BatchInvoker(double_all), 10, cache)
+        loop = asyncio.get_event_loop()
+        cache.put(("double_all", None, 1), (2,), expire_at=1)
+        self.assertEqual(1, len(cache))
+        # Expired entries are swept on the first load after the ttl has passed
+        loader.last_sweep = 0
+        loop.run_until_complete(loader.load_with_shared_cache(None, [3]))
+        self.assertEqual(1, len(cache))
+        self.assertEqual((6,), cache.get(("double_all", None, 3)))
+
+    def test_no_context(self):
+        def double_all(values: List[int]) -> List[int]:
+            return [v * 2 for v in values]
+
+        loader = BatchLoader("double_all", BatchInvoker(double_all), shared_cache=None)
+        info = SimpleNamespace(context=None)
+        loop = asyncio.get_event_loop()
+        result = loop.run_until_complete(loader.get_data_loader(info).load(4))
+        self.assertEqual(8, result)
@@ -0,0 +1,118 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import List, ForwardRef
+from unittest import TestCase
+
+from servey.action.action import action, get_action
+from servey.action.batch_invoker import BatchInvoker
+from servey.servey_strawberry.query_limits import QueryLimits
+from servey.servey_strawberry.schema_factory import create_schema_factory
+from servey.trigger.web_trigger import WEB_GET
+
+
+async def _count_all(names: List[str]) -> List[int]:
+    return [len(n) for n in names]
+
+
+@dataclass
+class Folder:
+    name: str
+
+    @action
+    def children(self) -> List[ForwardRef(f"{__name__}.Folder")]:
+        return [Folder(f"{self.name}/{i}") for i in range(2)]
+
+    @action(batch_invoker=BatchInvoker(fn=_count_all, arg_extractor=lambda f: [f.name]))
+    async def name_length(self) -> int:
+        return len(self.name)
+
+
+@action(triggers=(WEB_GET,))
+def get_folder(name: str) -> Folder:
+    return Folder(name)
+
+
+def execute(query_limits: QueryLimits, query: str):
+    schema_factory = create_schema_factory()
+    schema_factory.query_limits = query_limits
+    schema_factory.create_field_for_action(get_action(get_folder), WEB_GET)
+    schema = schema_factory.create_schema()
+    return asyncio.get_event_loop().run_until_complete(schema.execute(query))
+
+
+class TestQueryLimits(TestCase):
+    def test_within_limits(self):
+        result = execute(
+            QueryLimits(max_depth=4, max_aliases=1, max_cost=120),
+            'query{ a: getFolder(name: "r") { children { children { name } } } }',
+        )
+        self.assertIsNone(result.errors)
+        self.assertEqual(2, len(result.data["a"]["children"]))
+
+    def test_max_depth(self):
+        result = execute(
+            QueryLimits(max_depth=2),
+            'query{ getFolder(name: "r") { children { children { name } } } }',
+        )
+        self.assertIsNone(result.data)
+        self.assertEqual("max_depth_exceeded:3", result.errors[0].message)
+
+    def test_max_aliases(self):
+        result = execute(
+            QueryLimits(max_aliases=1),
+            'query{ a: getFolder(name: "a") { name } b: getFolder(name: "b") { name } }',
+        )
+        self.assertEqual("max_aliases_exceeded:2", result.errors[0].message)
+
+    def test_max_cost(self):
+        # 10 for getFolder, 10 for children, and 10 * 10 for the children of each child
+        query = 'query{ getFolder(name: "r") { children { children { name } } } }'
+        self.assertIsNone(execute(QueryLimits(max_cost=120), query).errors)
+        result = execute(QueryLimits(max_cost=119), query)
+        self.assertEqual("max_cost_exceeded:120", result.errors[0].message)
+
+    def test_batch_cost(self):
+        # Batch invoked fields are cheaper: 10 for getFolder, 10 for children and 10 * 1 for name lengths
+        query = """
+query{
+  getFolder(name: "r") { ...folderFields }
+}
+fragment folderFields on Folder {
+  children { nameLength }
+}
+        """
+        self.assertIsNone(execute(QueryLimits(max_cost=30), query).errors)
+        result = execute(QueryLimits(max_cost=29), query)
+        self.assertEqual("max_cost_exceeded:30", result.errors[0].message)
+
+    def test_repeated_fragment_spreads(self):
+        # Each fragment spreads the next 12 times - walking every spread would visit 12^8 selections
+        fragments = [
+            f"fragment f{i} on Folder {{ name {' '.join([f'...f{i + 1}'] * 12)} }}"
+            for i in range(7)
+        ]
+        fragments.append("fragment f7 on Folder { name }")
+        query = 'query{ getFolder(name: "r") { ...f0 } } ' + " ".join(fragments)
+        start = time.time()
+        result = execute(QueryLimits(), query)
+        self.assertLess(time.time() - start, 5)
+        self.assertIsNone(result.errors)
+        self.assertEqual({"getFolder": {"name": "r"}}, result.data)
+
+        # Nested within lists, the same pattern is rejected on cost without walking every spread
+        fragments = [
+            f"fragment f{i} on Folder {{ children {{ {' '.join([f'...f{i + 1}'] * 12)} }} }}"
+            for i in range(7)
+        ]
+        fragments.append("fragment f7 on Folder { nameLength }")
+        query = 'query{ getFolder(name: "r") { ...f0 } } ' + " ".join(fragments)
+        start = time.time()
+        result = execute(QueryLimits(), query)
+        self.assertLess(time.time() - start, 5)
+        self.assertIsNone(result.data)
+        self.assertTrue(result.errors[0].message.startswith("max_cost_exceeded:"))
+
+    def test_introspection(self):
+        query = "query{ __schema { types { fields { type { ofType { name } } } } } }"
+        self.assertIsNone(execute(QueryLimits(max_depth=1), query).errors)
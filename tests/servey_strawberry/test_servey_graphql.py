@@ -0,0 +1,188 @@
+import asyncio
+import json
+from typing import Optional
+from unittest import TestCase
+from unittest.mock import patch
+from urllib.parse import urlencode
+
+from starlette.responses import Response
+
+from servey.action.action import action, get_action
+from servey.cache_control.secure_hash_cache_control import SecureHashCacheControl
+from servey.cache_control.ttl_cache_control import TtlCacheControl
+from servey.finder.action_finder_abc import ActionRegistry
+from servey.servey_strawberry.document_cache import get_query_hash
+from servey.servey_strawberry.strawberry_starlette_route_factory import (
+    StrawberryStarletteRouteFactory,
+)
+from servey.servey_strawberry.servey_graphql import ServeyGraphQL
+from servey.trigger.web_trigger import WEB_GET
+from servey.util.lru_cache import LruCache
+from tests.servey_starlette.action_endpoint.test_action_endpoint import build_request
+
+
+@action(triggers=(WEB_GET,))
+def greet(name: str) -> str:
+    return f"Hello {name}"
+
+
+@action(
+    triggers=(WEB_GET,),
+    cache_control=TtlCacheControl(30, SecureHashCacheControl(private=False)),
+)
+def cached_greet(name: str) -> str:
+    cached_greet.invocations += 1
+    return f"Hi {name}"
+
+
+cached_greet.invocations = 0
+
+
+@action(triggers=(WEB_GET,), cache_control=TtlCacheControl(60))
+def private_greet(name: str) -> str:
+    return f"Hey {name}"
+
+
+QUERY = 'query{ greet(name: "World") }'
+CACHED_QUERY = 'query{ cachedGreet(name: "World") privateGreet(name: "World") }'
+
+
+def create_app(factory: StrawberryStarletteRouteFactory) -> ServeyGraphQL:
+    actions = (get_action(greet), get_action(cached_greet), get_action(private_greet))
+    with patch(
+        "servey.finder.action_finder_abc.get_action_registry",
+        return_value=ActionRegistry(actions),
+    ):
+        routes = list(factory.create_routes())
+    return routes[0].endpoint
+
+
+def post(app: ServeyGraphQL, body: dict) -> dict:
+    request = build_request(
+        method="POST",
+        headers={"Content-Type": "application/json"},
+        body=json.dumps(body),
+    )
+    response = asyncio.get_event_loop().run_until_complete(app.run(request))
+    return json.loads(response.body)
+
+
+def get(app: ServeyGraphQL, params: dict, headers: Optional[dict] = None) -> dict:
+    return json.loads(get_response(app, params, headers).body)
+
+
+def get_response(
+    app: ServeyGraphQL, params: dict, headers: Optional[dict] = None
+) -> Response:
+    request = build_request(query_string=urlencode(params), headers=headers)
+    return asyncio.get_event_loop().run_until_complete(app.run(request))
+
+
+class TestServeyGraphQL(TestCase):
+    def test_document_cache(self):
+        factory = StrawberryStarletteRouteFactory(debug=False)
+        app = create_app(factory)
+        for _ in range(3):
+            self.assertEqual(
+                {"data": {"greet": "Hello World"}}, post(app, dict(query=QUERY))
+            )
+        cache = factory.document_cache
+        self.assertEqual(1, len(cache))
+        self.assertEqual((2, 1), (cache.stats.hits, cache.stats.misses))
+
+    def test_document_cache_invalid(self):
+        factory = StrawberryStarletteRouteFactory(debug=False)
+        app = create_app(factory)
+        for _ in range(2):
+            result = post(app, dict(query="query{ missing }"))
+            self.assertEqual(1, len(result["errors"]))
+        self.assertEqual(1, factory.document_cache.stats.hits)
+
+    def test_persisted_query(self):
+        factory = StrawberryStarletteRouteFactory(debug=False)
+        app = create_app(factory)
+        extensions = dict(
+            persistedQuery=dict(version=1, sha256Hash=get_query_hash(QUERY))
+        )
+        error = post(app, dict(extensions=extensions))["errors"][0]
+        self.assertEqual("PersistedQueryNotFound", error["message"])
+        self.assertEqual("PERSISTED_QUERY_NOT_FOUND", error["extensions"]["code"])
+
+        result = post(app, dict(query=QUERY, extensions=extensions))
+        self.assertEqual({"data": {"greet": "Hello World"}}, result)
+
+        result = post(app, dict(extensions=extensions))
+        self.assertEqual({"data": {"greet": "Hello World"}}, result)
+
+        # Clients accepting any content type get the result rather than graphiql
+        result = get(
+            app, dict(extensions=json.dumps(extensions)), headers={"Accept": "*/*"}
+        )
+        self.assertEqual({"data": {"greet": "Hello World"}}, result)
+
+    def test_persisted_query_hash_mismatch(self):
+        app = create_app(StrawberryStarletteRouteFactory(debug=False))
+        extensions = dict(persistedQuery=dict(version=1, sha256Hash="not_a_hash"))
+        error = post(app, dict(query=QUERY, extensions=extensions))["errors"][0]
+        self.assertEqual("provided sha does not match query", error["message"])
+
+    def test_get(self):
+        app = create_app(StrawberryStarletteRouteFactory(debug=False))
+        result = get(app, dict(query=QUERY))
+        self.assertEqual({"data": {"greet": "Hello World"}}, result)
+
+    def test_get_cache_headers(self):
+        app = create_app(StrawberryStarletteRouteFactory(debug=False))
+        response = get_response(app, dict(query=CACHED_QUERY))
+        self.assertEqual(
+            {"data": {"cachedGreet": "Hi World", "privateGreet": "Hey World"}},
+            json.loads(response.body),
+        )
+        etag = response.headers["ETag"]
+        # Any private field makes the whole response private
+        self.assertTrue(response.headers["Cache-Control"].startswith("private,"))
+        response = get_response(
+            app, dict(query=CACHED_QUERY), headers={"If-None-Match": etag}
+        )
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(etag, response.headers["ETag"])
+
+    def test_get_uncacheable(self):
+        app = create_app(StrawberryStarletteRouteFactory(debug=False))
+        query = 'query{ cachedGreet(name: "World") greet(name: "World") }'
+        response = get_response(app, dict(query=query))
+        self.assertEqual(200, response.status_code)
+        self.assertNotIn("ETag", response.headers)
+        response = get_response(app, dict(query="query{ missing }"))
+        self.assertNotIn("ETag", response.headers)
+
+    def test_post_not_cacheable(self):
+        app = create_app(StrawberryStarletteRouteFactory(debug=False))
+        request = build_request(
+            method="POST",
+            headers={"Content-Type": "application/json"},
+            body=json.dumps(dict(query=CACHED_QUERY)),
+        )
+        response = asyncio.get_event_loop().run_until_complete(app.run(request))
+        self.assertNotIn("ETag", response.headers)
+
+    def test_response_cache(self):
+        factory = StrawberryStarletteRouteFactory(
+            debug=False, response_cache=LruCache(max_size=1024 * 1024)
+        )
+        app = create_app(factory)
+        query = 'query{ cachedGreet(name: "Cache") }'
+        extensions = dict(
+            persistedQuery=dict(version=1, sha256Hash=get_query_hash(query))
+        )
+        invocations = cached_greet.invocations
+        expected = {"data": {"cachedGreet": "Hi Cache"}}
+        self.assertEqual(expected, post(app, dict(query=query, extensions=extensions)))
+        self.assertEqual(expected, post(app, dict(extensions=extensions)))
+        response = get_response(
+            app, dict(extensions=json.dumps(extensions)), headers={"Accept": "*/*"}
+        )
+        self.assertEqual(expected, json.loads(response.body))
+        self.assertEqual("public,max-age=", response.headers["Cache-Control"][:15])
+        self.assertEqual(invocations + 1, cached_greet.invocations)
+        self.assertEqual(2, factory.response_cache.stats.hits)
@@ -2,6 +2,7 @@ import os
 from unittest import TestCase
 from unittest.mock import patch
 
+from servey.finder.action_finder_abc import ActionRegistry
 from servey.servey_strawberry.strawberry_starlette_route_factory import (
     StrawberryStarletteRouteFactory,
 )
@@ -30,7 +31,10 @@ class TestStrawberryStarletteRouteFactory(TestCase):
             self.assertEqual(2, len(routes))
 
     def test_create_no_routes(self):
-        with patch("servey.finder.action_finder_abc.find_actions", return_value=[]):
+        with patch(
+            "servey.finder.action_finder_abc.get_action_registry",
+            return_value=ActionRegistry(()),
+        ):
             factory = StrawberryStarletteRouteFactory()
             routes = list(factory.create_routes())
             self.assertEqual([], routes)
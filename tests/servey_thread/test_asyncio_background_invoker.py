@@ -1,10 +1,12 @@
 import asyncio
 import os
+import threading
 from asyncio import sleep
 from unittest import TestCase
 from unittest.mock import patch
 
 from servey.action.action import action, get_action
+from servey.executor.thread_pool_executor import BoundedThreadPoolExecutor
 from servey.servey_thread.asyncio_background_invoker import (
     AsyncioBackgroundInvokerFactory,
 )
@@ -28,3 +30,21 @@ class TestAsyncioBackgroundInvoker(TestCase):
 
         loop.run_until_complete(sleep(1.1))
         self.assertEqual(15, total)
+
+    def test_invoker_sync_uses_action_executor(self):
+        executor = BoundedThreadPoolExecutor(max_workers=1, thread_name_prefix="bg")
+        thread_names = []
+
+        @action(executor=executor)
+        def record_thread(value: int):
+            thread_names.append(threading.current_thread().name)
+
+        invoker = AsyncioBackgroundInvokerFactory().create(
+            get_action(record_thread), "record_thread"
+        )
+        invoker.invoke(1)
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(sleep(0.1))
+        executor.shutdown()
+        self.assertEqual(1, len(thread_names))
+        self.assertTrue(thread_names[0].startswith("bg"))
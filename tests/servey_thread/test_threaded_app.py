@@ -3,6 +3,7 @@ from unittest import TestCase
 from unittest.mock import patch
 
 from servey.action.action import get_action, action
+from servey.finder.action_finder_abc import ActionRegistry
 from servey.servey_thread.fixed_rate_trigger_thread import FixedRateTriggerThread
 from servey.trigger.fixed_rate_trigger import FixedRateTrigger
 
@@ -13,8 +14,8 @@ class TestThreadedApp(TestCase):
         print_time_action = get_action(print_time)
         with (
             patch(
-                "servey.finder.action_finder_abc.find_actions",
-                return_value=[print_time_action],
+                "servey.finder.action_finder_abc.get_action_registry",
+                return_value=ActionRegistry((print_time_action,)),
             ),
             patch(
                 "servey.servey_thread.fixed_rate_trigger_thread.FixedRateTriggerThread.start",
@@ -37,6 +38,31 @@ class TestThreadedApp(TestCase):
             with self.assertRaises(AssertionError):
                 thread.run()
 
+    def test_skip_tick_while_in_progress(self):
+        calls = []
+        ticks = []
+
+        def do_not_sleep(_: int):
+            ticks.append(1)
+            if len(ticks) > 3:
+                raise StopIteration()
+
+        thread = FixedRateTriggerThread(
+            lambda: calls.append(1), FixedRateTrigger(1), False
+        )
+        thread.in_progress.set()  # Simulate a previous run which was abandoned
+        with patch("time.sleep", do_not_sleep):
+            with self.assertRaises(StopIteration):
+                thread.run()
+        self.assertEqual([], calls)
+        thread.in_progress.clear()
+        ticks.clear()
+        with patch("time.sleep", do_not_sleep):
+            with self.assertRaises(StopIteration):
+                thread.run()
+        self.assertEqual([1, 1, 1], calls)
+        self.assertFalse(thread.in_progress.is_set())
+
 
 # noinspection PyTypeChecker
 @action(triggers=(FixedRateTrigger(10),))
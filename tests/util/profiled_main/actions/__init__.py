@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from servey.action.action import action
+from servey.trigger.web_trigger import WEB_GET
+
+
+@dataclass
+class Counter:
+    value: int
+
+    @action
+    def doubled(self) -> int:
+        return self.value * 2
+
+
+@action(triggers=(WEB_GET,))
+def get_counter(value: int) -> Counter:
+    return Counter(value)
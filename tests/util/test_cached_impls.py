@@ -0,0 +1,42 @@
+from abc import ABC
+from unittest import TestCase
+
+from injecty import get_default_injecty_context, get_impls
+
+from servey.servey_starlette.route_factory.route_factory_abc import RouteFactoryABC
+from servey.util.cached_impls import get_cached_impls, clear_cached_impls
+
+
+class BaseForTest(ABC):
+    priority: int = 100
+
+
+class ImplForTest(BaseForTest):
+    priority = 50
+
+
+class OtherImplForTest(BaseForTest):
+    priority = 150
+
+
+class TestCachedImpls(TestCase):
+    def test_get_cached_impls(self):
+        impls = get_cached_impls(RouteFactoryABC)
+        self.assertEqual(tuple(get_impls(RouteFactoryABC)), impls)
+        self.assertIs(impls, get_cached_impls(RouteFactoryABC))
+        clear_cached_impls()
+        self.assertEqual(impls, get_cached_impls(RouteFactoryABC))
+
+    def test_get_cached_impls_registration_changed(self):
+        context = get_default_injecty_context()
+        self.assertEqual(tuple(), get_cached_impls(BaseForTest))
+        context.register_impl(BaseForTest, ImplForTest)
+        try:
+            self.assertEqual((ImplForTest,), get_cached_impls(BaseForTest))
+            context.register_impl(BaseForTest, OtherImplForTest)
+            self.assertEqual(
+                (OtherImplForTest, ImplForTest), get_cached_impls(BaseForTest)
+            )
+        finally:
+            context.impls.pop(BaseForTest, None)
+        self.assertEqual(tuple(), get_cached_impls(BaseForTest))
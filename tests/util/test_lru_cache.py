@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from servey.util.lru_cache import LruCache
+
+
+class TestLruCache(TestCase):
+    def test_get_put(self):
+        cache = LruCache(max_size=2)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(1, cache.get("a"))
+        cache.put("c", 3)  # Evicts b, since a was used more recently
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(3, cache.get("c"))
+        self.assertEqual(
+            (3, 2, 1), (cache.stats.hits, cache.stats.misses, cache.stats.evictions)
+        )
+        self.assertEqual(2, len(cache))
+
+    def test_sizer(self):
+        cache = LruCache(max_size=10, sizer=len)
+        self.assertTrue(cache.put("a", b"12345"))
+        self.assertTrue(cache.put("b", b"1234"))
+        self.assertEqual(9, cache.size)
+        self.assertFalse(cache.put("c", b"12345678901"))
+        cache.put("c", b"12")
+        self.assertEqual(6, cache.size)
+        self.assertIsNone(cache.get("a"))
+        cache.put("b", b"1")
+        self.assertEqual(3, cache.size)
+        cache.invalidate("b")
+        self.assertEqual(2, cache.size)
+        cache.clear()
+        self.assertEqual(0, cache.size)
+
+    def test_expiry(self):
+        cache = LruCache()
+        cache.put("a", 1, expire_at=100)
+        self.assertEqual(1, cache.get("a", now=99))
+        self.assertIsNone(cache.get("a", now=100))
+        self.assertEqual(0, cache.size)
+
+    def test_remove_expired(self):
+        cache = LruCache()
+        cache.put("a", 1, expire_at=100)
+        cache.put("b", 2, expire_at=200)
+        cache.put("c", 3)
+        self.assertEqual(1, cache.remove_expired(now=150))
+        self.assertEqual(2, len(cache))
+        self.assertEqual(2, cache.size)
+        self.assertEqual(2, cache.get("b", now=150))
+        self.assertEqual(3, cache.get("c", now=1000))
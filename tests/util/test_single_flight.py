@@ -0,0 +1,78 @@
+import asyncio
+from threading import Event, Thread
+from unittest import TestCase
+
+from servey.util.single_flight import SingleFlight
+
+
+class TestSingleFlight(TestCase):
+    def test_run_async(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        async def run():
+            return await asyncio.gather(
+                *[single_flight.run_async("a", fn) for _ in range(5)],
+                single_flight.run_async("b", fn),
+            )
+
+        results = asyncio.get_event_loop().run_until_complete(run())
+        self.assertEqual(2, len(calls))
+        self.assertEqual(results[0], results[4])
+        self.assertEqual(2, single_flight.executions)
+        self.assertEqual(4, single_flight.coalesced)
+        # Nothing retained after completion
+        self.assertEqual(
+            3,
+            asyncio.get_event_loop().run_until_complete(
+                single_flight.run_async("a", fn)
+            ),
+        )
+
+    def test_run_async_error(self):
+        single_flight = SingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def run():
+            return await asyncio.gather(
+                single_flight.run_async("a", fn),
+                single_flight.run_async("a", fn),
+                return_exceptions=True,
+            )
+
+        results = asyncio.get_event_loop().run_until_complete(run())
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(1, single_flight.executions)
+
+    def test_run(self):
+        single_flight = SingleFlight()
+        started = Event()
+        release = Event()
+        results = []
+
+        def fn():
+            started.set()
+            release.wait(5)
+            return "result"
+
+        leader = Thread(target=lambda: results.append(single_flight.run("a", fn)))
+        leader.start()
+        started.wait(5)
+        follower = Thread(target=lambda: results.append(single_flight.run("a", fn)))
+        follower.start()
+        while not single_flight.coalesced:
+            pass
+        release.set()
+        leader.join()
+        follower.join()
+        self.assertEqual(["result", "result"], results)
+        self.assertEqual(1, single_flight.executions)
+        self.assertEqual(1, single_flight.coalesced)
@@ -0,0 +1,53 @@
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+from servey.util.startup_profiler import StartupProfiler
+
+
+class TestStartupProfiler(TestCase):
+    def test_profile(self):
+        with patch.dict(os.environ, {"SERVEY_MAIN": "tests.finder"}):
+            profiler = StartupProfiler()
+            profiler.profile()
+        entries = {(e.phase, e.name) for e in profiler.entries}
+        self.assertIn(("discovery", "actions"), entries)
+        self.assertIn(("route_factory", "ActionRouteFactory"), entries)
+        self.assertIn(("action_endpoint", "marco"), entries)
+        self.assertIn(("event_handler", "marco"), entries)
+        self.assertTrue(all(e.wall_time >= 0 for e in profiler.entries))
+
+        totals = {e.phase: e for e in profiler.get_phase_totals()}
+        self.assertNotIn("action_endpoint", totals)
+        route_factory_time = sum(
+            e.wall_time for e in profiler.entries if e.phase == "route_factory"
+        )
+        self.assertAlmostEqual(route_factory_time, totals["route_factory"].wall_time)
+
+        json_ = profiler.to_json()
+        self.assertEqual(len(profiler.entries), len(json_["entries"]))
+        self.assertEqual(
+            {"phase", "name", "wall_time_ms", "allocated_bytes", "error"},
+            set(json_["entries"][0]),
+        )
+        table = profiler.to_table().split("\n")
+        self.assertEqual(["phase", "name", "ms", "KiB", "error"], table[0].split())
+        self.assertEqual(1 + len(profiler.entries) + len(totals), len(table))
+
+    def test_profile_dataclass_method_action(self):
+        with patch.dict(os.environ, {"SERVEY_MAIN": "tests.util.profiled_main"}):
+            profiler = StartupProfiler()
+            profiler.profile_event_handlers()
+        entries = {e.name: e for e in profiler.entries if e.phase == "event_handler"}
+        self.assertEqual({"get_counter", "doubled"}, set(entries))
+        self.assertTrue(all(e.error is None for e in entries.values()))
+
+    def test_profile_reports_errors(self):
+        profiler = StartupProfiler()
+        with profiler.measure("event_handler", "broken", catch_errors=True):
+            raise ValueError("broken_action")
+        self.assertEqual("broken_action", profiler.entries[0].error)
+        self.assertIn("broken_action", profiler.to_table())
+        with self.assertRaises(ValueError):
+            with profiler.measure("event_handler", "broken"):
+                raise ValueError("broken_action")
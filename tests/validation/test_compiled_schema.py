@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+from unittest import TestCase
+
+from jsonschema import ValidationError
+from schemey import get_default_schema_context, Schema
+
+from servey.action.util import get_schema_for_params
+from servey.validation.compiled_schema import compile_schema, CompiledSchema
+
+
+@dataclass
+class Node:
+    name: str
+    created_at: datetime
+    children: Optional[List["Node"]] = None
+
+
+def create_node(node: Node, limit: int = 10, tags: Optional[List[str]] = None) -> Node:
+    """Dummy function for generating a parameter schema"""
+
+
+class TestCompiledSchema(TestCase):
+    def test_params_schema(self):
+        schema = get_schema_for_params(create_node, set())
+        compiled = compile_schema(schema)
+        self.assertIsInstance(compiled, CompiledSchema)
+        self.assertEqual(schema.schema, compiled.schema)
+        valid = dict(
+            node=dict(
+                name="root",
+                created_at="2023-01-01T00:00:00+00:00",
+                children=[dict(name="child", created_at="2023-01-02T00:00:00+00:00")],
+            ),
+            tags=["a", "b"],
+        )
+        compiled.validate(valid)
+        invalid = [
+            dict(limit=10),
+            dict(node=dict(name="root")),
+            dict(node=dict(name=1, created_at="2023-01-01T00:00:00+00:00")),
+            dict(node=dict(name="root", created_at="not-a-date")),
+            dict(node=valid["node"], limit="ten"),
+            dict(node=valid["node"], limit=True),
+            dict(node=valid["node"], tags=[1]),
+            dict(
+                node=dict(
+                    name="root",
+                    created_at="2023-01-01T00:00:00+00:00",
+                    children=[dict(name="child", created_at="yesterday")],
+                )
+            ),
+        ]
+        for item in invalid:
+            interpreted_errors = list(schema.iter_errors(item))
+            compiled_errors = list(compiled.iter_errors(item))
+            self.assertTrue(interpreted_errors)
+            self.assertEqual(1, len(compiled_errors))
+            with self.assertRaises(ValidationError):
+                compiled.validate(item)
+
+    def test_error_path(self):
+        schema = get_schema_for_params(create_node, set())
+        compiled = compile_schema(schema)
+        item = dict(
+            node=dict(
+                name="root",
+                created_at="2023-01-01T00:00:00+00:00",
+                children=[dict(name=1, created_at="2023-01-02T00:00:00+00:00")],
+            ),
+        )
+        error = next(compiled.iter_errors(item))
+        self.assertEqual(["node", "children"], list(error.path))
+        self.assertEqual(list(next(schema.iter_errors(item)).path), list(error.path))
+        error = next(compiled.iter_errors(dict(node=item["node"]["children"][0])))
+        self.assertEqual(["node", "name"], list(error.path))
+        self.assertEqual("1 is not of type 'string'", error.message)
+
+    def test_compile_schema_is_cached(self):
+        schema_a = get_schema_for_params(create_node, set())
+        schema_b = get_schema_for_params(create_node, set())
+        compiled = compile_schema(schema_a)
+        self.assertIs(compiled, compile_schema(schema_b))
+        self.assertIs(compiled, compile_schema(compiled))
+        self.assertIsNone(compile_schema(None))
+
+    def test_keywords(self):
+        schema = Schema(
+            {
+                "type": "object",
+                "properties": {
+                    "code": {"type": "string", "pattern": "^[A-Z]+$", "maxLength": 4},
+                    "size": {"type": "integer", "minimum": 1, "exclusiveMaximum": 10},
+                    "kind": {"enum": ["a", "b"]},
+                    "flag": {"const": True},
+                    "items": {"type": "array", "minItems": 1, "maxItems": 2},
+                },
+                "additionalProperties": False,
+            },
+            dict,
+        )
+        compiled = compile_schema(schema)
+        compiled.validate(dict(code="AB", size=9, kind="a", flag=True, items=[1]))
+        invalid = [
+            dict(code="ab"),
+            dict(code="ABCDE"),
+            dict(size=0),
+            dict(size=10),
+            dict(kind="c"),
+            dict(flag=1),
+            dict(items=[]),
+            dict(items=[1, 2, 3]),
+            dict(unexpected=1),
+        ]
+        for item in invalid:
+            self.assertTrue(list(schema.iter_errors(item)))
+            self.assertTrue(list(compiled.iter_errors(item)))
+
+    def test_unsupported_keyword_falls_back(self):
+        schema = Schema({"type": "object", "dependentRequired": {"a": ["b"]}}, dict)
+        compiled = compile_schema(schema)
+        compiled.validate(dict(a=1, b=2))
+        self.assertTrue(list(compiled.iter_errors(dict(a=1))))
+
+    def test_schemey_context_schema(self):
+        schema = get_default_schema_context().schema_from_type(List[Node])
+        compiled = compile_schema(schema)
+        compiled.validate([dict(name="a", created_at="2023-01-01T00:00:00+00:00")])
+        self.assertTrue(list(compiled.iter_errors([dict(name="a")])))
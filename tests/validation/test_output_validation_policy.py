@@ -0,0 +1,89 @@
+import asyncio
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+from jsonschema import ValidationError
+from schemey import schema_from_type
+
+from servey.action.action import action, get_action
+from servey.servey_starlette.action_endpoint.factory.action_endpoint_factory import (
+    ActionEndpointFactory,
+)
+from servey.trigger.web_trigger import WEB_GET
+from servey.validation.compiled_schema import compile_schema
+from servey.validation.first_output_validation_policy import (
+    FirstOutputValidationPolicy,
+)
+from servey.validation.fixed_output_validation_policy import (
+    FixedOutputValidationPolicy,
+)
+from servey.validation.output_validation_policy_factory import (
+    output_validation_policy_from_str,
+)
+from servey.validation.sampled_output_validation_policy import (
+    SampledOutputValidationPolicy,
+)
+from tests.servey_starlette.action_endpoint.test_action_endpoint import (
+    build_request,
+)
+
+INT_SCHEMA = compile_schema(schema_from_type(int))
+
+
+class TestOutputValidationPolicy(TestCase):
+    def test_fixed(self):
+        policy = FixedOutputValidationPolicy()
+        self.assertIsNone(policy.check("foo", INT_SCHEMA, 1))
+        self.assertIsInstance(policy.check("foo", INT_SCHEMA, "1"), ValidationError)
+        self.assertIsNone(policy.check("foo", None, "1"))
+        self.assertEqual({"foo": 2}, policy.stats.validated)
+        self.assertEqual({"foo": 1}, policy.stats.violations)
+        policy = FixedOutputValidationPolicy(False)
+        self.assertIsNone(policy.check("foo", INT_SCHEMA, "1"))
+        self.assertEqual({"foo": 1}, policy.stats.skipped)
+        self.assertEqual({}, policy.stats.violations)
+
+    def test_first(self):
+        policy = FirstOutputValidationPolicy(2)
+        for _ in range(5):
+            policy.check("foo", INT_SCHEMA, "1")
+        policy.check("bar", INT_SCHEMA, "1")
+        self.assertEqual({"foo": 2, "bar": 1}, policy.stats.validated)
+        self.assertEqual({"foo": 3}, policy.stats.skipped)
+        self.assertEqual({"foo": 2, "bar": 1}, policy.stats.violations)
+
+    def test_sampled(self):
+        policy = SampledOutputValidationPolicy(0.5)
+        with patch("random.random", side_effect=[0.1, 0.9, 0.4, 0.6]):
+            for _ in range(4):
+                # Violations are reported rather than failing the request
+                self.assertIsNone(policy.check("foo", INT_SCHEMA, "1"))
+        self.assertEqual({"foo": 2}, policy.stats.validated)
+        self.assertEqual({"foo": 2}, policy.stats.skipped)
+        self.assertEqual({"foo": 2}, policy.stats.violations)
+
+    def test_from_str(self):
+        self.assertTrue(output_validation_policy_from_str("always").validate)
+        self.assertFalse(output_validation_policy_from_str("never").validate)
+        self.assertEqual(0.05, output_validation_policy_from_str("sample:0.05").rate)
+        self.assertEqual(10, output_validation_policy_from_str("first:10").count)
+        with patch.dict(os.environ, {"SERVER_DEBUG": "0"}):
+            self.assertFalse(output_validation_policy_from_str("debug").validate)
+        with self.assertRaises(ValueError):
+            output_validation_policy_from_str("sometimes")
+
+    def test_action_endpoint(self):
+        @action(triggers=(WEB_GET,))
+        def echo_get() -> int:
+            # noinspection PyTypeChecker
+            return "foobar"
+
+        policy = FixedOutputValidationPolicy(fail_on_violation=False)
+        action_endpoint = ActionEndpointFactory(output_validation_policy=policy).create(
+            get_action(echo_get), set(), []
+        )
+        loop = asyncio.get_event_loop()
+        response = loop.run_until_complete(action_endpoint.execute(build_request()))
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"echo_get": 1}, policy.stats.violations)